@@ -1,8 +1,7 @@
 """Email generation schemas."""
 from enum import Enum
-from typing import Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class EmailTone(str, Enum):
@@ -14,16 +13,18 @@ class EmailTone(str, Enum):
 
 class EmailGenerationResponse(BaseModel):
     """Response containing generated email variants."""
+    model_config = ConfigDict(frozen=True)
+
     target_investor: str = Field(..., description="Investor name and company")
     intro_via: str = Field(..., description="Mutual connection name")
     match_score: float = Field(..., description="Overall match score (0-100)")
-    emails: Dict[EmailTone, str] = Field(..., description="Generated email drafts keyed by tone")
+    emails: dict[EmailTone, str] = Field(..., description="Generated email drafts keyed by tone")
 
 
 class EmailGenerationRequest(BaseModel):
     """Request body for email generation."""
-    source_id: Optional[int] = Field(1, description="Founder ID (default: 1)")
-    tones: Optional[List[EmailTone]] = Field(
+    source_id: int | None = Field(1, description="Founder ID (default: 1)")
+    tones: list[EmailTone] | None = Field(
         default=[EmailTone.FORMAL, EmailTone.CASUAL, EmailTone.ENTHUSIASTIC],
         description="List of tones to generate"
     )
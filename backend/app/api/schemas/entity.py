@@ -1,28 +1,27 @@
 """Entity-related schemas."""
-from typing import List, Optional
-
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class EntityResponse(BaseModel):
     """Response schema for a single entity."""
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
     id: int
     name: str
-    email: Optional[str] = None
-    company: Optional[str] = None
-    position: Optional[str] = None
-    role: Optional[str] = None
-    sector_focus: Optional[List[str]] = None
-    stage_focus: Optional[List[str]] = None
-    location: Optional[str] = None
-    linkedin_url: Optional[str] = None
-
-    class Config:
-        from_attributes = True
+    email: str | None = None
+    company: str | None = None
+    position: str | None = None
+    role: str | None = None
+    sector_focus: list[str] | None = None
+    stage_focus: list[str] | None = None
+    location: str | None = None
+    linkedin_url: str | None = None
 
 
 class EntityListResponse(BaseModel):
     """Response schema for list of entities."""
+    model_config = ConfigDict(frozen=True)
+
     count: int
-    entities: List[EntityResponse]
+    entities: list[EntityResponse]
 
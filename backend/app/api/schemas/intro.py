@@ -1,25 +1,27 @@
 """Introduction path related schemas."""
-from typing import List, Optional
-
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from .common import IntroPathNode
 
 
 class MutualConnection(BaseModel):
     """A mutual connection between two entities."""
+    model_config = ConfigDict(frozen=True)
+
     id: int
     name: str
-    company: Optional[str] = None
-    position: Optional[str] = None
-    role: Optional[str] = None
+    company: str | None = None
+    position: str | None = None
+    role: str | None = None
 
 
 class IntroPathResponse(BaseModel):
     """Response schema for introduction path endpoint."""
+    model_config = ConfigDict(frozen=True)
+
     source_id: int
     target_id: int
-    intro_path: List[IntroPathNode]
-    mutual_connections: List[MutualConnection]
+    intro_path: list[IntroPathNode]
+    mutual_connections: list[MutualConnection]
     connection_strength: float
 
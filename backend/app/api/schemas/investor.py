@@ -1,38 +1,37 @@
 """Investor-related schemas."""
-from typing import List, Optional
-
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from .common import IntroPathNode, MatchFactors
 
 
 class InvestorResponse(BaseModel):
     """Response schema for an investor with match scoring."""
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
     id: int
     name: str
-    company: Optional[str] = None
-    position: Optional[str] = None
-    linkedin_url: Optional[str] = None
-    email: Optional[str] = None
-    role: Optional[str] = None
-    sector_focus: Optional[List[str]] = None
-    stage_focus: Optional[List[str]] = None
-    location: Optional[str] = None
-    check_size_min: Optional[int] = None
-    check_size_max: Optional[int] = None
-    investment_thesis: Optional[str] = None
-    tags: Optional[List[str]] = None
+    company: str | None = None
+    position: str | None = None
+    linkedin_url: str | None = None
+    email: str | None = None
+    role: str | None = None
+    sector_focus: list[str] | None = None
+    stage_focus: list[str] | None = None
+    location: str | None = None
+    check_size_min: int | None = None
+    check_size_max: int | None = None
+    investment_thesis: str | None = None
+    tags: list[str] | None = None
     score: float = Field(..., description="Overall match score (0-100)")
     match_factors: MatchFactors
-    intro_path: List[IntroPathNode] = []
-    confidence_score: Optional[float] = None
-
-    class Config:
-        from_attributes = True
+    intro_path: list[IntroPathNode] = []
+    confidence_score: float | None = None
 
 
 class InvestorListResponse(BaseModel):
     """Response schema for list of investors."""
+    model_config = ConfigDict(frozen=True)
+
     count: int
-    investors: List[InvestorResponse]
+    investors: list[InvestorResponse]
 
@@ -1,48 +1,52 @@
 """Search-related schemas."""
-from typing import List, Optional
-
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from .common import IntroPathNode, MatchFactors
 
 
 class SearchFilters(BaseModel):
     """Search filter parameters."""
-    role: Optional[str] = None
-    sector: Optional[str] = None
-    stage: Optional[str] = None
-    location: Optional[str] = None
+    model_config = ConfigDict(frozen=True)
+
+    role: str | None = None
+    sector: str | None = None
+    stage: str | None = None
+    location: str | None = None
 
 
 class MatchResult(BaseModel):
     """A single match result with comprehensive data."""
+    model_config = ConfigDict(frozen=True)
+
     id: int
     name: str
-    company: Optional[str] = None
-    position: Optional[str] = None
-    linkedin_url: Optional[str] = None
-    email: Optional[str] = None
-    role: Optional[str] = None
-    sector_focus: Optional[List[str]] = None
-    stage_focus: Optional[List[str]] = None
-    location: Optional[str] = None
-    check_size_min: Optional[int] = None
-    check_size_max: Optional[int] = None
-    investment_thesis: Optional[str] = None
-    tags: Optional[List[str]] = None
+    company: str | None = None
+    position: str | None = None
+    linkedin_url: str | None = None
+    email: str | None = None
+    role: str | None = None
+    sector_focus: list[str] | None = None
+    stage_focus: list[str] | None = None
+    location: str | None = None
+    check_size_min: int | None = None
+    check_size_max: int | None = None
+    investment_thesis: str | None = None
+    tags: list[str] | None = None
     score: float = Field(..., description="Overall match score (0-100)")
     similarity_score: float = Field(..., description="Vector similarity score")
     match_factors: MatchFactors
-    reasons: List[str] = []
-    confidence_score: Optional[float] = None
-    intro_path: List[IntroPathNode] = []
+    reasons: list[str] = []
+    confidence_score: float | None = None
+    intro_path: list[IntroPathNode] = []
     connection_strength: float = 0.0
 
 
 class SearchResponse(BaseModel):
     """Response schema for search endpoint."""
+    model_config = ConfigDict(frozen=True)
+
     query: str
     filters: SearchFilters
     count: int
-    matches: List[MatchResult]
+    matches: list[MatchResult]
 
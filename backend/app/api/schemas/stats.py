@@ -1,12 +1,19 @@
 """Statistics related schemas."""
-from pydantic import BaseModel
+from typing import Dict
+
+from pydantic import BaseModel, ConfigDict
 
 
 class NetworkStatsResponse(BaseModel):
     """Response schema for network statistics."""
+    model_config = ConfigDict(frozen=True)
+
     total_entities: int
     investors: int
     founders: int
     enablers: int
     others: int
+    # Size and hit/miss counters of the in-process result caches
+    enrichment_cache: Dict[str, int]
+    embedding_cache: Dict[str, int]
 
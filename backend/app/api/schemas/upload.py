@@ -1,17 +1,29 @@
 """Upload related schemas."""
-from pydantic import BaseModel, Field
-
-
-class UploadStats(BaseModel):
-    """Statistics from CSV upload processing."""
-    total: int = Field(..., description="Total rows in CSV")
-    created: int = Field(..., description="Number of entities created")
-    skipped: int = Field(..., description="Number of entities skipped (already exist)")
-    errors: int = Field(..., description="Number of rows with errors")
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class UploadResponse(BaseModel):
-    """Response schema for file upload."""
+    """Response schema for an accepted file upload (processed in the background)."""
+    model_config = ConfigDict(frozen=True)
+
     message: str
-    stats: UploadStats
+    job_id: str = Field(..., description="Upload job id")
+    status_url: str = Field(..., description="Progress endpoint for this job")
+
+
+class UploadProgressResponse(BaseModel):
+    """Response schema for upload job progress."""
+    model_config = ConfigDict(frozen=True)
 
+    job_id: str | None = Field(None, description="Upload job id (absent when idle)")
+    status: str = Field(..., description="idle, queued, processing, completed or failed")
+    total: int = 0
+    processed: int = 0
+    enriched: int = 0
+    embedded: int = 0
+    errors: list[str] = Field(default_factory=list)
+    stats: dict[str, int] | None = Field(None, description="Final counts once completed")
+    batch_ids: list[str] = Field(default_factory=list, description="OpenAI batches of an /enrich-pending job")
+    start_time: float | None = None
+    elapsed_seconds: float | None = None
+    estimated_remaining_seconds: float | None = None
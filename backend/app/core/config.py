@@ -1,6 +1,8 @@
 """Configuration management using pydantic-settings."""
 from __future__ import annotations
 
+from functools import lru_cache
+
 from pydantic import field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -38,19 +40,57 @@ class Settings(BaseSettings):
         
         return v
 
+    # Connection pool (per process); size it for the request threadpool
+    db_pool_size: int = 20
+    db_max_overflow: int = 10
+    db_pool_timeout: int = 30
+    db_pool_recycle: int = 1800
+
     # Neo4j
     neo4j_uri: str = "neo4j://localhost:7687"
     neo4j_user: str = "neo4j"
     neo4j_password: str = "password"
     neo4j_database: str = "neo4j"
+    # Driver pool per worker process
+    neo4j_max_connection_pool_size: int = 50
+    neo4j_connection_acquisition_timeout: float = 30.0  # seconds
+    neo4j_max_connection_lifetime: int = 3600  # seconds
 
     # OpenAI
     openai_api_key: str = ""
+    # Per-minute budgets for proactive rate limiting (match your account tier)
+    openai_chat_rpm: int = 500
+    openai_chat_tpm: int = 200_000
+    openai_embedding_rpm: int = 3_000
+    openai_embedding_tpm: int = 1_000_000
+    # Embedding batch requests kept in flight at once
+    openai_embedding_concurrency: int = 4
+    # How often /enrich-pending jobs check on their Batch API request
+    openai_batch_poll_interval: int = 60  # seconds
 
     # App
     api_host: str = "0.0.0.0"
     api_port: int = 8000
+    # Upload job progress and the result caches live in process memory, so
+    # /upload-progress only works reliably with one worker
+    api_workers: int = 1
     cors_origins: str = "*"
+    # /search response cache; entries are also dropped when data is imported
+    search_cache_size: int = 1024
+    search_cache_ttl: int = 60  # seconds
+    # Minimum HNSW search breadth for vector search; higher trades latency
+    # for recall on large networks (raised further to cover the candidates)
+    hnsw_ef_search: int = 40
+    # With role/sector/stage/location filters, keep scanning the HNSW index
+    # until enough rows pass them instead of stopping after ef_search rows
+    # (pgvector 0.8+; set to "off" on older versions)
+    hnsw_iterative_scan: str = "relaxed_order"
+    # Raw Neo4j intro paths and mutual connections per pair; dropped on import/clear
+    intro_path_cache_size: int = 10_000
+    intro_path_cache_ttl: int = 300  # seconds
+    # LLM enrichments per normalized (name, company, position); expiring them
+    # lets re-imports pick up prompt and model improvements
+    enrichment_cache_ttl: int = 7 * 24 * 3600  # seconds
 
     # Upload settings
     max_upload_size: int = 2 * 1024 * 1024 * 1024  # 2GB
@@ -62,5 +102,11 @@ class Settings(BaseSettings):
     )
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide Settings instance (usable as a FastAPI dependency)."""
+    return Settings()
+
+
+settings = get_settings()
 
@@ -4,16 +4,26 @@ from __future__ import annotations
 from contextlib import contextmanager
 from typing import Generator
 
+import orjson
 from sqlalchemy import create_engine, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import Session, sessionmaker
 
 from app.core.config import settings
 
-# Create SQLAlchemy engine
+# Create SQLAlchemy engine with a bounded QueuePool so requests reuse
+# connections instead of reconnecting per session
 engine = create_engine(
     settings.database_url,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_timeout=settings.db_pool_timeout,
+    pool_recycle=settings.db_pool_recycle,
     pool_pre_ping=True,
+    # orjson encodes the JSON columns (raw_data) several times faster than
+    # the stdlib json module used by default
+    json_serializer=lambda value: orjson.dumps(value).decode(),
+    json_deserializer=orjson.loads,
     echo=False,
 )
 
@@ -57,3 +67,23 @@ def init_db() -> None:
     # Create all tables
     Base.metadata.create_all(bind=engine)
 
+    # create_all skips tables that already exist, so indexes added to the
+    # models later (e.g. the HNSW embedding index) are created here
+    from app.core.models import Entity
+
+    with engine.begin() as conn:
+        for index in Entity.__table__.indexes:
+            index.create(bind=conn, checkfirst=True)
+        # Superseded by the half-precision idx_entity_embedding_half; keeping
+        # it would make every insert maintain two HNSW indexes
+        conn.execute(text("DROP INDEX IF EXISTS idx_entity_embedding"))
+        # Sector/stage filters are exact lowercase containment (see
+        # vector_search.focus_filter); normalize rows stored before enrichment
+        # lowercased them. Rows already normalized are not rewritten.
+        for column in ("sector_focus", "stage_focus"):
+            conn.execute(text(
+                f"UPDATE entities SET {column} = ARRAY(SELECT lower(btrim(value)) FROM unnest({column}) AS value) "
+                f"WHERE {column} IS NOT NULL "
+                f"AND {column}::text[] <> ARRAY(SELECT lower(btrim(value)) FROM unnest({column}) AS value)"
+            ))
+
@@ -11,8 +11,12 @@ Provides structured logging for:
 - Vector search
 - API endpoints
 """
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -20,6 +24,30 @@ from typing import Optional
 from app.core.config import settings
 
 
+# Writes queued records to the real handlers on one background thread; the
+# root logger only holds _queue_handler
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+_queue_handler: Optional[logging.handlers.QueueHandler] = None
+
+
+def _stop_queue_listener() -> None:
+    """Flush and stop the current listener, closing its handlers (no-op if none)."""
+    global _queue_listener, _queue_handler
+    if _queue_handler is not None:
+        logging.getLogger().removeHandler(_queue_handler)
+        _queue_handler = None
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        for handler in _queue_listener.handlers:
+            handler.close()
+        _queue_listener = None
+
+
+# Flush what is still queued when the process exits; registered once, and
+# setup_logging() swaps the listener it stops
+atexit.register(_stop_queue_listener)
+
+
 class ColoredFormatter(logging.Formatter):
     """Custom formatter with colors for console output."""
     
@@ -34,17 +62,24 @@ class ColoredFormatter(logging.Formatter):
     RESET = '\033[0m'
     BOLD = '\033[1m'
     
+    def __init__(self, *args, **kwargs):
+        """Initialize formatter and precompute colored level names."""
+        super().__init__(*args, **kwargs)
+        # levelno -> colored level name, built once instead of per record
+        self._level_prefixes = {
+            logging.getLevelName(name): f"{color}{self.BOLD}{name}{self.RESET}"
+            for name, color in self.COLORS.items()
+        }
+    
     def format(self, record: logging.LogRecord) -> str:
         """Format log record with colors."""
-        # Add color to level name
         levelname = record.levelname
-        if levelname in self.COLORS:
-            record.levelname = f"{self.COLORS[levelname]}{self.BOLD}{levelname}{self.RESET}"
-        
-        # Format the message
-        result = super().format(record)
-        
-        return result
+        record.levelname = self._level_prefixes.get(record.levelno, levelname)
+        try:
+            return super().format(record)
+        finally:
+            # Restore so other handlers (e.g. the log file) get the plain name
+            record.levelname = levelname
 
 
 def setup_logging(
@@ -77,8 +112,12 @@ def setup_logging(
     root_logger = logging.getLogger()
     root_logger.setLevel(numeric_level)
     
-    # Remove existing handlers
+    # Remove existing handlers; a previous setup's listener thread is
+    # stopped and its console/file handlers closed
+    global _queue_listener, _queue_handler
+    _stop_queue_listener()
     root_logger.handlers.clear()
+    handlers = []
     
     # Console handler with colors
     console_handler = logging.StreamHandler(sys.stdout)
@@ -88,7 +127,7 @@ def setup_logging(
         datefmt='%Y-%m-%d %H:%M:%S'
     )
     console_handler.setFormatter(console_formatter)
-    root_logger.addHandler(console_handler)
+    handlers.append(console_handler)
     
     # File handler (detailed logs)
     if enable_file_logging:
@@ -99,7 +138,16 @@ def setup_logging(
             datefmt='%Y-%m-%d %H:%M:%S'
         )
         file_handler.setFormatter(file_formatter)
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
+    
+    # Loggers only enqueue records; stdout and file writes (and their locks)
+    # happen on the listener thread, so request and worker threads never
+    # block on I/O
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _queue_handler = logging.handlers.QueueHandler(log_queue)
+    root_logger.addHandler(_queue_handler)
+    _queue_listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _queue_listener.start()
     
     # Reduce noise from external libraries
     logging.getLogger("httpx").setLevel(logging.WARNING)
@@ -143,16 +191,15 @@ class OperationTimer:
     
     def __enter__(self):
         """Start timer."""
-        import time
-        self.start_time = time.time()
-        self.logger.log(self.level, f"Starting: {self.operation}")
+        self.start_time = time.monotonic()
+        if self.logger.isEnabledFor(self.level):
+            self.logger.log(self.level, "Starting: %s", self.operation)
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Stop timer and log duration."""
-        import time
-        if self.start_time:
-            duration = time.time() - self.start_time
+        if self.start_time is not None:
+            duration = time.monotonic() - self.start_time
             if exc_type:
                 self.logger.error(
                     f"Failed: {self.operation} | Duration: {duration:.2f}s | Error: {exc_val}"
@@ -179,8 +226,10 @@ def log_api_call(
         operation: Operation name (e.g., "generate_embedding", "enrich_entity")
         **kwargs: Additional context (model, tokens, cost, etc.)
     """
+    if not logger.isEnabledFor(logging.INFO):
+        return
     context = " | ".join(f"{k}={v}" for k, v in kwargs.items())
-    logger.info(f"API Call: {service}.{operation} | {context}")
+    logger.info("API Call: %s.%s | %s", service, operation, context)
 
 
 def log_processing_progress(
@@ -200,10 +249,12 @@ def log_processing_progress(
         operation: Operation description
         **kwargs: Additional context
     """
+    if not logger.isEnabledFor(logging.INFO):
+        return
     percentage = (current / total * 100) if total > 0 else 0
     context = " | ".join(f"{k}={v}" for k, v in kwargs.items())
     extra = f" | {context}" if context else ""
-    logger.info(f"Progress: {operation} | {current}/{total} ({percentage:.1f}%){extra}")
+    logger.info("Progress: %s | %d/%d (%.1f%%)%s", operation, current, total, percentage, extra)
 
 
 def log_error_with_context(
@@ -221,10 +272,12 @@ def log_error_with_context(
         operation: Operation that failed
         **kwargs: Additional context
     """
+    if not logger.isEnabledFor(logging.ERROR):
+        return
     context = " | ".join(f"{k}={v}" for k, v in kwargs.items())
-    error_type = type(error).__name__
     logger.error(
-        f"Error: {operation} | Type: {error_type} | Message: {str(error)} | {context}",
+        "Error: %s | Type: %s | Message: %s | %s",
+        operation, type(error).__name__, error, context,
         exc_info=True
     )
 
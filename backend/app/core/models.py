@@ -4,8 +4,8 @@ from __future__ import annotations
 from datetime import datetime
 from typing import List, Optional
 
-from pgvector.sqlalchemy import Vector
-from sqlalchemy import Column, DateTime, Float, Integer, String, Text, JSON, Index
+from pgvector.sqlalchemy import HALFVEC, Vector
+from sqlalchemy import Column, DateTime, Float, Integer, String, Text, JSON, Index, cast
 from sqlalchemy.dialects.postgresql import ARRAY
 
 from app.core.database import Base
@@ -30,8 +30,8 @@ class Entity(Base):
     
     # Enriched fields (from LLM)
     role = Column(String(50), nullable=True, index=True)  # founder, investor, enabler
-    sector_focus = Column(ARRAY(String), nullable=True)  # ["fintech", "healthcare"]
-    stage_focus = Column(ARRAY(String), nullable=True)  # ["seed", "series-a"]
+    sector_focus = Column(ARRAY(String), nullable=True)  # ["fintech", "healthcare"], lowercase
+    stage_focus = Column(ARRAY(String), nullable=True)  # ["seed", "series-a"], lowercase
     location = Column(String(255), nullable=True, index=True)
     check_size_min = Column(Integer, nullable=True)  # in USD
     check_size_max = Column(Integer, nullable=True)  # in USD
@@ -44,24 +44,31 @@ class Entity(Base):
     # Metadata
     confidence_score = Column(Float, nullable=True)  # 0-1
     enriched_at = Column(DateTime, nullable=True)
-    raw_data = Column(JSON, nullable=True)  # Store original CSV row
+    raw_data = Column(JSON, nullable=True)  # CSV values without a typed column
     
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
 
-    # Create index on vector column for similarity search
     __table_args__ = (
-        Index(
-            'idx_entity_embedding',
-            'embedding',
-            postgresql_using='hnsw',
-            postgresql_with={'m': 16, 'ef_construction': 64},
-            postgresql_ops={'embedding': 'vector_cosine_ops'}
-        ),
+        # GIN indexes serve the array containment (@>) sector/stage filters
+        Index('idx_entity_sector_focus', 'sector_focus', postgresql_using='gin'),
+        Index('idx_entity_stage_focus', 'stage_focus', postgresql_using='gin'),
     )
 
 
+# HNSW index for similarity search over a half-precision copy of the
+# embedding: half the size of a full-precision index, and candidates are
+# re-ranked on the full vectors (see vector_search)
+Index(
+    'idx_entity_embedding_half',
+    cast(Entity.embedding, HALFVEC(1536)).label('embedding_half'),
+    postgresql_using='hnsw',
+    postgresql_with={'m': 16, 'ef_construction': 128},
+    postgresql_ops={'embedding_half': 'halfvec_cosine_ops'},
+)
+
+
 class Connection(Base):
     """Edges table storing relationships between entities."""
 
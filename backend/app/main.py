@@ -1,44 +1,57 @@
 """Main FastAPI application with all endpoints."""
 from __future__ import annotations
 
+import io
 import logging
-from typing import Optional
+from typing import List, Optional
 
-from fastapi import Depends, FastAPI, File, HTTPException, Query, UploadFile
+from fastapi import BackgroundTasks, Depends, FastAPI, File, HTTPException, Query, UploadFile
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 # Import from core (database, models, config)
-from app.core.config import settings
+from app.core.config import Settings, get_settings
 from app.core.database import get_db, init_db
 from app.core.logging_config import setup_logging, get_logger
 from app.core.models import Entity
 
 # Import from services (business logic)
-from app.services.batch_processor import get_progress, process_linkedin_csv_fast
+from app.services.batch_processor import (
+    create_job,
+    get_progress,
+    run_upload_job,
+    save_upload,
+    start_batch_enrichment_job,
+)
 from app.services.email_generator import generate_multiple_emails
+from app.services.enrichment import close_openai_client
 from app.services.graph_service import (
     calculate_connection_strength,
+    get_intro_context_batch,
     get_intro_path,
+    get_intro_paths_batch,
     get_mutual_connections,
     get_network_stats,
+    invalidate_graph_cache,
 )
 from app.services.match_scorer import (
     calculate_match_factors,
     calculate_overall_match_score,
+    empty_query_score_expression,
 )
-from app.services.neo4j_client import neo4j_client
-from app.services.vector_search import hybrid_search
+from app.services.neo4j_client import GRAPH_ERRORS, neo4j_client
+from app.services.search_cache import invalidate_search_cache, search_cache, search_cache_key
+from app.services.vector_search import focus_filter, hybrid_search
 
 # Import schemas (for type validation)
-from app.api.schemas.email import EmailGenerationResponse, EmailTone
-from app.api.schemas.entity import EntityListResponse, EntityResponse
+from app.api.schemas.email import EmailGenerationResponse
+from app.api.schemas.entity import EntityListResponse
 from app.api.schemas.intro import IntroPathResponse
-from app.api.schemas.investor import InvestorListResponse, InvestorResponse
-from app.api.schemas.search import MatchResult, SearchFilters, SearchResponse
+from app.api.schemas.investor import InvestorListResponse
+from app.api.schemas.search import SearchResponse
 from app.api.schemas.stats import NetworkStatsResponse
-from app.api.schemas.upload import UploadResponse, UploadStats
+from app.api.schemas.upload import UploadProgressResponse, UploadResponse
 
 # Initialize logging
 setup_logging(log_level="INFO", enable_file_logging=True)
@@ -78,6 +91,7 @@ async def shutdown_event():
     """Clean up resources on shutdown."""
     logger.info("Shutting down application...")
     neo4j_client.close()
+    close_openai_client()
     logger.info("Application shutdown complete")
 
 
@@ -124,6 +138,7 @@ def clear_all_data(
         db.commit()
         
         logger.info("✓ PostgreSQL data deleted")
+        invalidate_search_cache()
         
         # Clear Neo4j graph
         try:
@@ -133,6 +148,7 @@ def clear_all_data(
             logger.info("✓ Neo4j graph cleared")
         except Exception as e:
             logger.warning(f"Could not clear Neo4j: {e}")
+        invalidate_graph_cache()
         
         return {
             "success": True,
@@ -153,23 +169,27 @@ def clear_all_data(
         )
 
 
-@app.post("/upload-fast", response_model=UploadResponse)
+@app.post("/upload-fast", response_model=UploadResponse, status_code=202)
 async def upload_connections_fast(
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     skip_enrichment: bool = Query(False, description="Skip AI enrichment for instant import (add enrichment later)"),
     max_workers: int = Query(10, ge=1, le=20, description="Number of parallel workers for enrichment (1-20)"),
-    db: Session = Depends(get_db),
+    settings: Settings = Depends(get_settings),
 ):
     """
     FAST upload for large CSV files (1000+ connections) - RECOMMENDED!
     
     Optimizations:
     - Batch embedding generation (2000 at a time) - 50x faster
-    - Parallel enrichment with ThreadPoolExecutor - 10x faster
+    - Concurrent async enrichment (bounded by max_workers) - 10x faster
     - Batch database operations - 5x faster
     - Progress tracking at /upload-progress
     - Supports files up to 2GB
     
+    The file is validated and accepted with 202; processing continues in the
+    background. Poll the returned status_url for progress and final stats.
+    
     Performance for 3000 connections:
     - With enrichment (skip_enrichment=false): ~5-10 minutes
     - Without enrichment (skip_enrichment=true): ~30-60 seconds
@@ -188,72 +208,119 @@ async def upload_connections_fast(
     logger.info(f"Starting CSV upload: {file.filename} | skip_enrichment={skip_enrichment} | max_workers={max_workers}")
     
     try:
-        # Check file size before reading
-        file_size = 0
-        content_chunks = []
-        while chunk := await file.read(8192):  # Read in 8KB chunks
-            content_chunks.append(chunk)
-            file_size += len(chunk)
-            if file_size > settings.max_upload_size:
-                max_size_mb = settings.max_upload_size / (1024 * 1024)
-                logger.error(f"File too large: {file.filename} | Size: {file_size / (1024*1024):.1f}MB")
-                raise HTTPException(
-                    status_code=413,
-                    detail=f"File too large. Maximum size is {max_size_mb:.0f}MB"
-                )
-        
-        content = b''.join(content_chunks)
+        # Check file size before parsing; the upload is already spooled, so
+        # this is a seek rather than a read
+        file_size = file.size
+        if file_size is None:
+            file_size = file.file.seek(0, io.SEEK_END)
+        file.file.seek(0)
+        if file_size > settings.max_upload_size:
+            max_size_mb = settings.max_upload_size / (1024 * 1024)
+            logger.error(f"File too large: {file.filename} | Size: {file_size / (1024*1024):.1f}MB")
+            raise HTTPException(
+                status_code=413,
+                detail=f"File too large. Maximum size is {max_size_mb:.0f}MB"
+            )
+
         file_size_mb = file_size / (1024 * 1024)
-        logger.info(f"File loaded: {file.filename} | Size: {file_size_mb:.2f}MB")
-        stats = process_linkedin_csv_fast(
-            content, 
-            db, 
+        logger.info(f"File received: {file.filename} | Size: {file_size_mb:.2f}MB")
+        
+        # The job gets its own copy of the upload (the request's file is
+        # closed with the request); the header is checked before accepting
+        upload_path = await run_in_threadpool(save_upload, file.file)
+        
+        # Processing outlives the request, so a client timeout can no longer
+        # abort an import half-way
+        job_id = create_job()
+        background_tasks.add_task(
+            run_upload_job,
+            job_id,
+            upload_path,
             owner_id=1,
             skip_enrichment=skip_enrichment,
             max_workers=max_workers,
         )
         
-        message = "File processed successfully"
+        message = "File accepted for processing"
         if skip_enrichment:
             message += " (enrichment skipped - use /enrich-pending to add AI data later)"
         
-        logger.info(
-            f"Upload complete: {file.filename} | "
-            f"Created: {stats.get('created', 0)} | "
-            f"Skipped: {stats.get('skipped', 0)} | "
-            f"Total: {stats.get('total', 0)}"
-        )
+        logger.info(f"Upload accepted: {file.filename} | Job: {job_id}")
         
-        return UploadResponse(
-            message=message,
-            stats=UploadStats(**stats)
-        )
+        return {
+            "message": message,
+            "job_id": job_id,
+            "status_url": f"/upload-progress?job_id={job_id}",
+        }
+    except HTTPException:
+        raise
     except ValueError as e:
         logger.error(f"Validation error in upload: {file.filename} | Error: {str(e)}")
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        logger.error(f"Processing failed: {file.filename} | Error: {str(e)}", exc_info=True)
-        raise HTTPException(status_code=500, detail=f"Fast processing failed: {str(e)}")
+        logger.error(f"Upload failed: {file.filename} | Error: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Fast upload failed: {str(e)}")
+
+
+@app.post("/enrich-pending", response_model=UploadResponse, status_code=202)
+def enrich_pending(
+    batch_id: Optional[List[str]] = Query(None, description="Resume collecting an earlier job's OpenAI batches (repeatable)"),
+    settings: Settings = Depends(get_settings),
+):
+    """
+    Enrich entities imported with skip_enrichment=true through the OpenAI Batch API.
+    
+    Batch requests cost half as much and are not throttled by the per-minute
+    rate limits, but OpenAI completes them within 24 hours rather than
+    minutes. Poll the returned status_url; the job stays "processing" until
+    the batch is done and its results are stored. Only one job runs at a
+    time. If a job fails while waiting (e.g. a restart), pass each of its
+    batch_ids from /upload-progress as a batch_id parameter to collect the
+    already submitted batches.
+    """
+    if not settings.openai_api_key:
+        raise HTTPException(status_code=400, detail="OpenAI API key is not configured")
+
+    job_id, started = start_batch_enrichment_job(owner_id=1, batch_ids=batch_id)
+    if not started:
+        raise HTTPException(
+            status_code=409,
+            detail=f"Batch enrichment already running: /upload-progress?job_id={job_id}",
+        )
+    logger.info(f"Batch enrichment accepted | Job: {job_id} | Resumed batches: {batch_id}")
+
+    return {
+        "message": "Pending entities queued for batch enrichment (completes within 24 hours)",
+        "job_id": job_id,
+        "status_url": f"/upload-progress?job_id={job_id}",
+    }
 
 
-@app.get("/upload-progress")
-def get_upload_progress():
+@app.get("/upload-progress", response_model=UploadProgressResponse)
+def get_upload_progress(
+    job_id: Optional[str] = Query(None, description="Job id returned by /upload-fast (latest job if omitted)"),
+):
     """
-    Get current upload/processing progress.
+    Get upload/processing progress of a job.
     
-    Use this endpoint while /upload-fast is running to track progress.
+    Use this endpoint while an /upload-fast job is running to track progress.
     
     Returns:
+    - job_id: Upload job id
     - total: Total entities to process
     - processed: Entities processed so far
     - enriched: Entities enriched (AI analysis done)
     - embedded: Entities embedded (vector embeddings generated)
-    - status: Current status (idle, processing, completed, error)
+    - status: Current status (idle, queued, processing, completed, failed)
+    - stats: Final created/skipped/total counts once completed
     - elapsed_seconds: Time elapsed since start
     - estimated_remaining_seconds: Estimated time remaining
     - errors: List of error messages (if any)
     """
-    return get_progress()
+    progress = get_progress(job_id)
+    if progress is None:
+        raise HTTPException(status_code=404, detail=f"Unknown upload job: {job_id}")
+    return progress
 
 
 @app.get("/entities", response_model=EntityListResponse)
@@ -263,31 +330,29 @@ def list_entities(
     db: Session = Depends(get_db),
 ):
     """List all entities with optional role filter."""
-    query = db.query(Entity)
+    # Select only the response columns: no ORM instances, and the embedding
+    # vector and raw CSV row are never loaded
+    query = db.query(
+        Entity.id,
+        Entity.full_name.label("name"),
+        Entity.email,
+        Entity.company,
+        Entity.position,
+        Entity.role,
+        Entity.sector_focus,
+        Entity.stage_focus,
+        Entity.location,
+        Entity.linkedin_url,
+    )
     
     if role and role.lower() != "all":
         query = query.filter(Entity.role == role.lower())
     
-    entities = query.limit(limit).all()
-
-    entity_responses = []
-    for entity in entities:
-        entity_responses.append(
-            EntityResponse(
-                id=entity.id,
-                name=entity.full_name,
-                email=entity.email,
-                company=entity.company,
-                position=entity.position,
-                role=entity.role,
-                sector_focus=entity.sector_focus,
-                stage_focus=entity.stage_focus,
-                location=entity.location,
-                linkedin_url=entity.linkedin_url,
-            )
-        )
+    # Plain dicts: FastAPI validates and serializes them once against
+    # response_model, instead of re-validating pre-built Pydantic models.
+    entity_responses = [dict(row._mapping) for row in query.limit(limit).all()]
 
-    return EntityListResponse(count=len(entity_responses), entities=entity_responses)
+    return {"count": len(entity_responses), "entities": entity_responses}
 
 
 @app.get("/investors", response_model=InvestorListResponse)
@@ -299,74 +364,62 @@ def list_investors(
     db: Session = Depends(get_db),
 ):
     """List investors with optional filters and comprehensive scoring."""
-    query = db.query(Entity).filter(Entity.role == "investor")
+    # Select only the response columns as plain rows: no ORM instances or
+    # identity map, and the embedding vector and raw CSV row are never loaded
+    query = db.query(
+        Entity.id,
+        Entity.full_name.label("name"),
+        Entity.company,
+        Entity.position,
+        Entity.linkedin_url,
+        Entity.email,
+        Entity.role,
+        Entity.sector_focus,
+        Entity.stage_focus,
+        Entity.location,
+        Entity.check_size_min,
+        Entity.check_size_max,
+        Entity.investment_thesis,
+        Entity.tags,
+        Entity.confidence_score,
+    ).filter(Entity.role == "investor")
     
     if sector:
-        query = query.filter(
-            func.array_to_string(Entity.sector_focus, ',').ilike(f'%{sector}%')
-        )
+        query = query.filter(focus_filter(Entity.sector_focus, sector))
     
     if stage:
-        query = query.filter(
-            func.array_to_string(Entity.stage_focus, ',').ilike(f'%{stage}%')
-        )
+        query = query.filter(focus_filter(Entity.stage_focus, stage))
     
     if location:
         query = query.filter(Entity.location.ilike(f'%{location}%'))
     
-    investors = query.limit(limit).all()
+    # Score in the database so ORDER BY ... LIMIT returns the top investors
+    # instead of scoring an arbitrary page in Python
+    score = empty_query_score_expression(similarity_score=0.8).label("match_score")
+    rows = (
+        query.add_columns(score)
+        .order_by(score.desc(), Entity.id)
+        .limit(limit)
+        .all()
+    )
     
-    # Calculate match scores and factors for each investor
-    scored_investors = []
-    for inv in investors:
-        match_factors = calculate_match_factors(inv, query="")
-        overall_score = calculate_overall_match_score(inv, query="", similarity_score=0.8)
-        
-        # Get intro path
-        intro_path = []
-        try:
-            intro_path_data = get_intro_path(1, inv.id, db)
-            intro_path = []
-            for node in intro_path_data:
-                intro_path.append(
-                    {
-                        "id": node["id"],
-                        "name": node["name"],
-                        "company": node.get("company"),
-                        "position": node.get("position"),
-                        "role": node.get("role"),
-                        "linkedin_url": node.get("linkedin_url"),
-                    }
-                )
-        except Exception:
-            pass
-        
-        scored_investors.append(
-            InvestorResponse(
-                id=inv.id,
-                name=inv.full_name,
-                company=inv.company,
-                position=inv.position,
-                linkedin_url=inv.linkedin_url,
-                email=inv.email,
-                role=inv.role,
-                sector_focus=inv.sector_focus,
-                stage_focus=inv.stage_focus,
-                location=inv.location,
-                check_size_min=inv.check_size_min,
-                check_size_max=inv.check_size_max,
-                investment_thesis=inv.investment_thesis,
-                tags=inv.tags,
-                score=overall_score,
-                match_factors=match_factors,
-                intro_path=intro_path,
-                confidence_score=inv.confidence_score,
-            )
-        )
+    # Fetch intro paths for all investors in one graph query
+    intro_paths = {}
+    try:
+        intro_paths = get_intro_paths_batch(1, [row.id for row in rows], db)
+    except GRAPH_ERRORS as e:
+        logger.warning(f"Intro paths unavailable for /investors: {type(e).__name__}: {e}")
     
-    scored_investors.sort(key=lambda x: x.score, reverse=True)
+    scored_investors = []
+    for row in rows:
+        investor = dict(row._mapping)
+        investor["score"] = round(investor.pop("match_score"), 1)
+        # Rows expose the scored columns as attributes, like Entity
+        investor["match_factors"] = calculate_match_factors(row, query="")
+        investor["intro_path"] = intro_paths.get(row.id, {}).get("intro_path", [])
+        scored_investors.append(investor)
     
-    return InvestorListResponse(count=len(scored_investors), investors=scored_investors)
+    return {"count": len(scored_investors), "investors": scored_investors}
 
 
 @app.get("/search", response_model=SearchResponse)
@@ -380,6 +433,12 @@ def search_investors(
     db: Session = Depends(get_db),
 ):
     """Search for investors using hybrid vector + keyword search."""
+    # Dashboards re-issue the same searches; serve repeats from the TTL cache
+    cache_key = search_cache_key(q, role, sector, stage, location, limit)
+    cached = search_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    
     results = hybrid_search(
         query=q,
         db=db,
@@ -390,33 +449,24 @@ def search_investors(
         limit=limit,
     )
     
+    # Fetch intro paths, strengths and mutual connections for all matches at once
+    target_ids = [match_data['id'] for match_data in results]
+    intro_paths = {}
+    mutuals = {}
+    graph_available = False
+    try:
+        intro_paths, mutuals = get_intro_context_batch(1, target_ids, db)
+        graph_available = True
+    except GRAPH_ERRORS as e:
+        logger.warning(f"Intro paths unavailable for /search: {type(e).__name__}: {e}")
+    
     # Enrich with intro paths and enhanced reasons
     matches = []
     for match_data in results:
-        intro_path = []
-        connection_strength = 0.0
-        mutual_count = 0
-        
-        try:
-            intro_path_data = get_intro_path(1, match_data['id'], db)
-            mutual_data = get_mutual_connections(1, match_data['id'], db)
-            mutual_count = len(mutual_data)
-            
-            intro_path = []
-            for node in intro_path_data:
-                intro_path.append(
-                    {
-                        "id": node["id"],
-                        "name": node["name"],
-                        "company": node.get("company"),
-                        "position": node.get("position"),
-                        "role": node.get("role"),
-                        "linkedin_url": node.get("linkedin_url"),
-                    }
-                )
-            connection_strength = calculate_connection_strength(1, match_data['id'], db)
-        except Exception:
-            pass
+        path_info = intro_paths.get(match_data['id'], {})
+        intro_path = path_info.get('intro_path', [])
+        connection_strength = path_info.get('connection_strength', 0.0)
+        mutual_count = len(mutuals.get(match_data['id'], []))
         
         # Enhance reasons with natural language explanations
         enhanced_reasons = []
@@ -457,19 +507,25 @@ def search_investors(
         match_data['intro_path'] = intro_path
         match_data['connection_strength'] = connection_strength
         
-        matches.append(MatchResult(**match_data))
-    
-    return SearchResponse(
-        query=q,
-        filters=SearchFilters(
-            role=role,
-            sector=sector,
-            stage=stage,
-            location=location,
-        ),
-        count=len(matches),
-        matches=matches,
-    )
+        matches.append(match_data)
+    
+    # Frozen response model: safe to share between cached responses
+    response = SearchResponse.model_validate({
+        "query": q,
+        "filters": {
+            "role": role,
+            "sector": sector,
+            "stage": stage,
+            "location": location,
+        },
+        "count": len(matches),
+        "matches": matches,
+    })
+    # A degraded response (no intro paths) would outlive Neo4j's recovery
+    if graph_available:
+        search_cache.set(cache_key, response)
+    
+    return response
 
 
 @app.get("/intro-path/{target_id}", response_model=IntroPathResponse)
@@ -479,9 +535,17 @@ def get_introduction_path(
     db: Session = Depends(get_db),
 ):
     """Get introduction path from source to target entity."""
-    path_data = get_intro_path(source_id, target_id, db)
-    mutual_data = get_mutual_connections(source_id, target_id, db)
-    strength = calculate_connection_strength(source_id, target_id, db)
+    # Without the graph (Neo4j down or its breaker open) this degrades to the
+    # same empty response as "no path" instead of a 500
+    path_data = []
+    mutual_data = []
+    strength = 0.0
+    try:
+        path_data = get_intro_path(source_id, target_id, db)
+        mutual_data = get_mutual_connections(source_id, target_id, db)
+        strength = calculate_connection_strength(source_id, target_id, db)
+    except GRAPH_ERRORS as e:
+        logger.warning(f"Intro path unavailable for /intro-path: {type(e).__name__}: {e}")
     
     intro_path = []
     for node in path_data:
@@ -508,20 +572,19 @@ def get_introduction_path(
             }
         )
     
-    return IntroPathResponse(
-        source_id=source_id,
-        target_id=target_id,
-        intro_path=intro_path,
-        mutual_connections=mutual_connections,
-        connection_strength=strength,
-    )
+    return {
+        "source_id": source_id,
+        "target_id": target_id,
+        "intro_path": intro_path,
+        "mutual_connections": mutual_connections,
+        "connection_strength": strength,
+    }
 
 
 @app.get("/stats", response_model=NetworkStatsResponse)
 def get_stats(db: Session = Depends(get_db)):
     """Get network statistics."""
-    stats = get_network_stats(db)
-    return NetworkStatsResponse(**stats)
+    return get_network_stats(db)
 
 
 @app.post("/generate-intro-email/{target_id}", response_model=EmailGenerationResponse)
@@ -578,7 +641,7 @@ def generate_intro_email(
         mutual_data = get_mutual_connections(source_id, target_id, db)
         connection_strength = calculate_connection_strength(source_id, target_id, db)
     except Exception as e:
-        print(f"Warning: Could not get intro path: {e}")
+        logger.warning(f"Could not get intro path: {e}")
     
     # Step 5: calculate match factors so the copy references real strengths.
     match_factors = calculate_match_factors(investor, query="")
@@ -606,10 +669,10 @@ def generate_intro_email(
     elif mutual_data:
         intro_via = mutual_data[0].get('name', 'Mutual connection')
     
-    return EmailGenerationResponse(
-        target_investor=f"{investor.full_name}, {investor.company}",
-        intro_via=intro_via,
-        match_score=match_score,
-        emails=emails_dict
-    )
+    return {
+        "target_investor": f"{investor.full_name}, {investor.company}",
+        "intro_via": intro_via,
+        "match_score": match_score,
+        "emails": emails_dict,
+    }
 
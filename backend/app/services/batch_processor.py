@@ -1,38 +1,122 @@
 """Optimized batch processing for large CSV imports using parallel processing and batching."""
 from __future__ import annotations
 
+import asyncio
+import contextvars
 import logging
+import os
+import shutil
+import tempfile
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
 from datetime import datetime
-from typing import BinaryIO, Dict, List, Optional, Tuple
+from itertools import islice
+from typing import BinaryIO, Callable, Dict, Iterable, List, Optional, Tuple
+from uuid import uuid4
 
 import pandas as pd
+from sqlalchemy import select, update
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
+from app.core.database import SessionLocal
 from app.core.logging_config import get_logger, OperationTimer, log_processing_progress, log_api_call, log_error_with_context
 from app.core.models import Connection, Entity
-from app.services.csv_processor import parse_linkedin_csv
-from app.services.enrichment import create_embedding_text, enrich_entity, generate_embedding
+from app.services.csv_processor import bulk_insert_entities, extra_raw_data, iter_linkedin_csv, parse_connected_on
+from app.services.enrichment import (
+    EMBEDDING_MODEL,
+    cache_embedding,
+    create_embedding_text,
+    enrich_many,
+    embed_bisect,
+    embeddings_in_order,
+    fetch_enrichment_batch,
+    get_cached_embedding,
+    request_embeddings,
+    submit_enrichment_batch,
+)
+from app.services.graph_service import invalidate_graph_cache
 from app.services.neo4j_client import neo4j_client
+from app.services.retry import RETRIABLE_ERRORS
+from app.services.search_cache import invalidate_search_cache
 
 logger = get_logger(__name__)
 
-# Global progress tracker
-_progress = {
-    "total": 0,
-    "processed": 0,
-    "enriched": 0,
-    "embedded": 0,
-    "status": "idle",
-    "errors": [],
-    "start_time": None,
-}
-
-
-def get_progress() -> Dict:
-    """Get current processing progress."""
-    progress = _progress.copy()
+# Progress of recent upload jobs by job id, oldest first. Jobs run in
+# background threads while /upload-progress reads them, so every access to
+# _jobs and to a progress dict goes through _progress_lock
+_jobs: Dict[str, Dict] = {}
+_progress_lock = threading.Lock()
+MAX_TRACKED_JOBS = 50
+# Errors kept per job; older ones are dropped
+MAX_TRACKED_ERRORS = 1000
+
+# Progress dict of the job being processed in the current thread (and the
+# event loops it runs); update_progress() writes here
+_current_job: ContextVar[Optional[Dict]] = ContextVar("current_upload_job", default=None)
+
+# Enriched entities per embedding request fired while enrichment is still running
+EMBEDDING_PIPELINE_BATCH = 200
+
+# CSV columns normalized per window, in the order _process_window unpacks them
+FAST_TEXT_COLUMNS = ['First Name', 'Last Name', 'URL', 'Email Address', 'Company', 'Position', 'Connected On']
+
+
+def _new_progress(job_id: str, status: str, total: int = 0) -> Dict:
+    return {
+        "job_id": job_id,
+        "total": total,
+        "processed": 0,
+        "enriched": 0,
+        "embedded": 0,
+        "status": status,
+        "errors": deque(maxlen=MAX_TRACKED_ERRORS),
+        "start_time": time.time() if status == "processing" else None,
+        "stats": None,
+    }
+
+
+def _track_job(progress: Dict) -> None:
+    """Register a job's progress, dropping the oldest jobs beyond the limit."""
+    with _progress_lock:
+        _jobs.pop(progress["job_id"], None)
+        _jobs[progress["job_id"]] = progress
+        while len(_jobs) > MAX_TRACKED_JOBS:
+            del _jobs[next(iter(_jobs))]
+
+
+def create_job() -> str:
+    """Register a queued upload job and return its id."""
+    job_id = str(uuid4())
+    _track_job(_new_progress(job_id, "queued"))
+    return job_id
+
+
+def get_progress(job_id: Optional[str] = None) -> Optional[Dict]:
+    """
+    Get processing progress of a job (the most recent job if job_id is None).
+
+    Returns None for an unknown job id.
+    """
+    with _progress_lock:
+        if job_id is None:
+            if not _jobs:
+                return {"status": "idle", "total": 0, "processed": 0, "enriched": 0, "embedded": 0, "errors": []}
+            job_id = next(reversed(_jobs))
+
+        progress = _jobs.get(job_id)
+        if progress is None:
+            return None
+
+        # One consistent snapshot of the counters and errors
+        progress = progress.copy()
+        progress["errors"] = list(progress["errors"])
+        if "batch_ids" in progress:
+            progress["batch_ids"] = list(progress["batch_ids"])
+
     if progress["start_time"]:
         elapsed = time.time() - progress["start_time"]
         progress["elapsed_seconds"] = round(elapsed, 1)
@@ -43,29 +127,25 @@ def get_progress() -> Dict:
     return progress
 
 
-def reset_progress(total: int):
-    """Reset progress tracker."""
-    _progress.update({
-        "total": total,
-        "processed": 0,
-        "enriched": 0,
-        "embedded": 0,
-        "status": "processing",
-        "errors": [],
-        "start_time": time.time(),
-    })
+def reset_progress(total: int, job_id: Optional[str] = None) -> Dict:
+    """Start tracking a job in the current context and return its progress dict."""
+    progress = _new_progress(job_id or str(uuid4()), "processing", total)
+    _track_job(progress)
+    _current_job.set(progress)
+    return progress
 
 
 def update_progress(processed: int = 0, enriched: int = 0, embedded: int = 0, error: str = None):
-    """Update progress counters."""
-    if processed:
-        _progress["processed"] += processed
-    if enriched:
-        _progress["enriched"] += enriched
-    if embedded:
-        _progress["embedded"] += embedded
-    if error:
-        _progress["errors"].append(error)
+    """Update progress counters of the current job (no-op outside a job)."""
+    progress = _current_job.get()
+    if progress is None:
+        return
+    with _progress_lock:
+        progress["processed"] += processed
+        progress["enriched"] += enriched
+        progress["embedded"] += embedded
+        if error:
+            progress["errors"].append(error)
 
 
 def batch_generate_embeddings(texts: List[str], batch_size: int = 2000) -> List[Optional[List[float]]]:
@@ -75,56 +155,83 @@ def batch_generate_embeddings(texts: List[str], batch_size: int = 2000) -> List[
     OpenAI supports up to 2048 inputs per request - this is MUCH faster than individual calls.
     For 3000 embeddings: ~30 seconds instead of 30+ minutes!
     """
-    import openai
-    from app.core.config import settings
-    
     if not settings.openai_api_key:
         logger.warning("No OpenAI API key configured - skipping embeddings")
         return [None] * len(texts)
     
-    logger.info(f"Starting batch embedding generation | Total texts: {len(texts)} | Batch size: {batch_size}")
-    all_embeddings = []
-    
-    for i in range(0, len(texts), batch_size):
-        batch = texts[i:i + batch_size]
-        batch_start = i + 1
-        batch_end = min(i + batch_size, len(texts))
-        
-        try:
-            log_processing_progress(logger, batch_end, len(texts), "Embedding generation", batch=f"{batch_start}-{batch_end}")
-            
-            with OperationTimer(logger, f"OpenAI embedding batch {batch_start}-{batch_end}", level=logging.DEBUG):
-                response = openai.embeddings.create(
-                    model="text-embedding-3-large",
-                    input=batch,
-                    dimensions=1536,
-                )
-            
-            batch_embeddings = [item.embedding for item in response.data]
-            all_embeddings.extend(batch_embeddings)
-            update_progress(embedded=len(batch))
-            
-            log_api_call(logger, "OpenAI", "embeddings.create", 
-                        model="text-embedding-3-large", count=len(batch), status="success")
+    # Texts embedded before (e.g. re-uploads) are served from the cache
+    all_embeddings = [get_cached_embedding(text) for text in texts]
+    # Identical texts are embedded once; later copies point at the first
+    pending = []
+    duplicates = {}
+    first_index = {}
+    for idx, embedding in enumerate(all_embeddings):
+        if embedding is None:
+            first = first_index.setdefault(texts[idx], idx)
+            if first == idx:
+                pending.append(idx)
+            else:
+                duplicates[idx] = first
+    cached_count = len(texts) - len(pending) - len(duplicates)
+    if cached_count:
+        update_progress(embedded=cached_count)
+    
+    logger.info(f"Starting batch embedding generation | Total texts: {len(texts)} | Cached: {cached_count} | Duplicates: {len(duplicates)} | Batch size: {batch_size}")
+    
+    def embed_batch(batch: List[str], label: str):
+        with OperationTimer(logger, f"OpenAI embedding batch {label}", level=logging.DEBUG):
+            return request_embeddings(batch)
+    
+    # Batches are requested concurrently so their latencies overlap; results
+    # are consumed in order on this thread, which owns the job's progress
+    batches = [pending[i:i + batch_size] for i in range(0, len(pending), batch_size)]
+    labels = [f"{i * batch_size + 1}-{i * batch_size + len(batch_indices)}" for i, batch_indices in enumerate(batches)]
+    workers = max(1, min(settings.openai_embedding_concurrency, len(batches)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="embeddings") as executor:
+        futures = [
+            executor.submit(embed_batch, [texts[idx] for idx in batch_indices], label)
+            for batch_indices, label in zip(batches, labels)
+        ]
+        for i, (batch_indices, label, future) in enumerate(zip(batches, labels, futures)):
+            batch = [texts[idx] for idx in batch_indices]
+            batch_end = i * batch_size + len(batch_indices)
             
-        except Exception as e:
-            log_error_with_context(logger, e, "Batch embedding generation", batch=f"{batch_start}-{batch_end}")
-            logger.info(f"Falling back to individual embedding calls for batch {batch_start}-{batch_end}")
+            try:
+                response = future.result()
+                log_processing_progress(logger, batch_end, len(pending), "Embedding generation", batch=label)
+                
+                for idx, text, embedding in zip(batch_indices, batch, embeddings_in_order(response)):
+                    all_embeddings[idx] = embedding
+                    cache_embedding(text, embedding)
+                update_progress(embedded=len(batch))
+                
+                log_api_call(logger, "OpenAI", "embeddings.create", 
+                            model=EMBEDDING_MODEL, count=len(batch), status="success")
+                
+            except Exception as e:
+                log_error_with_context(logger, e, "Batch embedding generation", batch=label)
+                if isinstance(e, RETRIABLE_ERRORS):
+                    # Retries are already exhausted; more requests would only
+                    # multiply them
+                    batch_embeddings = [None] * len(batch)
+                else:
+                    logger.info(f"Bisecting failed embedding batch {label}")
+                    batch_embeddings = embed_bisect(batch)
             
-            # Fallback: try individual calls
-            for idx, text in enumerate(batch):
-                try:
-                    resp = openai.embeddings.create(
-                        model="text-embedding-3-large",
-                        input=text,
-                        dimensions=1536,
-                    )
-                    all_embeddings.append(resp.data[0].embedding)
-                    update_progress(embedded=1)
-                except Exception as fallback_error:
-                    logger.error(f"Failed embedding for text {i+idx}: {text[:50]}... | Error: {str(fallback_error)}")
-                    all_embeddings.append(None)
-                    update_progress(error=f"Failed embedding for text: {text[:50]}...")
+                for idx, text, embedding in zip(batch_indices, batch, batch_embeddings):
+                    all_embeddings[idx] = embedding
+                    if embedding is not None:
+                        cache_embedding(text, embedding)
+                        update_progress(embedded=1)
+                    else:
+                        logger.error(f"Failed embedding for text {idx}: {text[:50]}...")
+                        update_progress(error=f"Failed embedding for text: {text[:50]}...")
+    
+    for idx, first in duplicates.items():
+        all_embeddings[idx] = all_embeddings[first]
+    duplicates_embedded = sum(1 for first in duplicates.values() if all_embeddings[first] is not None)
+    if duplicates_embedded:
+        update_progress(embedded=duplicates_embedded)
     
     logger.info(f"Completed embedding generation | Total: {len(all_embeddings)} | Successful: {sum(1 for e in all_embeddings if e is not None)}")
     return all_embeddings
@@ -133,84 +240,145 @@ def batch_generate_embeddings(texts: List[str], batch_size: int = 2000) -> List[
 def parallel_enrich_entities(
     entities_info: List[Dict],
     max_workers: int = 10,
-    rate_limit_delay: float = 0.1
+    on_enriched: Optional[Callable[[int, Dict], None]] = None,
 ) -> List[Dict]:
     """
-    Enrich entities in parallel using ThreadPoolExecutor.
+    Enrich entities concurrently with AsyncOpenAI.
     
-    Uses threading to parallelize API calls while respecting rate limits.
+    Requests are I/O-bound, so one event loop with at most max_workers
+    requests in flight replaces a thread per call.
     For 3000 entities: ~5-10 minutes instead of 30+ minutes!
     
     Args:
         entities_info: List of dicts with 'name', 'company', 'position'
-        max_workers: Number of parallel threads (default 10)
-        rate_limit_delay: Delay between requests to avoid rate limits
+        max_workers: Maximum number of concurrent API requests (default 10)
+        on_enriched: Optional callback(index, enrichment) run as each entity finishes
     """
     logger.info(f"Starting parallel enrichment | Entities: {len(entities_info)} | Workers: {max_workers}")
-    results = [None] * len(entities_info)
     
-    def enrich_with_index(idx: int, info: Dict) -> Tuple[int, Dict]:
-        """Enrich entity and return with its index."""
-        try:
-            # Add small delay to avoid rate limits
-            time.sleep(rate_limit_delay * (idx % max_workers))
-            enrichment = enrich_entity(info['name'], info['company'], info['position'])
-            update_progress(enriched=1)
-            return idx, enrichment
-        except Exception as e:
-            logger.error(f"Error enriching entity | Name: {info['name']} | Company: {info.get('company', 'N/A')} | Error: {str(e)}")
-            update_progress(error=f"Failed enrichment for {info['name']}: {str(e)[:100]}")
-            return idx, {
-                "role": "other",
-                "sector_focus": [],
-                "stage_focus": [],
-                "check_size_min": None,
-                "check_size_max": None,
-                "investment_thesis": None,
-                "location": None,
-                "tags": [],
-                "confidence": 0.0,
-            }
+    completed = 0
     
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        # Submit all tasks
-        futures = {
-            executor.submit(enrich_with_index, idx, info): idx
-            for idx, info in enumerate(entities_info)
-        }
-        
-        # Collect results as they complete
-        for future in as_completed(futures):
-            try:
-                idx, enrichment = future.result()
-                results[idx] = enrichment
-                
-                # Progress update every 100 entities
-                if (idx + 1) % 100 == 0:
-                    log_processing_progress(logger, _progress['enriched'], len(entities_info), "Entity enrichment")
-            except Exception as e:
-                logger.error(f"Future execution failed: {str(e)}", exc_info=True)
+    def on_complete(idx: int, enrichment: Dict) -> None:
+        nonlocal completed
+        completed += 1
+        update_progress(enriched=1)
+        if on_enriched is not None:
+            on_enriched(idx, enrichment)
+        # Progress update every 100 entities
+        if completed % 100 == 0:
+            log_processing_progress(logger, completed, len(entities_info), "Entity enrichment")
+    
+    results = asyncio.run(enrich_many(entities_info, max_workers=max_workers, on_complete=on_complete))
     
     logger.info(f"Completed parallel enrichment | Total: {len(results)} | Success: {sum(1 for r in results if r and r.get('role') != 'other')}")
     return results
 
 
+def _embedding_text(entity: Dict, enrichment: Dict) -> str:
+    """Embedding text for an extracted CSV entity and its enrichment."""
+    return create_embedding_text({
+        "full_name": entity["full_name"],
+        "company": entity["company"],
+        "position": entity["position"],
+        "role": enrichment.get("role"),
+        "sector_focus": enrichment.get("sector_focus", []),
+        "stage_focus": enrichment.get("stage_focus", []),
+        "investment_thesis": enrichment.get("investment_thesis"),
+        "location": enrichment.get("location"),
+    })
+
+
+def _enrich_and_embed(
+    entities: List[Dict],
+    max_workers: int,
+) -> Tuple[List[Dict], List[Optional[List[float]]]]:
+    """
+    Enrich entities and embed them while enrichment is still in flight.
+
+    Every EMBEDDING_PIPELINE_BATCH finished enrichments are handed to an
+    embedding worker, so wall time approaches the slower of the two phases
+    instead of their sum. A text already handed over is not sent again, even
+    across chunks. Results are returned in input order.
+    """
+    texts: List[Optional[str]] = [None] * len(entities)
+    ready: List[int] = []
+    chunks = []
+    first_by_text: Dict[str, int] = {}
+    duplicates: Dict[int, int] = {}
+
+    with ThreadPoolExecutor(
+        max_workers=settings.openai_embedding_concurrency, thread_name_prefix="embed-pipeline"
+    ) as executor:
+        def flush() -> None:
+            indices = list(ready)
+            ready.clear()
+            # The copied context carries the job's progress into the worker
+            context = contextvars.copy_context()
+            chunks.append((
+                indices,
+                executor.submit(context.run, batch_generate_embeddings, [texts[idx] for idx in indices]),
+            ))
+
+        def on_enriched(idx: int, enrichment: Dict) -> None:
+            texts[idx] = _embedding_text(entities[idx], enrichment)
+            first = first_by_text.setdefault(texts[idx], idx)
+            if first != idx:
+                duplicates[idx] = first
+                return
+            ready.append(idx)
+            if len(ready) >= EMBEDDING_PIPELINE_BATCH:
+                flush()
+
+        with OperationTimer(logger, "Entity enrichment"):
+            enrichments = parallel_enrich_entities(
+                [
+                    {"name": e["full_name"], "company": e["company"], "position": e["position"]}
+                    for e in entities
+                ],
+                max_workers=max_workers,
+                on_enriched=on_enriched,
+            )
+        if ready:
+            flush()
+
+        embeddings: List[Optional[List[float]]] = [None] * len(entities)
+        with OperationTimer(logger, "Remaining embedding generation"):
+            for indices, future in chunks:
+                for idx, embedding in zip(indices, future.result()):
+                    embeddings[idx] = embedding
+
+    for idx, first in duplicates.items():
+        embeddings[idx] = embeddings[first]
+    duplicates_embedded = sum(1 for first in duplicates.values() if embeddings[first] is not None)
+    if duplicates_embedded:
+        update_progress(embedded=duplicates_embedded)
+
+    return enrichments, embeddings
+
+
 def process_linkedin_csv_fast(
-    file_content: bytes,
+    rows: Iterable[Dict[str, Optional[str]]],
     db: Session,
     owner_id: int = 1,
     skip_enrichment: bool = False,
     max_workers: int = 10,
+    batch_size: int = 1000,
+    job_id: Optional[str] = None,
 ) -> Dict[str, int]:
     """
     Fast CSV processing with batch operations and parallel processing.
     
+    ``rows`` is an iterable of CSV row dicts (see iter_linkedin_csv); it is
+    consumed in windows of ``batch_size`` rows so peak memory tracks the
+    window, not the file.
+    
     Optimizations:
-    1. Batch embedding generation (2000 at a time)
-    2. Parallel enrichment with ThreadPoolExecutor
-    3. Batch database commits (every 100 rows)
-    4. Progress tracking
-    5. Optional skip enrichment for instant import
+    1. Streaming parse, processed in 1000-row windows
+    2. Batch embedding generation (one request per window)
+    3. Concurrent async enrichment (AsyncOpenAI, bounded by max_workers)
+    4. Bulk database inserts (one per window)
+    5. Progress tracking
+    6. Optional skip enrichment for instant import
     
     Performance:
     - With enrichment: ~5-10 minutes for 3000 rows
@@ -220,56 +388,414 @@ def process_linkedin_csv_fast(
     logger.info("FAST CSV PROCESSING START")
     logger.info("=" * 80)
     
-    # Parse CSV
-    with OperationTimer(logger, "CSV parsing"):
-        df = parse_linkedin_csv(file_content)
-    
-    total_rows = len(df)
-    logger.info(f"CSV parsed successfully | Total connections: {total_rows}")
-    
-    reset_progress(total_rows)
+    # The row count is unknown until the stream is exhausted, so the
+    # progress total grows as windows are read
+    progress = reset_progress(0, job_id)
     
     stats = {
-        "total": total_rows,
+        "total": 0,
         "created": 0,
         "skipped": 0,
         "errors": 0,
     }
     
-    # Helper function to safely extract string values
-    def safe_str(value):
-        if value is None or pd.isna(value):
-            return None
-        val = str(value).strip()
-        if val.lower() in ['nan', 'none', '']:
-            return None
-        return val
+    rows = iter(rows)
+    window_number = 0
+    while window := list(islice(rows, batch_size)):
+        window_number += 1
+        stats["total"] += len(window)
+        with _progress_lock:
+            progress["total"] += len(window)
+        logger.info(f"Processing window {window_number} | Rows: {len(window)} | Rows read: {stats['total']}")
+        
+        _process_window(window, db, stats, owner_id, skip_enrichment, max_workers)
+    
+    logger.info(f"CSV stream exhausted | Total connections: {stats['total']}")
     
+    with _progress_lock:
+        progress["stats"] = stats
+        progress["status"] = "completed"
+    
+    logger.info("=" * 80)
+    logger.info("PROCESSING COMPLETE")
+    logger.info(f"Total connections: {stats['total']}")
+    logger.info(f"Created: {stats['created']}")
+    logger.info(f"Skipped: {stats['skipped']}")
+    logger.info(f"Errors: {len(progress['errors'])}")
+    
+    if progress["start_time"]:
+        elapsed = time.time() - progress["start_time"]
+        rate = stats['created'] / elapsed if elapsed > 0 else 0
+        logger.info(f"Processing time: {elapsed:.1f} seconds")
+        logger.info(f"Processing rate: {rate:.1f} entities/second")
+    
+    logger.info("=" * 80)
+    
+    return stats
+
+
+def save_upload(stream: BinaryIO) -> str:
+    """
+    Copy an uploaded CSV to a temp file owned by the background job.
+
+    The header and first row are checked up front so malformed files are
+    rejected before the job is accepted. Returns the temp file path.
+    """
+    with tempfile.NamedTemporaryFile(suffix=".csv", delete=False) as saved:
+        shutil.copyfileobj(stream, saved, 1024 * 1024)
+    
+    try:
+        with open(saved.name, "rb") as saved_stream:
+            rows = iter_linkedin_csv(saved_stream)
+            next(rows)
+            rows.close()
+    except Exception:
+        os.remove(saved.name)
+        raise
+    
+    return saved.name
+
+
+def run_upload_job(
+    job_id: str,
+    csv_path: str,
+    owner_id: int = 1,
+    skip_enrichment: bool = False,
+    max_workers: int = 10,
+) -> None:
+    """
+    Process a saved upload in the background with its own database session.
+
+    Failures are recorded on the job's progress instead of being raised.
+    The temp file is removed when the job ends.
+    """
+    db = SessionLocal()
+    try:
+        with open(csv_path, "rb") as stream:
+            stats = process_linkedin_csv_fast(
+                iter_linkedin_csv(stream),
+                db,
+                owner_id=owner_id,
+                skip_enrichment=skip_enrichment,
+                max_workers=max_workers,
+                job_id=job_id,
+            )
+        logger.info(
+            f"Upload job complete | Job: {job_id} | "
+            f"Created: {stats['created']} | Skipped: {stats['skipped']} | Total: {stats['total']}"
+        )
+    except Exception as e:
+        db.rollback()
+        log_error_with_context(logger, e, "Upload job", job_id=job_id)
+        _mark_job_failed(job_id, e)
+    finally:
+        db.close()
+        os.remove(csv_path)
+        # New entities change search results and paths, even after a partial import
+        invalidate_search_cache()
+        invalidate_graph_cache()
+
+
+def _mark_job_failed(job_id: str, error: Exception) -> None:
+    with _progress_lock:
+        progress = _jobs.get(job_id)
+        if progress is not None:
+            progress["status"] = "failed"
+            progress["errors"].append(str(error))
+
+
+# At most one /enrich-pending job runs at a time, so no row is submitted to
+# two batches; guarded by _progress_lock
+_active_batch_job: Optional[str] = None
+# Consecutive failed status checks (each already retried) before a batch
+# is given up on; its id stays on the job so it can be resumed
+MAX_BATCH_POLL_FAILURES = 10
+
+
+def start_batch_enrichment_job(owner_id: int = 1, batch_ids: Optional[List[str]] = None) -> Tuple[str, bool]:
+    """
+    Start a batch enrichment job on its own thread, unless one is running.
+
+    Polling a batch can take up to 24h, so the job gets a dedicated thread
+    instead of a request worker. Pass batch_ids to resume collecting an
+    earlier job's batches (e.g. after a restart) instead of submitting anew.
+
+    Returns:
+        (job id, True) for a new job, or (running job's id, False)
+    """
+    global _active_batch_job
+    with _progress_lock:
+        if _active_batch_job is not None:
+            return _active_batch_job, False
+        job_id = str(uuid4())
+        _active_batch_job = job_id
+    _track_job(_new_progress(job_id, "queued"))
+    threading.Thread(
+        target=run_batch_enrichment_job,
+        args=(job_id, owner_id, batch_ids),
+        name=f"batch-enrichment-{job_id[:8]}",
+        daemon=True,
+    ).start()
+    return job_id, True
+
+
+def _pending_enrichment_rows(owner_id: int) -> List[Tuple]:
+    """(id, full_name, company, position) of imported entities never enriched."""
+    db = SessionLocal()
+    try:
+        # Imported entities are exactly the owner's connections; the owner
+        # row and rows from outside an import are left alone
+        imported = select(Connection.target_id).where(Connection.source_id == owner_id)
+        return (
+            db.query(Entity.id, Entity.full_name, Entity.company, Entity.position)
+            .filter(Entity.enriched_at.is_(None), Entity.id != owner_id, Entity.id.in_(imported))
+            .all()
+        )
+    finally:
+        db.close()
+
+
+def _wait_for_batch(batch_id: str) -> Dict[str, Dict]:
+    """Poll a submitted batch until it finishes, riding out transient errors."""
+    failures = 0
+    while True:
+        try:
+            results = fetch_enrichment_batch(batch_id)
+            failures = 0
+        except RETRIABLE_ERRORS as e:
+            failures += 1
+            if failures >= MAX_BATCH_POLL_FAILURES:
+                raise
+            log_error_with_context(logger, e, "Poll OpenAI batch", batch_id=batch_id, failures=failures)
+            results = None
+        if results is not None:
+            return results
+        time.sleep(settings.openai_batch_poll_interval)
+
+
+def run_batch_enrichment_job(
+    job_id: str,
+    owner_id: int = 1,
+    batch_ids: Optional[List[str]] = None,
+    batch_size: int = 1000,
+) -> None:
+    """
+    Enrich entities imported without AI data through the OpenAI Batch API.
+
+    Every imported entity with no enriched_at is submitted (unless batch_ids
+    resumes earlier batches), split into as many batches as OpenAI's limits
+    require. Each batch is polled until OpenAI finishes it (up to 24h) and
+    applied before the next one; no database session is held while waiting.
+    The rows then get their enrichment, a fresh embedding and their new role
+    in Neo4j. Entities the batches could not enrich keep enriched_at unset,
+    so the next run retries them.
+    """
+    global _active_batch_job
+    # Submitted batches not yet applied; what a resume needs after a failure
+    remaining: List[str] = list(batch_ids or [])
+    try:
+        progress = reset_progress(0, job_id)
+        with _progress_lock:
+            progress["batch_ids"] = list(remaining)
+
+        def on_submitted(batch_id: str) -> None:
+            remaining.append(batch_id)
+            with _progress_lock:
+                progress["batch_ids"].append(batch_id)
+
+        applied = 0
+        if not remaining:
+            pending = _pending_enrichment_rows(owner_id)
+            with _progress_lock:
+                progress["total"] = len(pending)
+            logger.info(f"Batch enrichment job started | Job: {job_id} | Pending entities: {len(pending)}")
+            _, resolved = submit_enrichment_batch(
+                [
+                    {"id": entity_id, "name": full_name, "company": company, "position": position}
+                    for entity_id, full_name, company, position in pending
+                ],
+                on_submitted=on_submitted,
+            )
+            logger.info(f"Submitted {len(remaining)} OpenAI batches | Job: {job_id}")
+            applied += _apply_all_enrichments(resolved, batch_size)
+
+        while remaining:
+            batch_id = remaining[0]
+            logger.info(f"Waiting for OpenAI batch {batch_id} | Job: {job_id} | Batches left: {len(remaining)}")
+            applied += _apply_all_enrichments(_wait_for_batch(batch_id), batch_size)
+            remaining.pop(0)
+
+        with _progress_lock:
+            progress["total"] = max(progress["total"], progress["enriched"])
+            stats = {"total": progress["total"], "enriched": applied, "errors": progress["total"] - applied}
+            progress["stats"] = stats
+            progress["status"] = "completed"
+        logger.info(
+            f"Batch enrichment job complete | Job: {job_id} | "
+            f"Enriched: {stats['enriched']} | Not enriched: {stats['errors']}"
+        )
+    except Exception as e:
+        log_error_with_context(logger, e, "Batch enrichment job", job_id=job_id, batch_ids=remaining)
+        if remaining:
+            resume = "&".join(f"batch_id={batch_id}" for batch_id in remaining)
+            e = RuntimeError(f"{e} (resume with /enrich-pending?{resume})")
+        _mark_job_failed(job_id, e)
+    finally:
+        with _progress_lock:
+            _active_batch_job = None
+        invalidate_search_cache()
+        invalidate_graph_cache()
+
+
+def _apply_all_enrichments(enrichments: Dict[str, Dict], batch_size: int) -> int:
+    """Apply enrichments keyed by str(entity id) in chunks; returns rows updated."""
+    update_progress(enriched=len(enrichments))
+    entity_ids = [int(custom_id) for custom_id in enrichments]
+    return sum(
+        _apply_enrichments(entity_ids[start:start + batch_size], enrichments)
+        for start in range(0, len(entity_ids), batch_size)
+    )
+
+
+def _apply_enrichments(entity_ids: List[int], enrichments: Dict[str, Dict]) -> int:
+    """
+    Store enrichments and re-embed one chunk of entities, in a fresh session.
+
+    Entities enriched meanwhile (or deleted) are left untouched, as are
+    ones whose embedding failed: they keep enriched_at unset so the next
+    run retries them. Returns the number of rows updated.
+    """
+    db = SessionLocal()
+    try:
+        rows = (
+            db.query(Entity.id, Entity.full_name, Entity.company, Entity.position)
+            .filter(Entity.id.in_(entity_ids), Entity.enriched_at.is_(None))
+            .all()
+        )
+        enriched = [
+            ({"id": entity_id, "full_name": full_name, "company": company, "position": position},
+             enrichments[str(entity_id)])
+            for entity_id, full_name, company, position in rows
+            if str(entity_id) in enrichments
+        ]
+        if not enriched:
+            return 0
+        embeddings = batch_generate_embeddings([
+            _embedding_text(entity, enrichment) for entity, enrichment in enriched
+        ])
+        embedded = [
+            (entity, enrichment, embedding)
+            for (entity, enrichment), embedding in zip(enriched, embeddings)
+            if embedding is not None
+        ]
+        if len(embedded) < len(enriched):
+            update_progress(error=f"Embedding failed for {len(enriched) - len(embedded)} entities; left pending")
+        enriched = [(entity, enrichment) for entity, enrichment, _ in embedded]
+        if not enriched:
+            return 0
+        enriched_at = datetime.utcnow()
+        # Bulk UPDATE by primary key, one executemany for the chunk
+        db.execute(update(Entity), [
+            {
+                "id": entity["id"],
+                "role": enrichment.get("role"),
+                "sector_focus": enrichment.get("sector_focus", []),
+                "stage_focus": enrichment.get("stage_focus", []),
+                "location": enrichment.get("location"),
+                "check_size_min": enrichment.get("check_size_min"),
+                "check_size_max": enrichment.get("check_size_max"),
+                "investment_thesis": enrichment.get("investment_thesis"),
+                "tags": enrichment.get("tags", []),
+                "embedding": embedding,
+                "confidence_score": enrichment.get("confidence", 0.0),
+                "enriched_at": enriched_at,
+            }
+            for entity, enrichment, embedding in embedded
+        ])
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+    update_progress(processed=len(enriched))
+
+    try:
+        neo4j_client.create_entity_nodes([
+            {
+                "entity_id": entity["id"],
+                "name": entity["full_name"],
+                "role": enrichment.get("role"),
+                "company": entity["company"],
+            }
+            for entity, enrichment in enriched
+        ])
+    except Exception as e:
+        log_error_with_context(logger, e, "Neo4j role update", nodes=len(enriched))
+        update_progress(error=f"Neo4j error: {str(e)}")
+    return len(enriched)
+
+
+def _process_window(
+    window: List[Dict[str, Optional[str]]],
+    db: Session,
+    stats: Dict[str, int],
+    owner_id: int,
+    skip_enrichment: bool,
+    max_workers: int,
+) -> None:
+    """Run the enrich/embed/insert/graph steps for one window of CSV rows."""
     # Step 1: Extract basic info and check for duplicates
     logger.info("Step 1: Extracting entity information...")
     entities_to_process = []
     existing_entities = {}
     
-    for idx, row in df.iterrows():
-        first_name = safe_str(row.get('First Name', '')) or ''
-        last_name = safe_str(row.get('Last Name', '')) or ''
-        full_name = f"{first_name} {last_name}".strip()
-        email = safe_str(row.get('Email Address'))
-        linkedin_url = safe_str(row.get('URL'))
-        company = safe_str(row.get('Company'))
-        position = safe_str(row.get('Position'))
+    # Normalize the window column-wise; rows from iter_linkedin_csv are already
+    # stripped with blanks as None, so only literal 'nan'/'none' remain to drop
+    frame = pd.DataFrame.from_records(window, columns=FAST_TEXT_COLUMNS)
+    for column in FAST_TEXT_COLUMNS:
+        values = frame[column].astype('string').str.strip()
+        frame[column] = values.mask(values.str.lower().isin(['nan', 'none', '']))
+    full_names = (frame['First Name'].fillna('') + ' ' + frame['Last Name'].fillna('')).str.strip()
+    connected_dates = parse_connected_on(frame['Connected On'])
+    frame = frame.astype(object).where(frame.notna(), None)
+    
+    # Prefetch duplicates for the whole window: two IN queries instead of two
+    # SELECTs per row
+    emails = set(frame['Email Address'].dropna())
+    urls = set(frame['URL'].dropna())
+    existing_by_email = (
+        {e.email: e for e in db.query(Entity).filter(Entity.email.in_(emails)).all()}
+        if emails else {}
+    )
+    existing_by_url = (
+        {e.linkedin_url: e for e in db.query(Entity).filter(Entity.linkedin_url.in_(urls)).all()}
+        if urls else {}
+    )
+    
+    window_emails = set()
+    window_urls = set()
+    rows = zip(window, frame.itertuples(index=False, name=None), full_names, connected_dates)
+    for idx, (row, values, full_name, connected_on) in enumerate(rows):
+        first_name, last_name, linkedin_url, email, company, position, _ = values
+        first_name = first_name or ''
+        last_name = last_name or ''
         
-        # Check if entity already exists
-        existing = None
-        if email:
-            existing = db.query(Entity).filter(Entity.email == email).first()
-        if not existing and linkedin_url:
-            existing = db.query(Entity).filter(Entity.linkedin_url == linkedin_url).first()
+        # Check if entity already exists, in the database or earlier in this window
+        existing = existing_by_email.get(email) or existing_by_url.get(linkedin_url)
         
         if existing:
             existing_entities[idx] = existing
             stats["skipped"] += 1
+        elif (email and email in window_emails) or (linkedin_url and linkedin_url in window_urls):
+            # A repeated contact would violate the unique email/URL
+            # constraints and fail the whole window's INSERT
+            stats["skipped"] += 1
         else:
+            if email:
+                window_emails.add(email)
+            if linkedin_url:
+                window_urls.add(linkedin_url)
             entities_to_process.append({
                 "idx": idx,
                 "first_name": first_name,
@@ -279,19 +805,20 @@ def process_linkedin_csv_fast(
                 "linkedin_url": linkedin_url,
                 "company": company,
                 "position": position,
+                "connected_on": None if pd.isna(connected_on) else connected_on,
                 "row": row,
             })
     
     logger.info(f"Entity extraction complete | Existing: {len(existing_entities)} | New: {len(entities_to_process)}")
     
     if len(entities_to_process) == 0:
-        logger.info("No new entities to process - all entities already exist")
-        _progress["status"] = "completed"
-        return stats
+        logger.info("No new entities in window - all entities already exist")
+        return
     
-    # Step 2: Parallel enrichment (if not skipped)
+    # Steps 2-3: Parallel enrichment, with embeddings generated as enrichments
+    # complete (both skipped in fast mode)
     if skip_enrichment:
-        logger.info("Step 2: SKIPPING enrichment (fast mode enabled)")
+        logger.info("Steps 2-3: SKIPPING enrichment and embeddings (fast mode enabled)")
         enrichments = [{
             "role": "other",
             "sector_focus": [],
@@ -303,221 +830,65 @@ def process_linkedin_csv_fast(
             "tags": [],
             "confidence": 0.0,
         }] * len(entities_to_process)
-    else:
-        logger.info(f"Step 2: Starting enrichment | Workers: {max_workers}")
-        with OperationTimer(logger, "Entity enrichment"):
-            entities_info = [
-                {
-                    "name": e["full_name"],
-                    "company": e["company"],
-                    "position": e["position"],
-                }
-                for e in entities_to_process
-            ]
-            enrichments = parallel_enrich_entities(entities_info, max_workers=max_workers)
-    
-    # Step 3: Create embedding texts and batch generate embeddings
-    if skip_enrichment:
-        logger.info("Step 3: SKIPPING embeddings (fast mode enabled)")
         embeddings = [None] * len(entities_to_process)
     else:
-        logger.info("Step 3: Preparing and generating embeddings...")
-        with OperationTimer(logger, "Embedding text preparation"):
-            embedding_texts = []
-            for entity, enrichment in zip(entities_to_process, enrichments):
-                entity_dict = {
-                    "full_name": entity["full_name"],
-                    "company": entity["company"],
-                    "position": entity["position"],
-                    "role": enrichment.get("role"),
-                    "sector_focus": enrichment.get("sector_focus", []),
-                    "stage_focus": enrichment.get("stage_focus", []),
-                    "investment_thesis": enrichment.get("investment_thesis"),
-                    "location": enrichment.get("location"),
-                }
-                embedding_texts.append(create_embedding_text(entity_dict))
-        
-        with OperationTimer(logger, "Batch embedding generation"):
-            embeddings = batch_generate_embeddings(embedding_texts)
+        logger.info(f"Steps 2-3: Enriching and embedding | Workers: {max_workers}")
+        enrichments, embeddings = _enrich_and_embed(entities_to_process, max_workers)
     
-    # Step 4: Batch create entities and connections
+    # Step 4: Bulk insert entities and connections
     logger.info("Step 4: Creating entities and connections in database...")
-    new_entities = []
-    connections_to_create = []
+    entity_rows = []
     neo4j_entities = []
-    neo4j_connections = []
-    
-    BATCH_SIZE = 100
-    logger.debug(f"Database batch size: {BATCH_SIZE}")
     
+    enriched_at = datetime.utcnow() if not skip_enrichment else None
     for entity_data, enrichment, embedding in zip(entities_to_process, enrichments, embeddings):
-        # Parse connection date
-        connected_on = None
-        connected_str = safe_str(entity_data["row"].get('Connected On'))
-        if connected_str:
-            try:
-                connected_on = pd.to_datetime(connected_str)
-            except:
-                pass
-        
-        # Convert row to dict for raw_data
-        raw_data = {}
-        for key, value in entity_data["row"].to_dict().items():
-            if pd.isna(value):
-                raw_data[key] = None
-            else:
-                raw_data[key] = value
-        
-        # Create entity
-        entity = Entity(
-            first_name=entity_data["first_name"],
-            last_name=entity_data["last_name"],
-            full_name=entity_data["full_name"],
-            email=entity_data["email"],
-            linkedin_url=entity_data["linkedin_url"],
-            company=entity_data["company"],
-            position=entity_data["position"],
-            connected_on=connected_on,
-            role=enrichment.get("role"),
-            sector_focus=enrichment.get("sector_focus", []),
-            stage_focus=enrichment.get("stage_focus", []),
-            location=enrichment.get("location"),
-            check_size_min=enrichment.get("check_size_min"),
-            check_size_max=enrichment.get("check_size_max"),
-            investment_thesis=enrichment.get("investment_thesis"),
-            tags=enrichment.get("tags", []),
-            embedding=embedding,
-            confidence_score=enrichment.get("confidence", 0.0),
-            enriched_at=datetime.utcnow() if not skip_enrichment else None,
-            raw_data=raw_data,
-        )
-        
-        # Use db.add() instead of appending to list
-        # This ensures SQLAlchemy tracks the object and assigns ID after flush
-        db.add(entity)
-        new_entities.append(entity)
-        
-        # Commit in batches
-        if len(new_entities) % BATCH_SIZE == 0:
-            # Flush to get IDs assigned
-            db.flush()
-            
-            # Now IDs are available - collect for Neo4j and create connections
-            for e in new_entities:
-                neo4j_entities.append({
-                    "entity_id": e.id,
-                    "name": e.full_name,
-                    "role": e.role,
-                    "company": e.company,
-                    "email": e.email or "",
-                    "linkedin_url": e.linkedin_url or "",
-                    "position": e.position or "",
-                })
-                neo4j_connections.append({
-                    "source_id": owner_id,
-                    "target_id": e.id,
-                })
-                
-                # Create connection in PostgreSQL
-                connection = Connection(
-                    source_id=owner_id,
-                    target_id=e.id,
-                    relationship_type="CONNECTED_TO",
-                    strength=1.0,
-                )
-                db.add(connection)
-            
-            db.commit()
-            stats["created"] += len(new_entities)
-            update_progress(processed=len(new_entities))
-            log_processing_progress(logger, stats['created'], len(entities_to_process), "Database commit")
-            new_entities = []
-    
-    # Final batch commit
-    if new_entities:
-        # Flush to get IDs assigned
-        db.flush()
-        
-        for e in new_entities:
-            neo4j_entities.append({
-                "entity_id": e.id,
-                "name": e.full_name,
-                "role": e.role,
-                "company": e.company,
-                "email": e.email or "",
-                "linkedin_url": e.linkedin_url or "",
-                "position": e.position or "",
-            })
-            neo4j_connections.append({
-                "source_id": owner_id,
-                "target_id": e.id,
-            })
-            
-            connection = Connection(
-                source_id=owner_id,
-                target_id=e.id,
-                relationship_type="CONNECTED_TO",
-                strength=1.0,
-            )
-            db.add(connection)
-        
-        db.commit()
-        stats["created"] += len(new_entities)
-        update_progress(processed=len(new_entities))
-        logger.info(f"Final commit complete | Total entities created: {stats['created']}")
-    
-    # Step 5: Batch create Neo4j nodes and relationships
-    logger.info(f"Step 5: Creating Neo4j graph | Nodes: {len(neo4j_entities)} | Relationships: {len(neo4j_connections)}")
+        entity_rows.append({
+            "first_name": entity_data["first_name"],
+            "last_name": entity_data["last_name"],
+            "full_name": entity_data["full_name"],
+            "email": entity_data["email"],
+            "linkedin_url": entity_data["linkedin_url"],
+            "company": entity_data["company"],
+            "position": entity_data["position"],
+            "connected_on": entity_data["connected_on"],
+            "role": enrichment.get("role"),
+            "sector_focus": enrichment.get("sector_focus", []),
+            "stage_focus": enrichment.get("stage_focus", []),
+            "location": enrichment.get("location"),
+            "check_size_min": enrichment.get("check_size_min"),
+            "check_size_max": enrichment.get("check_size_max"),
+            "investment_thesis": enrichment.get("investment_thesis"),
+            "tags": enrichment.get("tags", []),
+            "embedding": embedding,
+            "confidence_score": enrichment.get("confidence", 0.0),
+            "enriched_at": enriched_at,
+            "raw_data": extra_raw_data(entity_data["row"], entity_data["connected_on"]),
+        })
+    
+    # One multi-row INSERT ... RETURNING for the window instead of ORM add/flush per row
+    entity_ids = bulk_insert_entities(db, entity_rows, owner_id)
+    
+    # Collect for Neo4j now that IDs are available
+    for entity_id, row in zip(entity_ids, entity_rows):
+        neo4j_entities.append({
+            "entity_id": entity_id,
+            "name": row["full_name"],
+            "role": row["role"],
+            "company": row["company"],
+        })
+    
+    stats["created"] += len(entity_ids)
+    update_progress(processed=len(entity_ids))
+    logger.info(f"Database inserts complete | Window: {len(entity_ids)} | Total entities created: {stats['created']}")
+    
+    # Step 5: Batch create Neo4j nodes with their owner edges (one UNWIND query per 1000)
+    logger.info(f"Step 5: Creating Neo4j graph | Nodes: {len(neo4j_entities)}")
     try:
-        with OperationTimer(logger, "Neo4j node creation"):
-            for idx, neo4j_entity in enumerate(neo4j_entities):
-                neo4j_client.create_entity_node(
-                    entity_id=neo4j_entity["entity_id"],
-                    name=neo4j_entity["name"],
-                    role=neo4j_entity["role"],
-                    company=neo4j_entity["company"],
-                    properties={
-                        "email": neo4j_entity["email"],
-                        "linkedin_url": neo4j_entity["linkedin_url"],
-                        "position": neo4j_entity["position"],
-                    },
-                )
-                if (idx + 1) % 500 == 0:
-                    log_processing_progress(logger, idx + 1, len(neo4j_entities), "Neo4j nodes")
-        
-        with OperationTimer(logger, "Neo4j relationship creation"):
-            for idx, neo4j_conn in enumerate(neo4j_connections):
-                neo4j_client.create_connection(
-                    source_id=neo4j_conn["source_id"],
-                    target_id=neo4j_conn["target_id"],
-                    relationship_type="CONNECTED_TO",
-                    strength=1.0,
-                )
-                if (idx + 1) % 500 == 0:
-                    log_processing_progress(logger, idx + 1, len(neo4j_connections), "Neo4j relationships")
+        # All batches share one session and commit once
+        with OperationTimer(logger, "Neo4j graph write"), neo4j_client.batch_transaction() as tx:
+            neo4j_client.create_connected_entity_nodes(owner_id, neo4j_entities, tx=tx)
         
-        logger.info(f"✓ Neo4j graph created | Nodes: {len(neo4j_entities)} | Relationships: {len(neo4j_connections)}")
+        logger.info(f"✓ Neo4j graph created | Nodes: {len(neo4j_entities)}")
     except Exception as e:
-        log_error_with_context(logger, e, "Neo4j graph creation", 
-                              nodes=len(neo4j_entities), relationships=len(neo4j_connections))
+        log_error_with_context(logger, e, "Neo4j graph creation", nodes=len(neo4j_entities))
         update_progress(error=f"Neo4j error: {str(e)}")
-    
-    _progress["status"] = "completed"
-    
-    logger.info("=" * 80)
-    logger.info("PROCESSING COMPLETE")
-    logger.info(f"Total connections: {stats['total']}")
-    logger.info(f"Created: {stats['created']}")
-    logger.info(f"Skipped: {stats['skipped']}")
-    logger.info(f"Errors: {len(_progress['errors'])}")
-    
-    if _progress["start_time"]:
-        elapsed = time.time() - _progress["start_time"]
-        rate = stats['created'] / elapsed if elapsed > 0 else 0
-        logger.info(f"Processing time: {elapsed:.1f} seconds")
-        logger.info(f"Processing rate: {rate:.1f} entities/second")
-    
-    logger.info("=" * 80)
-    
-    return stats
-
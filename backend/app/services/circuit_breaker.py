@@ -0,0 +1,91 @@
+"""Circuit breaker that fails fast while a backing service is down."""
+from __future__ import annotations
+
+import functools
+import threading
+import time
+from typing import Callable, Tuple, Type
+
+from app.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a service whose circuit is open."""
+
+
+class CircuitBreaker:
+    """
+    Stop calling a service after `fail_max` consecutive failures.
+
+    While open, decorated calls raise CircuitOpenError immediately instead
+    of waiting on connection timeouts. After `reset_timeout` seconds one
+    trial call is let through: success closes the circuit, failure re-opens it.
+    Safe to share between threads.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        fail_max: int = 5,
+        reset_timeout: float = 30.0,
+        failure_types: Tuple[Type[Exception], ...] = (Exception,),
+    ) -> None:
+        self.name = name
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self.failure_types = failure_types
+        self.failures = 0
+        self.opened_at: float | None = None
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    def _before_call(self) -> bool:
+        """Raise if the circuit is open; returns whether this call is the trial."""
+        with self._lock:
+            if self.opened_at is None:
+                return False
+            if self._trial_running or time.monotonic() - self.opened_at < self.reset_timeout:
+                raise CircuitOpenError(f"{self.name} circuit is open")
+            self._trial_running = True
+            return True
+
+    def _on_success(self) -> None:
+        with self._lock:
+            if self.opened_at is not None:
+                logger.info(f"Circuit closed | Service: {self.name}")
+            self.failures = 0
+            self.opened_at = None
+            self._trial_running = False
+
+    def _on_failure(self, error: Exception) -> None:
+        with self._lock:
+            self.failures += 1
+            self._trial_running = False
+            if self.opened_at is not None or self.failures >= self.fail_max:
+                self.opened_at = time.monotonic()
+                logger.warning(
+                    f"Circuit opened | Service: {self.name} | Failures: {self.failures} | "
+                    f"Error type: {type(error).__name__} | Retry in: {self.reset_timeout:.0f}s"
+                )
+
+    def __call__(self, func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            trial = self._before_call()
+            try:
+                result = func(*args, **kwargs)
+            except self.failure_types as e:
+                self._on_failure(e)
+                raise
+            except BaseException:
+                # Unrelated errors say nothing about the service's health
+                if trial:
+                    with self._lock:
+                        self._trial_running = False
+                raise
+            self._on_success()
+            return result
+
+        return wrapper
@@ -1,56 +1,85 @@
 """CSV processing and entity creation."""
 from __future__ import annotations
 
+import asyncio
+import codecs
+import csv
 import io
-import sys
 from datetime import datetime
-from typing import BinaryIO, Dict, List
+from itertools import zip_longest
+from typing import BinaryIO, Dict, Iterator, List, Optional, Set
 
 import pandas as pd
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
-from app.services.enrichment import create_embedding_text, enrich_entity, generate_embedding
+from app.services.enrichment import create_embedding_text, enrich_many, generate_embeddings_batch
+from app.core.logging_config import get_logger
 from app.core.models import Connection, Entity
 from app.services.neo4j_client import neo4j_client
 
+logger = get_logger(__name__)
+
+# Expected columns from LinkedIn export
+EXPECTED_COLUMNS = frozenset({
+    'First Name', 'Last Name', 'URL', 'Email Address',
+    'Company', 'Position', 'Connected On'
+})
+
+
+def detect_csv_encoding(file_content: bytes, chunk_size: int = 1024 * 1024) -> str:
+    """
+    Pick the encoding for a CSV upload: UTF-8 if the bytes decode cleanly,
+    otherwise Latin-1 (which accepts any byte sequence).
+
+    Decodes incrementally so large uploads are not copied into one string.
+    """
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    view = memoryview(file_content)
+    try:
+        for start in range(0, len(view), chunk_size):
+            decoder.decode(view[start:start + chunk_size])
+        decoder.decode(b'', final=True)
+    except UnicodeDecodeError:
+        return 'latin-1'
+    return 'utf-8'
+
 
 def parse_linkedin_csv(file_content: bytes) -> pd.DataFrame:
     """Parse LinkedIn connections CSV file."""
     try:
-        # Try multiple parsing strategies
         df = None
         last_error = None
+        encoding = detect_csv_encoding(file_content)
+        
+        # Strategy 1: Standard CSV with the fast C engine. Every column is
+        # text, so dtype=str skips type inference (and keeps values such as
+        # numeric-looking names or zip codes verbatim)
+        try:
+            df = pd.read_csv(
+                io.BytesIO(file_content),
+                encoding=encoding,
+                dtype=str,
+                on_bad_lines='skip',  # Skip problematic lines
+            )
+        except Exception as e:
+            last_error = str(e)
         
-        # Strategy 1: Standard CSV with various encodings
-        for encoding in ['utf-8', 'utf-8-sig', 'latin-1', 'cp1252', 'iso-8859-1']:
+        # Strategy 2: Python engine with explicit delimiter and quoting
+        if df is None or df.empty:
             try:
                 df = pd.read_csv(
                     io.BytesIO(file_content),
                     encoding=encoding,
-                    on_bad_lines='skip',  # Skip problematic lines
-                    engine='python'  # Use python engine for more flexibility
+                    dtype=str,
+                    sep=',',
+                    quotechar='"',
+                    on_bad_lines='skip',
+                    engine='python',  # Use python engine for more flexibility
+                    skipinitialspace=True
                 )
-                break
-            except:
-                continue
-        
-        # Strategy 2: Try with explicit delimiter and quoting
-        if df is None or df.empty:
-            for encoding in ['utf-8', 'utf-8-sig', 'latin-1']:
-                try:
-                    df = pd.read_csv(
-                        io.BytesIO(file_content),
-                        encoding=encoding,
-                        sep=',',
-                        quotechar='"',
-                        on_bad_lines='skip',
-                        engine='python',
-                        skipinitialspace=True
-                    )
-                    break
-                except:
-                    last_error = str(sys.exc_info()[1])
-                    continue
+            except Exception as e:
+                last_error = str(e)
         
         if df is None or df.empty:
             raise ValueError(
@@ -62,27 +91,19 @@ def parse_linkedin_csv(file_content: bytes) -> pd.DataFrame:
                 f"Please use the sample_connections.csv as a template."
             )
         
-        # Clean up: remove completely empty rows
-        df = df.dropna(how='all')
-        
-        # Remove any rows where all values are empty strings
-        df = df[~df.apply(lambda x: x.astype(str).str.strip().eq('').all(), axis=1)]
+        # Clean up: remove rows where every value is missing or blank.
+        # Column-wise string ops keep this in pandas' C paths instead of
+        # calling a Python lambda once per row.
+        blank = df.isna() | df.apply(lambda col: col.astype(str).str.strip().eq(''))
+        df = df[~blank.all(axis=1)]
         
         # Strip whitespace from column names
         df.columns = df.columns.str.strip()
         
-        # Expected columns from LinkedIn export
-        expected_cols = {
-            'First Name', 'Last Name', 'URL', 'Email Address', 
-            'Company', 'Position', 'Connected On'
-        }
-        
         # Check if we have the required columns
-        actual_cols = set(df.columns)
-        missing_cols = expected_cols - actual_cols
-        
-        if missing_cols:
+        if not EXPECTED_COLUMNS.issubset(df.columns):
             # Provide helpful error message
+            missing_cols = set(EXPECTED_COLUMNS.difference(df.columns))
             raise ValueError(
                 f"CSV is missing required columns: {missing_cols}\n\n"
                 f"Found columns: {list(df.columns)}\n\n"
@@ -98,9 +119,8 @@ def parse_linkedin_csv(file_content: bytes) -> pd.DataFrame:
                 "CSV file has no data rows. Please ensure your file contains connection data."
             )
         
-        # Replace NaN values with None for proper JSON serialization
-        df = df.replace({pd.NA: None, pd.NaT: None})
-        df = df.where(pd.notnull(df), None)
+        # Replace NaN/NA/NaT values with None for proper JSON serialization
+        df = df.astype(object).where(df.notna(), None)
         
         return df
         
@@ -120,11 +140,111 @@ def parse_linkedin_csv(file_content: bytes) -> pd.DataFrame:
         )
 
 
-def process_connection_row(row: pd.Series, db: Session, owner_id: int = 1) -> Entity:
-    """Process a single row from LinkedIn connections CSV."""
+def _decode_lines(stream: BinaryIO) -> Iterator[str]:
+    """
+    Decode a binary CSV stream line by line.
+
+    Each line is decoded as UTF-8 and falls back to Latin-1 (which accepts
+    any byte sequence) on its own, so a non-UTF-8 byte deep into a large
+    export cannot fail the import after earlier windows were committed.
+    Line endings are kept so csv.reader still sees quoted newlines.
+    """
+    first = True
+    for raw in stream:
+        try:
+            line = raw.decode('utf-8')
+        except UnicodeDecodeError:
+            line = raw.decode('latin-1')
+        if first:
+            line = line.lstrip('\ufeff')
+            first = False
+        yield line
+
+
+def iter_linkedin_csv(stream: BinaryIO) -> Iterator[Dict[str, Optional[str]]]:
+    """
+    Stream rows from a LinkedIn connections CSV without loading the whole file.
+
+    Reads the binary stream line by line and yields one dict per non-blank
+    row, with whitespace-stripped values and blanks mapped to None. Lines are
+    UTF-8 (an optional BOM is dropped), falling back to Latin-1 per line.
+    """
+    text = _decode_lines(stream)
+    try:
+        reader = csv.reader(text)
+        header = next(reader, None)
+        columns = [column.strip() for column in header or []]
+
+        if not EXPECTED_COLUMNS.issubset(columns):
+            missing_cols = set(EXPECTED_COLUMNS.difference(columns))
+            raise ValueError(
+                f"CSV is missing required columns: {missing_cols}\n\n"
+                f"Found columns: {columns}\n\n"
+                f"Expected format (exact column names):\n"
+                f"First Name,Last Name,URL,Email Address,Company,Position,Connected On\n\n"
+                f"If your CSV has different column names, please rename them to match.\n"
+                f"Use backend/sample_connections.csv as a reference."
+            )
+
+        row_count = 0
+        for values in reader:
+            values = [value.strip() or None for value in values]
+            if not any(values):
+                continue
+            row_count += 1
+            # Short rows are padded with None, like pandas' NaN
+            yield dict(zip_longest(columns, values[:len(columns)]))
+
+        if row_count == 0:
+            raise ValueError(
+                "CSV file has no data rows. Please ensure your file contains connection data."
+            )
+    finally:
+        # Leave the caller's stream open; the upload owns it
+        text.close()
+
+
+def parse_connected_on(values: pd.Series) -> pd.Series:
+    """Parse a 'Connected On' column in one vectorized pass (NaT when unparseable)."""
+    # LinkedIn exports dates as "01 Jan 2024"; anything else falls back to
+    # per-value format inference
+    dates = pd.to_datetime(values, format='%d %b %Y', errors='coerce')
+    unparsed = dates.isna() & values.notna()
+    if unparsed.any():
+        dates[unparsed] = pd.to_datetime(values[unparsed], format='mixed', errors='coerce')
+    return dates
+
+
+def extra_raw_data(row: Dict, connected_on=None) -> Optional[Dict]:
+    """
+    CSV values not captured by typed Entity columns, or None if there are none.
+
+    Every LinkedIn column except an unparseable 'Connected On' already has a
+    typed home, so storing the whole row would duplicate the CSV in the table.
+    """
+    extra = {
+        column: value
+        for column, value in row.items()
+        if column not in EXPECTED_COLUMNS and value is not None
+    }
+    if pd.isna(connected_on) and row.get('Connected On') is not None:
+        extra['Connected On'] = row['Connected On']
+    return extra or None
+
+
+def process_connection_row(row: Dict, connected_on=None) -> Dict:
+    """
+    Extract the basic LinkedIn fields from a single CSV row.
+
+    ``row`` maps column names to values as produced by parse_linkedin_csv
+    (missing values are already None) and ``connected_on`` is the row's
+    value from parse_connected_on(). Returns a plain dict of entity column
+    values; enrichment and embedding are added later in batches by
+    process_linkedin_csv.
+    """
     # Helper function to safely extract string values
     def safe_str(value):
-        if value is None or pd.isna(value):
+        if value is None:
             return None
         val = str(value).strip()
         if val.lower() in ['nan', 'none', '']:
@@ -134,124 +254,109 @@ def process_connection_row(row: pd.Series, db: Session, owner_id: int = 1) -> En
     # Extract basic info
     first_name = safe_str(row.get('First Name', '')) or ''
     last_name = safe_str(row.get('Last Name', '')) or ''
-    full_name = f"{first_name} {last_name}".strip()
     email = safe_str(row.get('Email Address'))
     linkedin_url = safe_str(row.get('URL'))
     company = safe_str(row.get('Company'))
     position = safe_str(row.get('Position'))
     
-    # Parse connection date
-    connected_on = None
-    connected_str = safe_str(row.get('Connected On'))
-    if connected_str:
-        try:
-            connected_on = pd.to_datetime(connected_str)
-        except:
-            pass
-
-    # Check if entity already exists
-    existing = None
-    if email:
-        existing = db.query(Entity).filter(Entity.email == email).first()
-    if not existing and linkedin_url:
-        existing = db.query(Entity).filter(Entity.linkedin_url == linkedin_url).first()
-
-    if existing:
-        return existing
-
-    # Enrich with AI
-    enrichment_data = enrich_entity(full_name, company, position)
-    
-    # Create entity dict for embedding
-    entity_dict = {
-        "full_name": full_name,
+    return {
+        "first_name": first_name,
+        "last_name": last_name,
+        "full_name": f"{first_name} {last_name}".strip(),
+        "email": email,
+        "linkedin_url": linkedin_url,
         "company": company,
         "position": position,
-        "role": enrichment_data.get("role"),
-        "sector_focus": enrichment_data.get("sector_focus", []),
-        "stage_focus": enrichment_data.get("stage_focus", []),
-        "investment_thesis": enrichment_data.get("investment_thesis"),
-        "location": enrichment_data.get("location"),
+        "connected_on": None if pd.isna(connected_on) else connected_on.to_pydatetime(),
+        "raw_data": extra_raw_data(row, connected_on),
     }
-    
-    # Generate embedding
-    embedding_text = create_embedding_text(entity_dict)
-    embedding = generate_embedding(embedding_text)
-
-    # Convert row to dict and clean NaN values for JSON storage
-    raw_data = {}
-    for key, value in row.to_dict().items():
-        if pd.isna(value):
-            raw_data[key] = None
-        else:
-            raw_data[key] = value
-    
-    # Create entity
-    entity = Entity(
-        first_name=first_name,
-        last_name=last_name,
-        full_name=full_name,
-        email=email,
-        linkedin_url=linkedin_url,
-        company=company,
-        position=position,
-        connected_on=connected_on,
-        role=enrichment_data.get("role"),
-        sector_focus=enrichment_data.get("sector_focus", []),
-        stage_focus=enrichment_data.get("stage_focus", []),
-        location=enrichment_data.get("location"),
-        check_size_min=enrichment_data.get("check_size_min"),
-        check_size_max=enrichment_data.get("check_size_max"),
-        investment_thesis=enrichment_data.get("investment_thesis"),
-        tags=enrichment_data.get("tags", []),
-        embedding=embedding,
-        confidence_score=enrichment_data.get("confidence", 0.0),
-        enriched_at=datetime.utcnow(),
-        raw_data=raw_data,
-    )
 
-    db.add(entity)
-    db.flush()  # Get the ID
-
-    # Add to Neo4j
-    neo4j_client.create_entity_node(
-        entity_id=entity.id,
-        name=full_name,
-        role=entity.role,
-        company=company,
-        properties={
-            "email": email or "",
-            "linkedin_url": linkedin_url or "",
-            "position": position or "",
-        },
-    )
 
-    # Create connection from owner to this entity
-    connection = Connection(
-        source_id=owner_id,
-        target_id=entity.id,
-        relationship_type="CONNECTED_TO",
-        strength=1.0,
-    )
-    db.add(connection)
-
-    # Add connection to Neo4j
-    neo4j_client.create_connection(
-        source_id=owner_id,
-        target_id=entity.id,
-        relationship_type="CONNECTED_TO",
-        strength=1.0,
+def _load_existing_keys(db: Session) -> Set[str]:
+    """Load every stored email and LinkedIn URL for in-memory duplicate checks."""
+    rows = db.query(Entity.email, Entity.linkedin_url).filter(
+        Entity.email.isnot(None) | Entity.linkedin_url.isnot(None)
+    ).all()
+
+    existing = set()
+    for email, linkedin_url in rows:
+        if email:
+            existing.add(email)
+        if linkedin_url:
+            existing.add(linkedin_url)
+    return existing
+
+
+def bulk_insert_entities(db: Session, rows: List[Dict], owner_id: int) -> List[int]:
+    """
+    Insert a batch of entity rows plus owner connections and commit.
+
+    Returns the new entity ids in row order.
+    """
+    # One multi-row INSERT ... RETURNING instead of an ORM add/flush per row
+    entity_ids = db.scalars(
+        insert(Entity).returning(Entity.id, sort_by_parameter_order=True),
+        rows,
+    ).all()
+
+    db.execute(
+        insert(Connection),
+        [
+            {
+                "source_id": owner_id,
+                "target_id": entity_id,
+                "relationship_type": "CONNECTED_TO",
+                "strength": 1.0,
+            }
+            for entity_id in entity_ids
+        ],
     )
+    db.commit()
 
-    return entity
+    return list(entity_ids)
+
+
+def _insert_entities(db: Session, rows: List[Dict], owner_id: int) -> int:
+    """Insert a batch of entity rows plus owner connections; returns rows inserted."""
+    entity_ids = bulk_insert_entities(db, rows, owner_id)
+
+    # Add nodes and owner connections to Neo4j in one transaction
+    try:
+        with neo4j_client.batch_transaction() as tx:
+            neo4j_client.create_connected_entity_nodes(
+                owner_id,
+                [
+                    {
+                        "entity_id": entity_id,
+                        "name": row["full_name"],
+                        "role": row["role"],
+                        "company": row["company"],
+                    }
+                    for entity_id, row in zip(entity_ids, rows)
+                ],
+                tx=tx,
+            )
+    except Exception as e:
+        logger.error(f"Error writing Neo4j graph: {e}")
+
+    return len(entity_ids)
 
 
 def process_linkedin_csv(
     file_content: bytes,
     db: Session,
     owner_id: int = 1,
+    batch_size: int = 100,
+    max_workers: int = 10,
 ) -> Dict[str, int]:
-    """Process LinkedIn connections CSV and create entities."""
+    """
+    Process LinkedIn connections CSV and create entities.
+
+    Runs in three phases so no per-row round-trips remain:
+    1. Extract rows and drop existing connections against preloaded keys
+    2. Enrich concurrently and generate embeddings in batched requests
+    3. Bulk insert entities and connections
+    """
     df = parse_linkedin_csv(file_content)
     
     stats = {
@@ -261,17 +366,87 @@ def process_linkedin_csv(
         "errors": 0,
     }
 
-    for idx, row in df.iterrows():
+    # Phase 1: extract rows and skip connections that already exist
+    # Plain tuples instead of iterrows(), which boxes every row into a Series
+    columns = list(df.columns)
+    connected_dates = parse_connected_on(df['Connected On'])
+    candidates = []
+    rows = zip(df.index, df.itertuples(index=False, name=None), connected_dates)
+    for idx, values, connected_on in rows:
         try:
-            entity = process_connection_row(row, db, owner_id)
-            if entity:
-                stats["created"] += 1
-            else:
-                stats["skipped"] += 1
+            candidates.append(process_connection_row(dict(zip(columns, values)), connected_on))
         except Exception as e:
-            print(f"Error processing row {idx}: {e}")
+            logger.warning(f"Error processing row {idx}: {e}")
             stats["errors"] += 1
 
-    db.commit()
-    return stats
+    # Two narrow columns loaded once; membership tests then stay in Python and
+    # avoid an IN list with one bind parameter per row.
+    seen = _load_existing_keys(db)
 
+    new_rows = []
+    for candidate in candidates:
+        email = candidate["email"]
+        linkedin_url = candidate["linkedin_url"]
+        if (email and email in seen) or (linkedin_url and linkedin_url in seen):
+            stats["skipped"] += 1
+            continue
+        if email:
+            seen.add(email)
+        if linkedin_url:
+            seen.add(linkedin_url)
+        new_rows.append(candidate)
+
+    if not new_rows:
+        return stats
+
+    # Phase 2: enrich with AI (concurrent async requests over one client),
+    # then embed every entity in batched requests
+    enrichments = asyncio.run(enrich_many(
+        [
+            {"name": r["full_name"], "company": r["company"], "position": r["position"]}
+            for r in new_rows
+        ],
+        max_workers=max_workers,
+    ))
+
+    embedding_texts = []
+    for entity_row, enrichment_data in zip(new_rows, enrichments):
+        embedding_texts.append(create_embedding_text({
+            "full_name": entity_row["full_name"],
+            "company": entity_row["company"],
+            "position": entity_row["position"],
+            "role": enrichment_data.get("role"),
+            "sector_focus": enrichment_data.get("sector_focus", []),
+            "stage_focus": enrichment_data.get("stage_focus", []),
+            "investment_thesis": enrichment_data.get("investment_thesis"),
+            "location": enrichment_data.get("location"),
+        }))
+    embeddings = generate_embeddings_batch(embedding_texts)
+
+    enriched_at = datetime.utcnow()
+    for entity_row, enrichment_data, embedding in zip(new_rows, enrichments, embeddings):
+        entity_row.update({
+            "role": enrichment_data.get("role"),
+            "sector_focus": enrichment_data.get("sector_focus", []),
+            "stage_focus": enrichment_data.get("stage_focus", []),
+            "location": enrichment_data.get("location"),
+            "check_size_min": enrichment_data.get("check_size_min"),
+            "check_size_max": enrichment_data.get("check_size_max"),
+            "investment_thesis": enrichment_data.get("investment_thesis"),
+            "tags": enrichment_data.get("tags", []),
+            "embedding": embedding,
+            "confidence_score": enrichment_data.get("confidence", 0.0),
+            "enriched_at": enriched_at,
+        })
+
+    # Phase 3: bulk insert in batches
+    for start in range(0, len(new_rows), batch_size):
+        batch = new_rows[start:start + batch_size]
+        try:
+            stats["created"] += _insert_entities(db, batch, owner_id)
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Error inserting batch of {len(batch)} rows: {e}")
+            stats["errors"] += len(batch)
+
+    return stats
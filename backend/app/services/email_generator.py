@@ -4,21 +4,19 @@ from __future__ import annotations
 import json
 from typing import Dict, List, Optional
 
-import openai
-
 from app.core.config import settings
 from app.core.logging_config import get_logger, log_api_call, log_error_with_context
 from app.core.models import Entity
+from app.services.enrichment import create_chat_completion
 from app.services.prompts.email_prompts import (
     CASUAL_EMAIL_PROMPT,
     EMAIL_SYSTEM_PROMPT,
+    EMAIL_TONE_GUIDELINES,
     ENTHUSIASTIC_EMAIL_PROMPT,
     FORMAL_EMAIL_PROMPT,
+    MULTI_TONE_EMAIL_PROMPT,
 )
 
-# Initialize OpenAI
-openai.api_key = settings.openai_api_key
-
 logger = get_logger(__name__)
 
 
@@ -122,6 +120,7 @@ def generate_intro_email(
     intro_path: List[Dict],
     mutual_connections: List[Dict],
     tone: str = "formal",
+    context: Optional[Dict[str, str]] = None,
 ) -> Dict[str, str]:
     """
     Generate a warm introduction email.
@@ -134,6 +133,7 @@ def generate_intro_email(
         intro_path: Introduction path nodes
         mutual_connections: List of mutual connections
         tone: Email tone (formal, casual, enthusiastic)
+        context: Prebuilt _build_email_context() result, shared across tones
     
     Returns:
         Dict with 'subject' and 'body' keys
@@ -145,10 +145,11 @@ def generate_intro_email(
         }
     
     # Build context
-    context = _build_email_context(
-        founder, investor, match_factors, match_score,
-        intro_path, mutual_connections
-    )
+    if context is None:
+        context = _build_email_context(
+            founder, investor, match_factors, match_score,
+            intro_path, mutual_connections
+        )
     
     # Select prompt based on tone
     prompt_template = FORMAL_EMAIL_PROMPT
@@ -158,20 +159,21 @@ def generate_intro_email(
         prompt_template = ENTHUSIASTIC_EMAIL_PROMPT
     
     # Format prompt with context
-    prompt = prompt_template.format(**context)
+    prompt = prompt_template.format_map(context)
     
     try:
         logger.info(f"Generating email | Tone: {tone} | Founder: {founder.full_name} | Investor: {investor.full_name}")
         
-        response = openai.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
+        response = create_chat_completion({
+            "model": "gpt-4o-mini",
+            "messages": [
                 {"role": "system", "content": EMAIL_SYSTEM_PROMPT},
                 {"role": "user", "content": prompt}
             ],
-            temperature=0.7,  # Higher temperature for natural variation
-            max_tokens=800,
-        )
+            "temperature": 0.7,  # Higher temperature for natural variation
+            "max_tokens": 800,
+            "response_format": {"type": "json_object"},
+        })
         
         log_api_call(logger, "OpenAI", "chat.completions.create",
                     model="gpt-4o-mini", tone=tone, status="success")
@@ -181,15 +183,9 @@ def generate_intro_email(
         # Default subject in case parsing fails
         default_subject = f"Introduction: {founder.full_name} → {investor.full_name}"
 
-        # Extract JSON payload if model wraps it in code fences
-        json_payload = raw_content
-        if "```json" in raw_content:
-            json_payload = raw_content.split("```json", 1)[1].split("```", 1)[0].strip()
-        elif "```" in raw_content:
-            json_payload = raw_content.split("```", 1)[1].split("```", 1)[0].strip()
-
+        # JSON mode guarantees an object, so no code-fence stripping is needed
         try:
-            email_data = json.loads(json_payload)
+            email_data = json.loads(raw_content)
         except json.JSONDecodeError:
             logger.warning("Failed to parse JSON email response - using raw content")
             email_data = {
@@ -228,9 +224,10 @@ def generate_multiple_emails(
     """
     Generate a dictionary of email drafts keyed by tone.
 
-    The logic is intentionally straightforward: loop through the requested tones,
-    call `generate_intro_email` once per tone, and keep only the email body because
-    the UI currently displays just the draft text.
+    All known tones are written by one chat request that shares the context,
+    instead of paying for the same prompt once per tone. Tones the combined
+    answer is missing (or unknown tones) fall back to `generate_intro_email`.
+    Only the email body is kept because the UI displays just the draft text.
     """
     if tones is None:
         tones = ["formal", "casual", "enthusiastic"]
@@ -238,8 +235,18 @@ def generate_multiple_emails(
     logger.info(f"Generating multiple emails | Tones: {', '.join(tones)} | Founder: {founder.full_name} | Investor: {investor.full_name}")
     
     email_drafts: Dict[str, str] = {}
+    # Built once and shared by the combined request and any per-tone fallback
+    context = _build_email_context(
+        founder, investor, match_factors, match_score,
+        intro_path, mutual_connections
+    )
+    combined_tones = [tone for tone in tones if tone.lower() in EMAIL_TONE_GUIDELINES]
+    if settings.openai_api_key and len(combined_tones) > 1:
+        email_drafts.update(_generate_combined_emails(founder, investor, context, combined_tones))
 
     for tone in tones:
+        if tone in email_drafts:
+            continue
         email = generate_intro_email(
             founder=founder,
             investor=investor,
@@ -248,8 +255,53 @@ def generate_multiple_emails(
             intro_path=intro_path,
             mutual_connections=mutual_connections,
             tone=tone,
+            context=context,
         )
         email_drafts[tone] = email["body"]
 
     logger.info(f"Generated {len(email_drafts)} email variants")
-    return email_drafts
+    return {tone: email_drafts[tone] for tone in tones}
+
+
+def _generate_combined_emails(
+    founder: Entity,
+    investor: Entity,
+    context: Dict[str, str],
+    tones: List[str],
+) -> Dict[str, str]:
+    """Email bodies for several tones from one JSON-mode request ({} on failure)."""
+    prompt = MULTI_TONE_EMAIL_PROMPT.format_map({
+        **context,
+        "tone_instructions": "\n".join(f"- {tone}: {EMAIL_TONE_GUIDELINES[tone.lower()]}" for tone in tones),
+        "tone_keys": ", ".join(f'"{tone}"' for tone in tones),
+    })
+
+    try:
+        response = create_chat_completion({
+            "model": "gpt-4o-mini",
+            "messages": [
+                {"role": "system", "content": EMAIL_SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ],
+            "temperature": 0.7,
+            "max_tokens": 800 * len(tones),
+            "response_format": {"type": "json_object"},
+        })
+        log_api_call(logger, "OpenAI", "chat.completions.create",
+                    model="gpt-4o-mini", tones=len(tones), status="success")
+        data = json.loads(response.choices[0].message.content)
+    except Exception as e:
+        log_error_with_context(logger, e, "Generate combined emails",
+                              founder=founder.full_name, investor=investor.full_name)
+        return {}
+
+    if not isinstance(data, dict):
+        return {}
+    drafts = {}
+    for tone in tones:
+        email = data.get(tone)
+        if isinstance(email, dict) and isinstance(email.get("body"), str) and email["body"].strip():
+            drafts[tone] = email["body"]
+    if len(drafts) < len(tones):
+        logger.warning(f"Combined email answer missed tones | Got: {len(drafts)}/{len(tones)}")
+    return drafts
@@ -1,39 +1,410 @@
 """AI-powered enrichment using OpenAI for entity classification and tagging."""
 from __future__ import annotations
 
+import asyncio
 import json
-from typing import Dict, List, Optional
+import re
+import weakref
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import AsyncIterator, Callable, Dict, List, Optional, Tuple
 
-import openai
+from openai import AsyncOpenAI, OpenAI
 
 from app.core.config import settings
 from app.core.logging_config import get_logger, log_api_call, log_error_with_context
+from app.services.enrichment_cache import (
+    embedding_cache,
+    embedding_key,
+    enrichment_cache,
+    enrichment_key,
+)
 from app.services.prompts import ENRICHMENT_PROMPT, SYSTEM_PROMPT
+from app.services.rate_limiter import RateLimiter, estimate_tokens
+from app.services.retry import RETRIABLE_ERRORS, retry_with_backoff
 
-# Initialize OpenAI client
-openai.api_key = settings.openai_api_key
+# Shared throttles so concurrent callers stay under the account limits
+chat_rate_limiter = RateLimiter(settings.openai_chat_rpm, settings.openai_chat_tpm)
+embedding_rate_limiter = RateLimiter(settings.openai_embedding_rpm, settings.openai_embedding_tpm)
 
 logger = get_logger(__name__)
 
+ENRICHMENT_MODEL = "gpt-4o-mini"
+EMBEDDING_MODEL = "text-embedding-3-large"
+EMBEDDING_DIMENSIONS = 1536
+OPENAI_TIMEOUT = 60.0
+# Entities per enrichment request: ~300 completion tokens each keeps a batch
+# well inside the model's output limit while cutting request count 8x
+ENRICHMENT_BATCH_SIZE = 8
+
+
+@lru_cache(maxsize=1)
+def get_openai_client() -> OpenAI:
+    """
+    Return the process-wide OpenAI client.
+
+    Its keep-alive connection pool is shared by every thread, so requests
+    reuse TCP/TLS connections. Retries are handled by retry_with_backoff.
+    """
+    return OpenAI(api_key=settings.openai_api_key, max_retries=0, timeout=OPENAI_TIMEOUT)
+
+
+def close_openai_client() -> None:
+    """Close the shared OpenAI client's connections, if it was ever created."""
+    if get_openai_client.cache_info().currsize:
+        get_openai_client().close()
+        get_openai_client.cache_clear()
+
+
+# One AsyncOpenAI client per event loop, with the number of enrich_many calls
+# using it. An async client's connection pool is bound to the loop it runs
+# on, so it cannot be shared process-wide like the sync client.
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, List]" = weakref.WeakKeyDictionary()
+
+
+@asynccontextmanager
+async def async_openai_client() -> AsyncIterator[AsyncOpenAI]:
+    """
+    Yield the running event loop's shared AsyncOpenAI client.
+
+    Concurrent users on the same loop share one keep-alive pool. The client
+    is closed when its last user exits, because each import runs in its own
+    asyncio.run() and the loop (with any open sockets) is discarded after.
+    """
+    loop = asyncio.get_running_loop()
+    entry = _async_clients.get(loop)
+    if entry is None:
+        client = AsyncOpenAI(api_key=settings.openai_api_key, max_retries=0, timeout=OPENAI_TIMEOUT)
+        entry = _async_clients[loop] = [client, 0]
+    entry[1] += 1
+    try:
+        yield entry[0]
+    finally:
+        entry[1] -= 1
+        if entry[1] == 0:
+            del _async_clients[loop]
+            await entry[0].close()
+
+
+@retry_with_backoff()
+def request_embeddings(texts: List[str]):
+    """Send one rate-limited embeddings request for a batch of non-empty texts."""
+    estimated_tokens = sum(estimate_tokens(text) for text in texts)
+    embedding_rate_limiter.acquire_blocking(estimated_tokens)
+    response = get_openai_client().embeddings.create(
+        model=EMBEDDING_MODEL,
+        input=texts,
+        dimensions=EMBEDDING_DIMENSIONS,
+    )
+    embedding_rate_limiter.reconcile(estimated_tokens, response.usage)
+    return response
+
+
+def embeddings_in_order(response) -> List[List[float]]:
+    """Vectors from an embeddings response, ordered like the request's inputs."""
+    return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+
+
+def embed_bisect(texts: List[str]) -> List[Optional[List[float]]]:
+    """
+    Embed texts whose combined request was rejected, halving on each failure.
+
+    A rejected batch usually holds one bad input; bisecting isolates it in
+    ~2*log2(n) requests instead of one request per text. Halves that fail
+    with a retriable error (after request_embeddings' own retries) are given
+    up rather than split further.
+    """
+    if len(texts) == 1:
+        return [None]
+    mid = len(texts) // 2
+    embeddings: List[Optional[List[float]]] = []
+    for half in (texts[:mid], texts[mid:]):
+        try:
+            embeddings.extend(embeddings_in_order(request_embeddings(half)))
+        except RETRIABLE_ERRORS:
+            embeddings.extend([None] * len(half))
+        except Exception:
+            embeddings.extend(embed_bisect(half))
+    return embeddings
+
+
+def get_cached_embedding(text: str) -> Optional[List[float]]:
+    """Return a previously generated embedding for text, if cached."""
+    return embedding_cache.get(embedding_key(EMBEDDING_MODEL, EMBEDDING_DIMENSIONS, text))
+
+
+def cache_embedding(text: str, embedding: List[float]) -> None:
+    """Remember the embedding generated for text."""
+    embedding_cache.set(embedding_key(EMBEDDING_MODEL, EMBEDDING_DIMENSIONS, text), embedding)
+
 
 def generate_embedding(text: str) -> Optional[List[float]]:
     """Generate embedding vector for text using OpenAI."""
+    return generate_embeddings_batch([text])[0]
+
+
+def generate_embeddings_batch(
+    texts: List[str],
+    batch_size: int = 2000,
+) -> List[Optional[List[float]]]:
+    """
+    Generate embeddings for many texts, sending one OpenAI request per batch.
+
+    OpenAI accepts up to 2048 inputs per request, so a whole upload usually
+    needs only a handful of round-trips.
+
+    Results are returned in input order; an entry is None when its text is
+    empty or could not be embedded. A rejected batch is bisected so only the
+    offending texts come back as None. Previously embedded texts are served
+    from the cache without an API call.
+    """
+    embeddings: List[Optional[List[float]]] = [None] * len(texts)
     if not settings.openai_api_key:
         logger.warning("No OpenAI API key configured - skipping embedding generation")
+        return embeddings
+
+    # The API rejects empty strings, so only send texts that have content
+    # and are not cached yet
+    indices = []
+    for i, text in enumerate(texts):
+        if not text:
+            continue
+        embeddings[i] = get_cached_embedding(text)
+        if embeddings[i] is None:
+            indices.append(i)
+
+    for start in range(0, len(indices), batch_size):
+        batch_indices = indices[start:start + batch_size]
+        batch = [texts[i] for i in batch_indices]
+        try:
+            batch_embeddings = embeddings_in_order(request_embeddings(batch))
+            log_api_call(logger, "OpenAI", "embeddings.create",
+                        model=EMBEDDING_MODEL, count=len(batch_indices), status="success")
+        except RETRIABLE_ERRORS as e:
+            log_error_with_context(logger, e, "Generate embeddings batch", count=len(batch_indices))
+            continue
+        except Exception as e:
+            # One bad input rejects the whole request; isolate it so the
+            # rest of the batch still gets vectors
+            log_error_with_context(logger, e, "Generate embeddings batch", count=len(batch_indices))
+            batch_embeddings = embed_bisect(batch)
+
+        for i, embedding in zip(batch_indices, batch_embeddings):
+            embeddings[i] = embedding
+            if embedding is not None:
+                cache_embedding(texts[i], embedding)
+
+    return embeddings
+
+
+# Enrichment used when the LLM is unavailable, its answer is unusable, or
+# there is nothing to classify; built once and copied per entity
+_EMPTY_ENRICHMENT = {
+    "role": "other",
+    "sector_focus": [],
+    "stage_focus": [],
+    "check_size_min": None,
+    "check_size_max": None,
+    "investment_thesis": None,
+    "location": None,
+    "tags": [],
+    "confidence": 0.0,
+}
+
+# Company and position together shorter than this (e.g. "-" and "N/A"
+# pieces) carry too little to classify
+MIN_ENRICHMENT_INPUT_LENGTH = 8
+
+
+def _default_enrichment() -> Dict:
+    """Copy of the empty enrichment stub."""
+    return dict(_EMPTY_ENRICHMENT)
+
+
+def _normalize_enrichment(data: Dict) -> Dict:
+    """Lowercase and strip sector/stage values so filters can match them exactly."""
+    for field in ("sector_focus", "stage_focus"):
+        values = data.get(field)
+        if isinstance(values, list):
+            data[field] = [value.strip().lower() for value in values if isinstance(value, str)]
+    return data
+
+
+def _can_enrich(company: Optional[str], position: Optional[str]) -> bool:
+    """
+    Whether the LLM has enough to work with beyond the person's name.
+
+    Only consulted for rows without a venture signal. Those need both company
+    and position; with either missing the answer is almost always "other"
+    with nothing extracted.
+    """
+    company = (company or "").strip()
+    position = (position or "").strip()
+    return bool(company and position) and len(company + position) >= MIN_ENRICHMENT_INPUT_LENGTH
+
+
+# Any venture signal in the position or company sends the row to the LLM,
+# which also extracts the sector/stage/check-size data matching relies on
+_VENTURE_RE = re.compile(
+    r"\b(co-?founder|founder|founding|ceo|cto|owner|entrepreneur|ventures?|capital|"
+    r"partners?|vc|funds?|invest\w*|angel|principal|associate|managing director|"
+    r"accelerator|incubator|advisor|board)\b",
+    re.IGNORECASE,
+)
+# Job titles that are "other" whenever no venture signal is present
+_OTHER_TITLE_RE = re.compile(
+    r"\b(software|engineer(ing)?|developer|programmer|designer|data scientist|"
+    r"student|intern|recruiter|talent acquisition|hr|human resources|teacher|"
+    r"professor|lecturer|nurse|physician|accountant|sales|marketing|"
+    r"account executive|customer success|support|project manager|product manager)\b",
+    re.IGNORECASE,
+)
+RULE_CONFIDENCE = 0.9
+
+
+def _local_enrichment(company: Optional[str], position: Optional[str]) -> Optional[Dict]:
+    """
+    Enrichment that can be decided without the LLM, or None.
+
+    Any venture signal (e.g. "Angel Investor" with no company) goes to the
+    LLM. Without one, rows with too little detail get the empty stub and
+    ordinary job titles (e.g. "Software Engineer at Acme") are classified
+    "other" by pattern, as the LLM has nothing more to extract for them.
+    """
+    if _VENTURE_RE.search(f"{position or ''} {company or ''}"):
         return None
+    if not _can_enrich(company, position):
+        return _default_enrichment()
+    if _OTHER_TITLE_RE.search(position):
+        enrichment = _default_enrichment()
+        enrichment["confidence"] = RULE_CONFIDENCE
+        return enrichment
+    return None
 
-    try:
-        response = openai.embeddings.create(
-            model="text-embedding-3-large",
-            input=text,
-            dimensions=1536,
-        )
-        log_api_call(logger, "OpenAI", "embeddings.create",
-                    model="text-embedding-3-large", text_length=len(text), status="success")
-        return response.data[0].embedding
-    except Exception as e:
-        log_error_with_context(logger, e, "Generate embedding", text_length=len(text))
+
+# Identical for every request, so it is built once and forms a stable
+# prompt prefix that OpenAI can serve from its prompt cache
+_ENRICHMENT_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": f"{SYSTEM_PROMPT}\n\n{ENRICHMENT_PROMPT}",
+}
+
+
+def _enrichment_request(
+    name: str,
+    company: Optional[str],
+    position: Optional[str],
+) -> Dict:
+    """Build the chat completion arguments for enriching one entity."""
+    prompt = (
+        f"Input:\n"
+        f"- Name: {name}\n"
+        f"- Company: {company or 'Unknown'}\n"
+        f"- Position: {position or 'Unknown'}"
+    )
+    return {
+        "model": ENRICHMENT_MODEL,
+        "messages": [_ENRICHMENT_SYSTEM_MESSAGE, {"role": "user", "content": prompt}],
+        "temperature": 0.3,
+        # A complete answer is ~150 tokens; the cap only stops runaway output
+        "max_tokens": 300,
+        # JSON mode guarantees a bare JSON object (no markdown fences)
+        "response_format": {"type": "json_object"},
+    }
+
+
+def _batch_enrichment_request(people: List[Dict]) -> Dict:
+    """Build the chat completion arguments for enriching several entities at once."""
+    lines = [
+        f"{number}) Name: {person['name']} | "
+        f"Company: {person.get('company') or 'Unknown'} | "
+        f"Position: {person.get('position') or 'Unknown'}"
+        for number, person in enumerate(people, start=1)
+    ]
+    prompt = (
+        f"Classify each of the following {len(people)} people. Respond with a JSON "
+        f'object {{"results": [...]}} holding exactly {len(people)} objects in the '
+        f"format above, in the same order as the input.\n\n"
+        f"Input:\n" + "\n".join(lines)
+    )
+    return {
+        "model": ENRICHMENT_MODEL,
+        "messages": [_ENRICHMENT_SYSTEM_MESSAGE, {"role": "user", "content": prompt}],
+        "temperature": 0.3,
+        "max_tokens": 300 * len(people),
+        "response_format": {"type": "json_object"},
+    }
+
+
+def _parse_batch_enrichments(content: str, count: int) -> Optional[List[Dict]]:
+    """Extract `count` enrichments from a batch response, or None if malformed."""
+    results = json.loads(content).get("results")
+    if not isinstance(results, list) or len(results) != count:
+        return None
+    if not all(isinstance(result, dict) for result in results):
         return None
+    return [_normalize_enrichment(result) for result in results]
+
+
+def _estimate_request_tokens(request: Dict) -> int:
+    """Prompt tokens plus the completion budget of a chat request."""
+    prompt_tokens = sum(estimate_tokens(message["content"]) for message in request["messages"])
+    return prompt_tokens + request["max_tokens"]
+
+
+@retry_with_backoff()
+def create_chat_completion(request: Dict):
+    """Send one rate-limited chat completion request."""
+    estimated_tokens = _estimate_request_tokens(request)
+    chat_rate_limiter.acquire_blocking(estimated_tokens)
+    response = get_openai_client().chat.completions.create(**request)
+    chat_rate_limiter.reconcile(estimated_tokens, response.usage)
+    return response
+
+
+@retry_with_backoff()
+async def create_chat_completion_async(
+    client: AsyncOpenAI,
+    semaphore: asyncio.Semaphore,
+    request: Dict,
+):
+    """Async variant of create_chat_completion; holds a semaphore slot only while calling."""
+    estimated_tokens = _estimate_request_tokens(request)
+    async with semaphore:
+        await chat_rate_limiter.acquire(estimated_tokens)
+        response = await client.chat.completions.create(**request)
+    chat_rate_limiter.reconcile(estimated_tokens, response.usage)
+    return response
+
+
+def _cached_or_local_enrichment(
+    name: str,
+    company: Optional[str],
+    position: Optional[str],
+) -> Optional[Dict]:
+    """Return the enrichment if it needs no request, else None."""
+    # Rows without company/position (common in LinkedIn exports) or with an
+    # obvious non-venture title would only burn a request
+    local = _local_enrichment(company, position)
+    if local is not None:
+        return local
+    return enrichment_cache.get(enrichment_key(ENRICHMENT_MODEL, name, company, position))
+
+
+def _enrichment_from_response(
+    response,
+    name: str,
+    company: Optional[str],
+    position: Optional[str],
+) -> Dict:
+    """Parse and cache a single-entity enrichment response."""
+    log_api_call(logger, "OpenAI", "chat.completions.create",
+                model=ENRICHMENT_MODEL, entity=name, status="success")
+
+    data = _normalize_enrichment(json.loads(response.choices[0].message.content))
+    logger.debug(f"Entity enriched | Name: {name} | Role: {data.get('role', 'unknown')}")
+    enrichment_cache.set(enrichment_key(ENRICHMENT_MODEL, name, company, position), data)
+    return data
 
 
 def enrich_entity(
@@ -44,97 +415,302 @@ def enrich_entity(
     """Enrich entity using LLM to extract investor/founder attributes."""
     if not settings.openai_api_key:
         logger.warning("No OpenAI API key configured - skipping enrichment")
-        return {
-            "role": "other",
-            "sector_focus": [],
-            "stage_focus": [],
-            "check_size_min": None,
-            "check_size_max": None,
-            "investment_thesis": None,
-            "location": None,
-            "tags": [],
-            "confidence": 0.0,
-        }
+        return _default_enrichment()
+
+    known = _cached_or_local_enrichment(name, company, position)
+    if known is not None:
+        return known
 
     try:
-        prompt = ENRICHMENT_PROMPT.format(
-            name=name,
-            company=company or "Unknown",
-            position=position or "Unknown",
-        )
+        logger.debug(f"Enriching entity | Name: {name} | Company: {company} | Position: {position}")
+        response = create_chat_completion(_enrichment_request(name, company, position))
+        return _enrichment_from_response(response, name, company, position)
+
+    except Exception as e:
+        log_error_with_context(logger, e, "Enrich entity", name=name, company=company, position=position)
+        return _default_enrichment()
+
+
+async def enrich_entity_async(
+    client: AsyncOpenAI,
+    semaphore: asyncio.Semaphore,
+    name: str,
+    company: Optional[str],
+    position: Optional[str],
+) -> Dict:
+    """Async variant of enrich_entity; the semaphore bounds in-flight requests."""
+    known = _cached_or_local_enrichment(name, company, position)
+    if known is not None:
+        return known
 
+    try:
         logger.debug(f"Enriching entity | Name: {name} | Company: {company} | Position: {position}")
-        
-        response = openai.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {
-                    "role": "system",
-                    "content": SYSTEM_PROMPT,
-                },
-                {"role": "user", "content": prompt},
-            ],
-            temperature=0.3,
-            max_tokens=500,
+        response = await create_chat_completion_async(
+            client, semaphore, _enrichment_request(name, company, position)
         )
-        
-        log_api_call(logger, "OpenAI", "chat.completions.create",
-                    model="gpt-4o-mini", entity=name, status="success")
-        
-        content = response.choices[0].message.content
-        # Try to parse JSON from the response
-        # Sometimes the model wraps it in markdown code blocks
-        if "```json" in content:
-            content = content.split("```json")[1].split("```")[0].strip()
-        elif "```" in content:
-            content = content.split("```")[1].split("```")[0].strip()
-
-        data = json.loads(content)
-        logger.debug(f"Entity enriched | Name: {name} | Role: {data.get('role', 'unknown')}")
-        return data
+        return _enrichment_from_response(response, name, company, position)
 
     except Exception as e:
         log_error_with_context(logger, e, "Enrich entity", name=name, company=company, position=position)
-        return {
-            "role": "other",
-            "sector_focus": [],
-            "stage_focus": [],
-            "check_size_min": None,
-            "check_size_max": None,
-            "investment_thesis": None,
-            "location": None,
-            "tags": [],
-            "confidence": 0.0,
-        }
+        return _default_enrichment()
+
+
+async def enrich_entities_batch(
+    client: AsyncOpenAI,
+    semaphore: asyncio.Semaphore,
+    people: List[Dict],
+) -> List[Dict]:
+    """
+    Enrich several entities with a single chat request.
+
+    Cached entities and ones without enough detail or with an obvious
+    non-venture title are resolved without the LLM. If the batch request
+    fails or its answer does not line up with the input, the remaining
+    entities are enriched one request each.
+    """
+    results: List[Optional[Dict]] = [None] * len(people)
+    pending = []
+    for idx, person in enumerate(people):
+        known = _cached_or_local_enrichment(person["name"], person.get("company"), person.get("position"))
+        if known is not None:
+            results[idx] = known
+        else:
+            pending.append(idx)
+
+    enrichments = None
+    if len(pending) > 1:
+        try:
+            response = await create_chat_completion_async(
+                client, semaphore, _batch_enrichment_request([people[idx] for idx in pending])
+            )
+            enrichments = _parse_batch_enrichments(response.choices[0].message.content, len(pending))
+            if enrichments is None:
+                logger.warning(f"Batch enrichment answer did not match input | Entities: {len(pending)}")
+            else:
+                log_api_call(logger, "OpenAI", "chat.completions.create",
+                            model=ENRICHMENT_MODEL, entities=len(pending), status="success")
+        except Exception as e:
+            log_error_with_context(logger, e, "Batch enrich entities", entities=len(pending))
+
+    if enrichments is not None:
+        for idx, enrichment in zip(pending, enrichments):
+            person = people[idx]
+            enrichment_cache.set(
+                enrichment_key(ENRICHMENT_MODEL, person["name"], person.get("company"), person.get("position")),
+                enrichment,
+            )
+            results[idx] = enrichment
+    else:
+        # Single entity, or the batch failed: one request per entity
+        enrichments = await asyncio.gather(*(
+            enrich_entity_async(
+                client, semaphore, people[idx]["name"], people[idx].get("company"), people[idx].get("position")
+            )
+            for idx in pending
+        ))
+        for idx, enrichment in zip(pending, enrichments):
+            results[idx] = enrichment
+
+    return results
+
+
+async def enrich_many(
+    entities_info: List[Dict],
+    max_workers: int = 10,
+    on_complete: Optional[Callable[[int, Dict], None]] = None,
+    batch_size: int = ENRICHMENT_BATCH_SIZE,
+) -> List[Dict]:
+    """
+    Enrich many entities concurrently over the event loop's shared AsyncOpenAI client.
+
+    Entities are sent batch_size per request, so a 3000-row upload needs
+    ~375 requests instead of 3000.
+
+    Args:
+        entities_info: List of dicts with 'name', 'company', 'position'
+        max_workers: Maximum number of concurrent API requests
+        on_complete: Optional callback(index, enrichment) run as each entity finishes
+        batch_size: Entities per chat request
+
+    Returns:
+        Enrichments in input order
+    """
+    if not settings.openai_api_key:
+        logger.warning("No OpenAI API key configured - skipping enrichment")
+        return [_default_enrichment() for _ in entities_info]
+
+    # Entities with the same cache key (e.g. a contact listed twice) are
+    # enriched once; the cache cannot help while both are still in flight
+    unique: List[int] = []
+    copies: Dict[int, List[int]] = {}
+    first_by_key: Dict[str, int] = {}
+    for idx, info in enumerate(entities_info):
+        key = enrichment_key(ENRICHMENT_MODEL, info["name"], info.get("company"), info.get("position"))
+        first = first_by_key.setdefault(key, idx)
+        if first == idx:
+            unique.append(idx)
+        else:
+            copies.setdefault(first, []).append(idx)
+    results: List[Optional[Dict]] = [None] * len(entities_info)
+
+    semaphore = asyncio.Semaphore(max_workers)
+
+    async with async_openai_client() as client:
+        async def enrich_chunk(start: int) -> None:
+            indices = unique[start:start + batch_size]
+            enrichments = await enrich_entities_batch(
+                client, semaphore, [entities_info[idx] for idx in indices]
+            )
+            for idx, enrichment in zip(indices, enrichments):
+                # Duplicates get their own copy so callers can mutate them
+                for target in (idx, *copies.get(idx, ())):
+                    results[target] = enrichment if target == idx else dict(enrichment)
+                    if on_complete is not None:
+                        on_complete(target, results[target])
+
+        await asyncio.gather(
+            *(enrich_chunk(start) for start in range(0, len(unique), batch_size))
+        )
+        return results
+
+
+# Batch API job states after which no more results will arrive
+BATCH_FINAL_STATUSES = ("completed", "expired", "failed", "cancelled")
+# OpenAI limits per batch: requests, and size of the JSONL input file
+BATCH_MAX_REQUESTS = 50_000
+BATCH_MAX_BYTES = 200_000_000
+
+
+def _batch_input_files(lines: List[str]) -> List[bytes]:
+    """Split JSONL request lines into input files within the batch limits."""
+    files: List[bytes] = []
+    chunk: List[bytes] = []
+    size = 0
+    for line in lines:
+        encoded = line.encode("utf-8")
+        # +1 for the newline joining it to the previous line
+        if chunk and (len(chunk) >= BATCH_MAX_REQUESTS or size + 1 + len(encoded) > BATCH_MAX_BYTES):
+            files.append(b"\n".join(chunk))
+            chunk, size = [], 0
+        size += len(encoded) + (1 if chunk else 0)
+        chunk.append(encoded)
+    if chunk:
+        files.append(b"\n".join(chunk))
+    return files
+
+
+def submit_enrichment_batch(
+    people: List[Dict],
+    on_submitted: Optional[Callable[[str], None]] = None,
+) -> Tuple[List[str], Dict[str, Dict]]:
+    """
+    Queue enrichments on the OpenAI Batch API.
+
+    Batch requests cost half as much and do not count against the per-minute
+    limits, but finish within 24h rather than seconds, so this suits
+    enrichment nobody is waiting on. Large imports are split into several
+    batches to stay within OpenAI's per-batch request and file size limits.
+
+    Args:
+        people: Dicts with a unique 'id' plus 'name', 'company', 'position'
+        on_submitted: Optional callback(batch_id) run as each batch is created,
+            so ids are known even if a later submission fails
+
+    Returns:
+        (batch ids, empty if nothing needed the LLM; enrichments resolved
+        locally or from the cache, keyed by str(id))
+    """
+    resolved: Dict[str, Dict] = {}
+    lines = []
+    for person in people:
+        custom_id = str(person["id"])
+        company, position = person.get("company"), person.get("position")
+        enrichment = _local_enrichment(company, position)
+        if enrichment is None:
+            enrichment = enrichment_cache.get(enrichment_key(ENRICHMENT_MODEL, person["name"], company, position))
+        if enrichment is not None:
+            resolved[custom_id] = enrichment
+            continue
+        lines.append(json.dumps({
+            "custom_id": custom_id,
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": _enrichment_request(person["name"], company, position),
+        }))
+
+    client = get_openai_client()
+    batch_ids: List[str] = []
+    for content in _batch_input_files(lines):
+        input_file = client.files.create(file=("enrichment.jsonl", content), purpose="batch")
+        batch = client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+        log_api_call(logger, "OpenAI", "batches.create",
+                    model=ENRICHMENT_MODEL, count=content.count(b"\n") + 1, batch_id=batch.id, status=batch.status)
+        batch_ids.append(batch.id)
+        if on_submitted is not None:
+            on_submitted(batch.id)
+    return batch_ids, resolved
+
+
+def fetch_enrichment_batch(batch_id: str) -> Optional[Dict[str, Dict]]:
+    """
+    Enrichments of a finished batch keyed by custom id, or None while it runs.
+
+    Requests that failed inside the batch (or did not finish before it
+    expired) are missing from the result. Raises RuntimeError if the batch
+    as a whole failed or was cancelled.
+    """
+    client = get_openai_client()
+    batch = client.batches.retrieve(batch_id)
+    if batch.status not in BATCH_FINAL_STATUSES:
+        return None
+    if batch.status in ("failed", "cancelled"):
+        raise RuntimeError(f"OpenAI batch {batch_id} ended with status '{batch.status}'")
+    if batch.status == "expired":
+        logger.warning(f"OpenAI batch {batch_id} expired - keeping the requests it finished")
+
+    results: Dict[str, Dict] = {}
+    if not batch.output_file_id:
+        return results
+    for line in client.files.content(batch.output_file_id).text.splitlines():
+        if not line:
+            continue
+        record = json.loads(line)
+        response = record.get("response") or {}
+        if response.get("status_code") != 200:
+            continue
+        try:
+            content = response["body"]["choices"][0]["message"]["content"]
+            results[record["custom_id"]] = _normalize_enrichment(json.loads(content))
+        except (KeyError, IndexError, TypeError, ValueError) as e:
+            log_error_with_context(logger, e, "Parse batch enrichment", custom_id=record.get("custom_id"))
+
+    log_api_call(logger, "OpenAI", "batches.retrieve",
+                model=ENRICHMENT_MODEL, count=len(results), batch_id=batch_id, status=batch.status)
+    return results
+
+
+# (label, key, formatter) in embedding-text order; empty values are skipped
+_EMBEDDING_TEXT_FIELDS = (
+    ("Name", "full_name", str),
+    ("Company", "company", str),
+    ("Position", "position", str),
+    ("Role", "role", str),
+    ("Sectors", "sector_focus", ", ".join),
+    ("Stages", "stage_focus", ", ".join),
+    ("Thesis", "investment_thesis", str),
+    ("Location", "location", str),
+)
 
 
 def create_embedding_text(entity_dict: Dict) -> str:
     """Create a text representation for embedding generation."""
-    parts = []
-    
-    if entity_dict.get("full_name"):
-        parts.append(f"Name: {entity_dict['full_name']}")
-    
-    if entity_dict.get("company"):
-        parts.append(f"Company: {entity_dict['company']}")
-    
-    if entity_dict.get("position"):
-        parts.append(f"Position: {entity_dict['position']}")
-    
-    if entity_dict.get("role"):
-        parts.append(f"Role: {entity_dict['role']}")
-    
-    if entity_dict.get("sector_focus"):
-        parts.append(f"Sectors: {', '.join(entity_dict['sector_focus'])}")
-    
-    if entity_dict.get("stage_focus"):
-        parts.append(f"Stages: {', '.join(entity_dict['stage_focus'])}")
-    
-    if entity_dict.get("investment_thesis"):
-        parts.append(f"Thesis: {entity_dict['investment_thesis']}")
-    
-    if entity_dict.get("location"):
-        parts.append(f"Location: {entity_dict['location']}")
-    
-    return " | ".join(parts)
+    return " | ".join(
+        f"{label}: {fmt(value)}"
+        for label, key, fmt in _EMBEDDING_TEXT_FIELDS
+        if (value := entity_dict.get(key))
+    )
 
@@ -0,0 +1,97 @@
+"""Content-addressed caches for OpenAI enrichment and embedding results."""
+from __future__ import annotations
+
+import hashlib
+import threading
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+import numpy as np
+from cachetools import LRUCache, TTLCache
+
+from app.core.config import settings
+from app.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+def _fingerprint(*parts: Any) -> str:
+    """SHA-256 over the '|'-joined parts (model id and inputs)."""
+    return hashlib.sha256("|".join(str(part) for part in parts).encode("utf-8")).hexdigest()
+
+
+def enrichment_key(model: str, name: str, company: Optional[str], position: Optional[str]) -> str:
+    """
+    Cache key for an enrichment: model plus the prompt inputs.
+
+    Inputs are case- and whitespace-normalized, so "Software Engineer" at
+    "Google" and "software engineer " at "google" share one LLM call.
+    """
+    return _fingerprint(model, *(" ".join((part or "").split()).casefold() for part in (name, company, position)))
+
+
+def embedding_key(model: str, dimensions: int, text: str) -> str:
+    """Cache key for an embedding: model and dimensions are part of the key so a
+    model upgrade never serves stale vectors."""
+    return _fingerprint(model, dimensions, text)
+
+
+class ResultCache:
+    """Thread-safe LRU cache (optionally with a TTL) with hit/miss counters."""
+
+    def __init__(
+        self,
+        maxsize: int,
+        encode: Callable[[Any], Any] = lambda value: value,
+        decode: Callable[[Any], Any] = lambda value: value,
+        ttl: Optional[float] = None,
+    ) -> None:
+        self._cache: LRUCache = (
+            LRUCache(maxsize=maxsize) if ttl is None else TTLCache(maxsize=maxsize, ttl=ttl)
+        )
+        self._encode = encode
+        self._decode = decode
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for key, or None."""
+        with self._lock:
+            value = self._cache.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return self._decode(value)
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value under key."""
+        encoded = self._encode(value)
+        with self._lock:
+            self._cache[key] = encoded
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        with self._lock:
+            self._cache.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Current size and hit/miss counters."""
+        with self._lock:
+            return {"size": len(self._cache), "hits": self.hits, "misses": self.misses}
+
+
+def _encode_embedding(embedding: List[float]) -> np.ndarray:
+    # The API returns float32 values, so this is lossless and ~5x smaller than a list
+    return np.asarray(embedding, dtype=np.float32)
+
+
+def _decode_embedding(embedding: np.ndarray) -> List[float]:
+    return embedding.tolist()
+
+
+# Enrichment dicts are copied on the way in and out so callers can mutate them
+enrichment_cache = ResultCache(maxsize=50_000, encode=dict, decode=dict, ttl=settings.enrichment_cache_ttl)
+
+# ~6KB per 1536-dim vector
+embedding_cache = ResultCache(maxsize=20_000, encode=_encode_embedding, decode=_decode_embedding)
@@ -1,13 +1,60 @@
 """Graph analysis service for relationship discovery."""
 from __future__ import annotations
 
-from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Set, Tuple
 
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
 from app.core.models import Entity
+from app.services.enrichment_cache import ResultCache, embedding_cache, enrichment_cache
 from app.services.neo4j_client import neo4j_client
 
+# Only the Neo4j traversals are cached; entity details are still read from
+# PostgreSQL so edits show up immediately
+_intro_path_cache = ResultCache(
+    maxsize=settings.intro_path_cache_size,
+    ttl=settings.intro_path_cache_ttl,
+)
+_mutual_cache = ResultCache(
+    maxsize=settings.intro_path_cache_size,
+    ttl=settings.intro_path_cache_ttl,
+)
+
+
+def _find_intro_path(source_id: int, target_id: int) -> List[Dict]:
+    """Raw Neo4j shortest path from source to target, memoized per pair."""
+    key = (source_id, target_id)
+    path = _intro_path_cache.get(key)
+    if path is None:
+        path = neo4j_client.find_intro_path(source_id, target_id, max_depth=3)
+        _intro_path_cache.set(key, path)
+    return path
+
+
+def _find_mutual_connections(source_id: int, target_id: int) -> List[Dict]:
+    """Raw Neo4j mutual connections of a pair, memoized in either order."""
+    # The traversal ignores edge direction, so (a, b) and (b, a) match alike
+    key = (min(source_id, target_id), max(source_id, target_id))
+    mutuals = _mutual_cache.get(key)
+    if mutuals is None:
+        mutuals = neo4j_client.get_mutual_connections(source_id, target_id)
+        _mutual_cache.set(key, mutuals)
+    return mutuals
+
+
+# Runs one Neo4j query of a pair while the request thread runs the other;
+# the driver is thread-safe and pools its connections
+_graph_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="neo4j")
+
+
+def invalidate_graph_cache() -> None:
+    """Drop memoized paths and mutuals after the graph changes (imports, clears)."""
+    _intro_path_cache.clear()
+    _mutual_cache.clear()
+
 
 def get_intro_path(
     source_id: int,
@@ -15,7 +62,7 @@ def get_intro_path(
     db: Session,
 ) -> List[Dict]:
     """Get introduction path from source to target entity."""
-    path_nodes = neo4j_client.find_intro_path(source_id, target_id, max_depth=3)
+    path_nodes = _find_intro_path(source_id, target_id)
     
     if not path_nodes:
         return []
@@ -48,7 +95,7 @@ def get_mutual_connections(
     db: Session,
 ) -> List[Dict]:
     """Get mutual connections between two entities."""
-    mutual_nodes = neo4j_client.get_mutual_connections(source_id, target_id)
+    mutual_nodes = _find_mutual_connections(source_id, target_id)
     
     if not mutual_nodes:
         return []
@@ -86,8 +133,12 @@ def calculate_connection_strength(
     - 3rd degree (2 hops): 0.4
     - No connection: 0.0
     """
-    path = neo4j_client.find_intro_path(source_id, target_id, max_depth=3)
-    
+    path = _find_intro_path(source_id, target_id)
+    return _strength_from_path(path)
+
+
+def _strength_from_path(path: List[Dict]) -> float:
+    """Connection strength for a raw Neo4j path (see calculate_connection_strength)."""
     if not path:
         return 0.0
     
@@ -105,12 +156,138 @@ def calculate_connection_strength(
         return 0.1  # Further degrees
 
 
+def _load_entity_map(db: Session, entity_ids: Set[int]) -> Dict[int, Entity]:
+    """Load entities by id in one query."""
+    if not entity_ids:
+        return {}
+    entities = db.query(Entity).filter(Entity.id.in_(entity_ids)).all()
+    return {e.id: e for e in entities}
+
+
+def get_intro_paths_batch(
+    source_id: int,
+    target_ids: List[int],
+    db: Session,
+) -> Dict[int, Dict]:
+    """
+    Get introduction paths and connection strengths for many targets.
+
+    Uses one Neo4j query and one PostgreSQL query regardless of the number
+    of targets. Targets without a path are omitted.
+
+    Returns:
+        Dict mapping target_id -> {"intro_path": [...], "connection_strength": float}
+    """
+    raw_paths = neo4j_client.find_intro_paths(source_id, target_ids, max_depth=3)
+
+    entity_map = _load_entity_map(
+        db, {node["entity_id"] for path in raw_paths.values() for node in path}
+    )
+    return _build_intro_paths(raw_paths, entity_map)
+
+
+def _build_intro_paths(
+    raw_paths: Dict[int, List[Dict]],
+    entity_map: Dict[int, Entity],
+) -> Dict[int, Dict]:
+    """Turn raw Neo4j paths into intro path dicts using preloaded entities."""
+    results = {}
+    for target_id, path_nodes in raw_paths.items():
+        intro_path = []
+        for node in path_nodes:
+            entity = entity_map.get(node["entity_id"])
+            if entity:
+                intro_path.append({
+                    "id": entity.id,
+                    "name": entity.full_name,
+                    "company": entity.company,
+                    "position": entity.position,
+                    "role": entity.role,
+                    "linkedin_url": entity.linkedin_url,
+                })
+        results[target_id] = {
+            "intro_path": intro_path,
+            "connection_strength": _strength_from_path(path_nodes),
+        }
+
+    return results
+
+
+def get_mutual_connections_batch(
+    source_id: int,
+    target_ids: List[int],
+    db: Session,
+) -> Dict[int, List[Dict]]:
+    """Get mutual connections for many targets with one Neo4j and one PostgreSQL query."""
+    mutual_nodes = neo4j_client.get_mutual_connections_batch(source_id, target_ids)
+
+    entity_map = _load_entity_map(
+        db, {node["entity_id"] for nodes in mutual_nodes.values() for node in nodes}
+    )
+    return _build_mutual_connections(mutual_nodes, entity_map)
+
+
+def _build_mutual_connections(
+    mutual_nodes: Dict[int, List[Dict]],
+    entity_map: Dict[int, Entity],
+) -> Dict[int, List[Dict]]:
+    """Turn raw Neo4j mutual nodes into connection dicts using preloaded entities."""
+    results = {}
+    for target_id, nodes in mutual_nodes.items():
+        results[target_id] = [
+            {
+                "id": entity.id,
+                "name": entity.full_name,
+                "company": entity.company,
+                "position": entity.position,
+                "role": entity.role,
+            }
+            for entity in (entity_map.get(node["entity_id"]) for node in nodes)
+            if entity
+        ]
+
+    return results
+
+
+def get_intro_context_batch(
+    source_id: int,
+    target_ids: List[int],
+    db: Session,
+) -> Tuple[Dict[int, Dict], Dict[int, List[Dict]]]:
+    """
+    Get intro paths and mutual connections for many targets together.
+
+    The two Neo4j queries run concurrently and the entities they reference
+    are loaded from PostgreSQL in one query.
+
+    Returns:
+        (get_intro_paths_batch result, get_mutual_connections_batch result)
+    """
+    paths_future = _graph_executor.submit(
+        neo4j_client.find_intro_paths, source_id, target_ids, 3
+    )
+    mutual_nodes = neo4j_client.get_mutual_connections_batch(source_id, target_ids)
+    raw_paths = paths_future.result()
+
+    entity_map = _load_entity_map(
+        db,
+        {node["entity_id"] for path in raw_paths.values() for node in path}
+        | {node["entity_id"] for nodes in mutual_nodes.values() for node in nodes},
+    )
+    return (
+        _build_intro_paths(raw_paths, entity_map),
+        _build_mutual_connections(mutual_nodes, entity_map),
+    )
+
+
 def get_network_stats(db: Session) -> Dict:
     """Get overall network statistics."""
-    total = db.query(Entity).count()
-    investors = db.query(Entity).filter(Entity.role == "investor").count()
-    founders = db.query(Entity).filter(Entity.role == "founder").count()
-    enablers = db.query(Entity).filter(Entity.role == "enabler").count()
+    # One scan with a GROUP BY instead of a COUNT query per role
+    counts = dict(db.query(Entity.role, func.count(Entity.id)).group_by(Entity.role).all())
+    total = sum(counts.values())
+    investors = counts.get("investor", 0)
+    founders = counts.get("founder", 0)
+    enablers = counts.get("enabler", 0)
     others = total - investors - founders - enablers
 
     return {
@@ -119,5 +296,7 @@ def get_network_stats(db: Session) -> Dict:
         "founders": founders,
         "enablers": enablers,
         "others": others,
+        "enrichment_cache": enrichment_cache.stats(),
+        "embedding_cache": embedding_cache.stats(),
     }
 
@@ -1,10 +1,92 @@
 """Match scoring and ranking system for investor-founder matching."""
 from __future__ import annotations
 
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import case, func, or_
+from sqlalchemy.sql.elements import ColumnElement
 
 from app.core.models import Entity
 
+# Weight factors per requirements (Section 6.5)
+FACTOR_WEIGHTS = {
+    'sector': 0.35,          # 35% weight (Sector Match)
+    'stage': 0.20,           # 20% weight (Stage Alignment)
+    'geography': 0.15,       # 15% weight (Geography Fit)
+    'checkSize': 0.10,       # 10% weight (Check Size)
+    'traction': 0.10,        # 10% weight (Traction Signals)
+    'graph_proximity': 0.10  # 10% weight (Graph Proximity)
+}
+
+# Base scores for factors the MVP does not measure yet
+DEFAULT_FACTOR_SCORES = {
+    'traction': 70.0,
+    'graph_proximity': 75.0,
+}
+
+# Column order of the factor matrices used by combine_factor_scores
+FACTOR_NAMES = tuple(FACTOR_WEIGHTS)
+_WEIGHT_VECTOR = np.array([FACTOR_WEIGHTS[name] for name in FACTOR_NAMES])
+_MEASURED_COLUMNS = [
+    col for col, name in enumerate(FACTOR_NAMES) if name not in DEFAULT_FACTOR_SCORES
+]
+
+
+@lru_cache(maxsize=4096)
+def _normalize_term(value: str) -> Tuple[str, FrozenSet[str]]:
+    """
+    Lowercased value and its token set.
+
+    Sectors, stages and locations come from a small vocabulary, so this is
+    memoized across entities and requests instead of re-splitting per match.
+    """
+    value_lower = value.lower()
+    return value_lower, frozenset(value_lower.split())
+
+
+# Common stage keywords for synonym matching
+STAGE_KEYWORDS = {
+    'pre-seed': ('pre-seed', 'preseed', 'pre seed'),
+    'seed': ('seed',),
+    'series-a': ('series a', 'series-a', 'seriesa'),
+    'series-b': ('series b', 'series-b', 'seriesb'),
+    'growth': ('growth', 'late stage', 'late-stage'),
+}
+
+# Geographic regions and their keywords
+REGION_KEYWORDS = {
+    'mena': ('mena', 'middle east', 'north africa'),
+    'gcc': ('gcc', 'gulf', 'gulf cooperation council'),
+    'dubai': ('dubai', 'uae', 'emirates'),
+    'riyadh': ('riyadh', 'saudi', 'ksa', 'saudi arabia'),
+    'egypt': ('egypt', 'cairo'),
+    'us': ('usa', 'us', 'united states', 'america'),
+    'uk': ('uk', 'united kingdom', 'london', 'britain'),
+    'europe': ('europe', 'eu', 'european'),
+}
+
+
+def _keyword_groups(text: str, keyword_groups: Dict[str, Tuple[str, ...]]) -> FrozenSet[str]:
+    """Names of the groups with at least one keyword contained in text."""
+    return frozenset(
+        group for group, keywords in keyword_groups.items()
+        if any(kw in text for kw in keywords)
+    )
+
+
+# Keyword scans are memoized per lowercased text, so each entity value and
+# each query is scanned once and a synonym match is a set intersection
+@lru_cache(maxsize=4096)
+def _stage_types(text: str) -> FrozenSet[str]:
+    return _keyword_groups(text, STAGE_KEYWORDS)
+
+
+@lru_cache(maxsize=4096)
+def _regions(text: str) -> FrozenSet[str]:
+    return _keyword_groups(text, REGION_KEYWORDS)
+
 
 def calculate_sector_match(
     entity: Entity,
@@ -16,40 +98,31 @@ def calculate_sector_match(
 
     Returns (score, has_match).
     """
-    if not entity.sector_focus:
+    sectors = entity.sector_focus
+    if not sectors:
         return 0.0, False
-    
+
     score = 0.0
-    has_match = False
     query_lower = query.lower()
 
     # Check for exact matches in sectors
-    for sector in entity.sector_focus:
-        sector_lower = sector.lower()
+    for sector in sectors:
+        sector_lower, sector_tokens = _normalize_term(sector)
 
         # Exact sector in query
         if sector_lower in query_lower:
-            score = 100.0
-            has_match = True
-            break
+            return 100.0, True
 
         # Partial matches (sector contains query tokens)
-        sector_tokens = set(sector_lower.split())
         matching_tokens = query_tokens.intersection(sector_tokens)
 
         if matching_tokens:
-            # Calculate score based on match ratio
+            # Calculate score based on match ratio (70-100 range)
             match_ratio = len(matching_tokens) / len(sector_tokens)
-            token_score = 70 + (match_ratio * 30)  # 70-100 range
-            score = max(score, token_score)
-            has_match = True
+            score = max(score, 70 + (match_ratio * 30))
 
     # Base score if has sectors but no query match
-    if not has_match:
-        score = 60.0
-        has_match = True
-    
-    return score, has_match
+    return score or 60.0, True
 
 
 def calculate_stage_match(
@@ -62,56 +135,32 @@ def calculate_stage_match(
 
     Returns (score, has_match).
     """
-    if not entity.stage_focus:
+    stages = entity.stage_focus
+    if not stages:
         return 0.0, False
-    
+
     score = 0.0
-    has_match = False
     query_lower = query.lower()
+    query_stage_types = _stage_types(query_lower)
 
-    # Common stage keywords for synonym matching
-    stage_keywords = {
-        'pre-seed': ['pre-seed', 'preseed', 'pre seed'],
-        'seed': ['seed'],
-        'series-a': ['series a', 'series-a', 'seriesa'],
-        'series-b': ['series b', 'series-b', 'seriesb'],
-        'growth': ['growth', 'late stage', 'late-stage']
-    }
-
-    for stage in entity.stage_focus:
-        stage_lower = stage.lower()
+    for stage in stages:
+        stage_lower, stage_tokens = _normalize_term(stage)
 
         # Exact match
         if stage_lower in query_lower or query_lower in stage_lower:
-            score = 100.0
-            has_match = True
-            break
+            return 100.0, True
 
         # Check synonyms
-        for stage_type, keywords in stage_keywords.items():
-            if any(kw in stage_lower for kw in keywords):
-                if any(kw in query_lower for kw in keywords):
-                    score = 95.0
-                    has_match = True
-                    break
-
-        if has_match:
-            break
+        if _stage_types(stage_lower) & query_stage_types:
+            return 95.0, True
 
         # Token matches
-        stage_tokens = set(stage_lower.split())
-        matching_tokens = query_tokens.intersection(stage_tokens)
-
-        if matching_tokens:
-            score = max(score, 75.0)
-            has_match = True
+        if query_tokens.intersection(stage_tokens):
+            score = 75.0
 
     # Base score if has stages but no query match
-    if not has_match:
-        score = 65.0
-        has_match = True
-    
-    return score, has_match
+    return score or 65.0, True
+
 
 def calculate_geography_match(
     entity: Entity,
@@ -123,57 +172,27 @@ def calculate_geography_match(
     
     Returns (score, has_match).
     """
-    if not entity.location:
+    location = entity.location
+    if not location:
         return 0.0, False
-    
-    location_lower = entity.location.lower()
+
+    location_lower, location_tokens = _normalize_term(location)
     query_lower = query.lower()
-    
-    # Geographic regions and their keywords
-    geo_keywords = {
-        'mena': ['mena', 'middle east', 'north africa'],
-        'gcc': ['gcc', 'gulf', 'gulf cooperation council'],
-        'dubai': ['dubai', 'uae', 'emirates'],
-        'riyadh': ['riyadh', 'saudi', 'ksa', 'saudi arabia'],
-        'egypt': ['egypt', 'cairo'],
-        'us': ['usa', 'us', 'united states', 'america'],
-        'uk': ['uk', 'united kingdom', 'london', 'britain'],
-        'europe': ['europe', 'eu', 'european']
-    }
-    
-    score = 0.0
-    has_match = False
-    
+
     # Exact location match
     if location_lower in query_lower or query_lower in location_lower:
-        score = 100.0
-        has_match = True
-    else:
-        # Check for regional matches
-        for region, keywords in geo_keywords.items():
-            location_match = any(kw in location_lower for kw in keywords)
-            query_match = any(kw in query_lower for kw in keywords)
-
-            if location_match and query_match:
-                score = 95.0
-                has_match = True
-                break
+        return 100.0, True
 
-        # Token matches
-        if not has_match:
-            location_tokens = set(location_lower.split())
-            matching_tokens = query_tokens.intersection(location_tokens)
+    # Check for regional matches
+    if _regions(location_lower) & _regions(query_lower):
+        return 95.0, True
 
-            if matching_tokens:
-                score = 80.0
-                has_match = True
+    # Token matches
+    if query_tokens.intersection(location_tokens):
+        return 80.0, True
 
     # Base score if has location but no query match
-    if not has_match:
-        score = 70.0
-        has_match = True
-    
-    return score, has_match
+    return 70.0, True
 
 
 def calculate_check_size_match(
@@ -199,6 +218,25 @@ def calculate_check_size_match(
     return score, has_match
 
 
+def _empty_query_factors(entity: Entity) -> Dict[str, float]:
+    """
+    Match factors for an empty query.
+
+    Every stage and location contains "", and a sector matches only if it is
+    itself empty, so the factors depend on which fields are populated.
+    """
+    factors = {}
+    if entity.sector_focus:
+        factors['sector'] = 100.0 if '' in entity.sector_focus else 60.0
+    if entity.stage_focus:
+        factors['stage'] = 100.0
+    if entity.location:
+        factors['geography'] = 100.0
+    if entity.check_size_min or entity.check_size_max:
+        factors['checkSize'] = 75.0
+    return factors
+
+
 def calculate_match_factors(
     entity: Entity,
     query: str = ""
@@ -208,6 +246,10 @@ def calculate_match_factors(
     
     Returns dict with factor names and scores (0-100).
     """
+    # Listings (/investors, intro emails) score without a query
+    if not query:
+        return _empty_query_factors(entity)
+
     query_lower = query.lower()
     query_tokens = set(query_lower.split())
     
@@ -264,28 +306,17 @@ def calculate_overall_match_score(
     if not factors:
         return round(base_score, 1)
     
-    # Weight factors per requirements (Section 6.5)
-    factor_weights = {
-        'sector': 0.35,          # 35% weight (Sector Match)
-        'stage': 0.20,           # 20% weight (Stage Alignment)
-        'geography': 0.15,       # 15% weight (Geography Fit)
-        'checkSize': 0.10,       # 10% weight (Check Size)
-        'traction': 0.10,        # 10% weight (Traction Signals)
-        'graph_proximity': 0.10  # 10% weight (Graph Proximity)
-    }
-    
     # Add default scores for factors not present
-    if 'traction' not in factors:
-        factors['traction'] = 70.0  # Base traction score for MVP
-    if 'graph_proximity' not in factors:
-        factors['graph_proximity'] = 75.0  # Base graph proximity score for MVP
+    for factor_name, default_score in DEFAULT_FACTOR_SCORES.items():
+        if factor_name not in factors:
+            factors[factor_name] = default_score
     
     # Calculate weighted factor score
     weighted_factor_score = 0.0
     total_weight = 0.0
     
     for factor_name, score in factors.items():
-        weight = factor_weights.get(factor_name, 0.0)
+        weight = FACTOR_WEIGHTS.get(factor_name, 0.0)
         weighted_factor_score += score * weight
         total_weight += weight
     
@@ -304,9 +335,149 @@ def calculate_overall_match_score(
     return round(final_score, 1)
 
 
+def factors_to_array(factors_list: List[Dict[str, float]]) -> np.ndarray:
+    """
+    Pack match factor dicts into an (N, 6) array in FACTOR_NAMES order.
+
+    Missing factors are NaN.
+    """
+    matrix = np.full((len(factors_list), len(FACTOR_NAMES)), np.nan)
+    for row, factors in enumerate(factors_list):
+        for col, name in enumerate(FACTOR_NAMES):
+            score = factors.get(name)
+            if score is not None:
+                matrix[row, col] = score
+    return matrix
+
+
+def combine_factor_scores(
+    factor_matrix: np.ndarray,
+    similarity_scores: np.ndarray,
+) -> np.ndarray:
+    """
+    Calculate overall match scores (0-100) for N candidates at once.
+
+    Vectorized equivalent of calculate_overall_match_score.
+
+    Args:
+        factor_matrix: (N, 6) factor scores in FACTOR_NAMES order, NaN if missing
+        similarity_scores: (N,) vector similarities (0-1)
+
+    Returns:
+        (N,) array of overall scores rounded to one decimal
+    """
+    base_scores = np.asarray(similarity_scores, dtype=float) * 100
+    factor_matrix = np.asarray(factor_matrix, dtype=float)
+
+    # Candidates without any measured factor fall back to similarity only
+    has_factors = ~np.isnan(factor_matrix[:, _MEASURED_COLUMNS]).all(axis=1)
+
+    # Fill defaults for unmeasured factors, then weight what is present
+    filled = factor_matrix.copy()
+    for name, default_score in DEFAULT_FACTOR_SCORES.items():
+        col = FACTOR_NAMES.index(name)
+        filled[:, col] = np.where(np.isnan(filled[:, col]), default_score, filled[:, col])
+
+    present = ~np.isnan(filled)
+    weights = np.where(present, _WEIGHT_VECTOR, 0.0)
+    weighted_sum = np.where(present, filled, 0.0) @ _WEIGHT_VECTOR
+    total_weight = weights.sum(axis=1)
+    factor_scores = np.divide(
+        weighted_sum,
+        total_weight,
+        out=np.full(len(filled), 70.0),
+        where=total_weight > 0,
+    )
+
+    # Combine similarity (40%) + factors (60%)
+    final_scores = np.clip(base_scores * 0.4 + factor_scores * 0.6, 0.0, 100.0)
+    final_scores = np.where(has_factors, final_scores, base_scores)
+
+    return np.round(final_scores, 1)
+
+
+def empty_query_score_expression(similarity_score: float = 0.0) -> ColumnElement:
+    """
+    SQL expression for calculate_overall_match_score(entity, "", similarity_score).
+
+    With an empty query every present factor has a fixed score (any stage or
+    location contains ""), so listings can be scored and ranked in the
+    database. The result is unrounded; round it like the Python scorer.
+    """
+    base_score = similarity_score * 100
+
+    # (is present, score if present, weight)
+    measured = [
+        (
+            func.coalesce(func.cardinality(Entity.sector_focus), 0) > 0,
+            case((Entity.sector_focus.any(''), 100.0), else_=60.0),
+            FACTOR_WEIGHTS['sector'],
+        ),
+        (
+            func.coalesce(func.cardinality(Entity.stage_focus), 0) > 0,
+            100.0,
+            FACTOR_WEIGHTS['stage'],
+        ),
+        (
+            func.coalesce(Entity.location, '') != '',
+            100.0,
+            FACTOR_WEIGHTS['geography'],
+        ),
+        (
+            or_(
+                func.coalesce(Entity.check_size_min, 0) != 0,
+                func.coalesce(Entity.check_size_max, 0) != 0,
+            ),
+            75.0,
+            FACTOR_WEIGHTS['checkSize'],
+        ),
+    ]
+
+    default_sum = sum(score * FACTOR_WEIGHTS[name] for name, score in DEFAULT_FACTOR_SCORES.items())
+    default_weight = sum(FACTOR_WEIGHTS[name] for name in DEFAULT_FACTOR_SCORES)
+
+    weighted_sum = default_sum + sum(
+        case((present, score * weight), else_=0.0) for present, score, weight in measured
+    )
+    total_weight = default_weight + sum(
+        case((present, weight), else_=0.0) for present, _, weight in measured
+    )
+
+    # Combine similarity (40%) + factors (60%); similarity only without factors
+    return case(
+        (
+            or_(*(present for present, _, _ in measured)),
+            base_score * 0.4 + weighted_sum / total_weight * 0.6,
+        ),
+        else_=base_score,
+    )
+
+
+def top_k_order(scores: np.ndarray, limit: Optional[int] = None) -> np.ndarray:
+    """
+    Indices of the `limit` highest scores, best first; ties keep input order.
+
+    Partitions around the K-th score so only the candidates are sorted
+    (O(N + K log K) instead of sorting all N).
+    """
+    negated = -np.asarray(scores, dtype=float)
+    if limit is None or limit >= len(negated):
+        return np.argsort(negated, kind='stable')
+    if limit <= 0:
+        return np.empty(0, dtype=np.intp)
+
+    kth = np.partition(negated, limit - 1)[limit - 1]
+    # Everything at least as good as the K-th score, including all boundary
+    # ties, in input order; the stable sort then matches a full stable argsort
+    candidates = np.flatnonzero(negated <= kth)
+    order = candidates[np.argsort(negated[candidates], kind='stable')]
+    return order[:limit]
+
+
 def rank_matches(
     entities_with_scores: List[Tuple[Entity, float, List[str]]],
-    query: str = ""
+    query: str = "",
+    limit: Optional[int] = None,
 ) -> List[Dict]:
     """
     Rank and enrich match results with comprehensive scoring.
@@ -314,19 +485,35 @@ def rank_matches(
     Args:
         entities_with_scores: List of (Entity, similarity_score, reasons) tuples
         query: Search query string
+        limit: Maximum number of results to return (all if None)
     
     Returns:
         List of dicts with entity data, scores, and factors
     """
+    if not entities_with_scores:
+        return []
+
+    # Calculate individual factors once per entity, then score all at once
+    factors_list = [
+        calculate_match_factors(entity, query)
+        for entity, _, _ in entities_with_scores
+    ]
+    overall_scores = combine_factor_scores(
+        factors_to_array(factors_list),
+        np.array([similarity for _, similarity, _ in entities_with_scores]),
+    )
+
+    # Rank on the score array and only build result dicts for the rows
+    # that are returned
+    order = top_k_order(overall_scores, limit)
+
     ranked_matches = []
     
-    for entity, similarity_score, reasons in entities_with_scores:
-        # Calculate overall match score
-        overall_score = calculate_overall_match_score(entity, query, similarity_score)
-        
-        # Calculate individual factors
-        match_factors = calculate_match_factors(entity, query)
-        
+    for idx in order:
+        entity, similarity_score, reasons = entities_with_scores[idx]
+        match_factors = factors_list[idx]
+        overall_score = overall_scores[idx]
+
         # Build match data
         match_data = {
             'id': entity.id,
@@ -343,7 +530,7 @@ def rank_matches(
             'check_size_max': entity.check_size_max,
             'investment_thesis': entity.investment_thesis,
             'tags': entity.tags,
-            'score': overall_score,
+            'score': float(overall_score),
             'similarity_score': round(similarity_score, 3),
             'match_factors': match_factors,
             'reasons': reasons,
@@ -352,8 +539,4 @@ def rank_matches(
         
         ranked_matches.append(match_data)
     
-    # Sort by overall score (descending)
-    ranked_matches.sort(key=lambda x: x['score'], reverse=True)
-    
     return ranked_matches
-
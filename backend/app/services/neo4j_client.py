@@ -1,45 +1,115 @@
 """Neo4j graph database client for relationship queries."""
 from __future__ import annotations
 
-from typing import Dict, List, Optional
+import os
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
 
-from neo4j import GraphDatabase, Driver
+from neo4j import Driver, GraphDatabase, Transaction
+from neo4j.exceptions import DriverError, Neo4jError
 
 from app.core.config import settings
 from app.core.logging_config import get_logger
+from app.services.circuit_breaker import CircuitBreaker, CircuitOpenError
 
 logger = get_logger(__name__)
 
+# Connection-level failures (not query errors) trip the breaker, so request
+# paths stop paying a connection timeout per call while Neo4j is down
+graph_breaker = CircuitBreaker("neo4j", fail_max=5, reset_timeout=30.0, failure_types=(DriverError,))
+
+# Errors a read can raise; endpoints degrade to "no graph data" on these
+GRAPH_ERRORS = (Neo4jError, DriverError, CircuitOpenError)
+
+# Relationship types cannot be query parameters, so they are interpolated into
+# Cypher; only these known types are accepted (one cached plan per type)
+RELATIONSHIP_TYPES = frozenset({"CONNECTED_TO", "INVESTED_IN", "WORKS_AT"})
+
+
+def _check_relationship_type(relationship_type: str) -> None:
+    """Reject relationship types outside RELATIONSHIP_TYPES."""
+    if relationship_type not in RELATIONSHIP_TYPES:
+        raise ValueError(
+            f"Unknown relationship type {relationship_type!r}; "
+            f"expected one of {sorted(RELATIONSHIP_TYPES)}"
+        )
+
 
 class Neo4jClient:
     """Client for interacting with Neo4j graph database."""
 
     def __init__(self) -> None:
-        """Initialize Neo4j driver."""
-        self.driver: Optional[Driver] = None
-        self._connect()
+        """Set up a client that connects on first use."""
+        self._driver: Optional[Driver] = None
+        # Process that opened _driver; a forked worker must not reuse the
+        # parent's sockets, so it connects again
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+
+    @property
+    def driver(self) -> Optional[Driver]:
+        """This process's driver, connected on first access (None if unavailable)."""
+        if self._pid != os.getpid():
+            with self._lock:
+                if self._pid != os.getpid():
+                    self._connect()
+                    self._pid = os.getpid()
+        return self._driver
+
+    @driver.setter
+    def driver(self, driver: Optional[Driver]) -> None:
+        self._driver = driver
+        self._pid = os.getpid()
 
     def _connect(self) -> None:
         """Establish connection to Neo4j."""
         try:
             logger.info(f"Connecting to Neo4j | URI: {settings.neo4j_uri}")
-            self.driver = GraphDatabase.driver(
+            self._driver = GraphDatabase.driver(
                 settings.neo4j_uri,
                 auth=(settings.neo4j_user, settings.neo4j_password),
+                max_connection_pool_size=settings.neo4j_max_connection_pool_size,
+                connection_acquisition_timeout=settings.neo4j_connection_acquisition_timeout,
+                max_connection_lifetime=settings.neo4j_max_connection_lifetime,
             )
             # Test connection
-            self.driver.verify_connectivity()
+            self._driver.verify_connectivity()
             logger.info("✓ Neo4j connection established")
         except Exception as e:
             logger.error(f"Failed to connect to Neo4j: {e}", exc_info=True)
-            self.driver = None
+            self._driver = None
+            return
+        self._ensure_schema()
 
     def close(self) -> None:
-        """Close Neo4j driver."""
-        if self.driver:
+        """Close Neo4j driver (without connecting if it was never used)."""
+        if self._driver and self._pid == os.getpid():
             logger.info("Closing Neo4j connection")
-            self.driver.close()
+            self._driver.close()
             logger.debug("Neo4j connection closed")
+        self._driver = None
+        self._pid = None
+
+    def _ensure_schema(self) -> None:
+        """
+        Create the entity_id uniqueness constraint if it is missing.
+
+        The constraint's backing index turns every MERGE/MATCH on
+        Entity.entity_id into an index lookup instead of a label scan. It is
+        created once per database; on a graph that already holds duplicate
+        entity_ids creation fails and is logged, and the duplicates must be
+        removed before it can be added.
+        """
+        try:
+            with self._driver.session(database=settings.neo4j_database) as session:
+                session.run(
+                    "CREATE CONSTRAINT entity_id_unique IF NOT EXISTS "
+                    "FOR (e:Entity) REQUIRE e.entity_id IS UNIQUE"
+                ).consume()
+            logger.debug("Neo4j entity_id constraint ensured")
+        except Neo4jError as e:
+            logger.error(f"Failed to create Neo4j entity_id constraint: {e}")
 
     def create_entity_node(
         self,
@@ -86,6 +156,7 @@ class Neo4jClient:
         strength: float = 1.0,
     ) -> None:
         """Create a relationship between two entities."""
+        _check_relationship_type(relationship_type)
         if not self.driver:
             logger.warning("Neo4j driver not available - skipping relationship creation")
             return
@@ -110,6 +181,183 @@ class Neo4jClient:
         except Exception as e:
             logger.error(f"Failed to create Neo4j relationship | {source_id} -> {target_id} | Error: {str(e)}")
 
+    @contextmanager
+    def batch_transaction(self) -> Iterator[Optional[Transaction]]:
+        """
+        One session and explicit transaction shared by several bulk writes.
+
+        Commits when the block exits normally and rolls back on error. Yields
+        None when the driver is unavailable (the writes then skip themselves).
+        """
+        if not self.driver:
+            yield None
+            return
+
+        with self.driver.session(database=settings.neo4j_database) as session:
+            with session.begin_transaction() as tx:
+                yield tx
+
+    def _run_batches(
+        self,
+        query: str,
+        rows: List[Dict],
+        batch_size: int,
+        description: str,
+        tx: Optional[Transaction],
+        params: Optional[Dict] = None,
+    ) -> None:
+        """Run an UNWIND $rows query per batch, in tx or one session per batch."""
+        for start in range(0, len(rows), batch_size):
+            batch = rows[start:start + batch_size]
+            parameters = {**(params or {}), "rows": batch}
+            if tx is not None:
+                # Errors propagate so the caller's transaction rolls back
+                tx.run(query, parameters)
+                logger.debug(f"{description} | Count: {len(batch)}")
+                continue
+            try:
+                with self.driver.session(database=settings.neo4j_database) as session:
+                    session.run(query, parameters)
+                logger.debug(f"{description} | Count: {len(batch)}")
+            except Exception as e:
+                logger.error(f"Failed: {description} | Count: {len(batch)} | Error: {str(e)}")
+
+    def create_entity_nodes(
+        self,
+        nodes: List[Dict],
+        batch_size: int = 1000,
+        tx: Optional[Transaction] = None,
+    ) -> None:
+        """
+        Create or update many entity nodes, one UNWIND query per batch.
+
+        Each node dict needs entity_id, name, role and company. Pass tx (see
+        batch_transaction) to write inside an existing transaction.
+        """
+        if not self.driver:
+            logger.warning("Neo4j driver not available - skipping node creation")
+            return
+
+        rows = [
+            {
+                "entity_id": node["entity_id"],
+                "name": node["name"],
+                "role": node.get("role") or "unknown",
+                "company": node.get("company") or "",
+            }
+            for node in nodes
+        ]
+
+        self._run_batches(
+            """
+            UNWIND $rows AS row
+            MERGE (e:Entity {entity_id: row.entity_id})
+            SET e.name = row.name,
+                e.role = row.role,
+                e.company = row.company,
+                e.updated_at = datetime()
+            """,
+            rows,
+            batch_size,
+            "Created/updated Neo4j nodes",
+            tx,
+        )
+
+    def create_connections(
+        self,
+        connections: List[Dict],
+        relationship_type: str = "CONNECTED_TO",
+        batch_size: int = 1000,
+        tx: Optional[Transaction] = None,
+    ) -> None:
+        """
+        Create many relationships of one type, one UNWIND query per batch.
+
+        Each connection dict needs source_id and target_id; strength defaults
+        to 1.0. Pass tx (see batch_transaction) to write inside an existing
+        transaction.
+        """
+        _check_relationship_type(relationship_type)
+        if not self.driver:
+            logger.warning("Neo4j driver not available - skipping relationship creation")
+            return
+
+        rows = [
+            {
+                "source_id": conn["source_id"],
+                "target_id": conn["target_id"],
+                "strength": conn.get("strength", 1.0),
+            }
+            for conn in connections
+        ]
+
+        self._run_batches(
+            f"""
+            UNWIND $rows AS row
+            MATCH (a:Entity {{entity_id: row.source_id}})
+            MATCH (b:Entity {{entity_id: row.target_id}})
+            MERGE (a)-[r:{relationship_type}]->(b)
+            SET r.strength = row.strength,
+                r.updated_at = datetime()
+            """,
+            rows,
+            batch_size,
+            f"Created Neo4j relationships ({relationship_type})",
+            tx,
+        )
+
+    def create_connected_entity_nodes(
+        self,
+        owner_id: int,
+        nodes: List[Dict],
+        batch_size: int = 1000,
+        tx: Optional[Transaction] = None,
+    ) -> None:
+        """
+        Create or update entity nodes and connect each to the owner.
+
+        Same node fields as create_entity_nodes. Nodes and their owner
+        CONNECTED_TO edges are written by one UNWIND query per batch, and the
+        owner node is matched once per batch instead of once per edge. Edges
+        are skipped when the owner node does not exist.
+        """
+        if not self.driver:
+            logger.warning("Neo4j driver not available - skipping node creation")
+            return
+
+        rows = [
+            {
+                "entity_id": node["entity_id"],
+                "name": node["name"],
+                "role": node.get("role") or "unknown",
+                "company": node.get("company") or "",
+            }
+            for node in nodes
+        ]
+
+        self._run_batches(
+            """
+            UNWIND $rows AS row
+            MERGE (e:Entity {entity_id: row.entity_id})
+            SET e.name = row.name,
+                e.role = row.role,
+                e.company = row.company,
+                e.updated_at = datetime()
+            WITH collect(e) AS nodes
+            MATCH (owner:Entity {entity_id: $owner_id})
+            UNWIND nodes AS e
+            MERGE (owner)-[r:CONNECTED_TO]->(e)
+            SET r.strength = 1.0,
+                r.updated_at = datetime()
+            """,
+            rows,
+            batch_size,
+            "Created/updated connected Neo4j nodes",
+            tx,
+            {"owner_id": owner_id},
+        )
+
+    @graph_breaker
     def find_intro_path(
         self,
         source_id: int,
@@ -145,6 +393,7 @@ class Neo4jClient:
                 return record["path_nodes"]
             return []
 
+    @graph_breaker
     def get_mutual_connections(
         self,
         entity_id: int,
@@ -173,6 +422,72 @@ class Neo4jClient:
             
             return [dict(record) for record in result]
 
+    @graph_breaker
+    def find_intro_paths(
+        self,
+        source_id: int,
+        target_ids: List[int],
+        max_depth: int = 3,
+    ) -> Dict[int, List[Dict]]:
+        """Find shortest introduction paths to many targets in one query."""
+        if not self.driver or not target_ids:
+            return {}
+
+        with self.driver.session(database=settings.neo4j_database) as session:
+            result = session.run(
+                """
+                UNWIND $target_ids AS target_id
+                MATCH (a:Entity {entity_id: $source_id}), (b:Entity {entity_id: target_id})
+                WHERE a <> b
+                MATCH path = shortestPath((a)-[*1..%d]-(b))
+                RETURN target_id, [node in nodes(path) | {
+                    entity_id: node.entity_id,
+                    name: node.name,
+                    role: node.role,
+                    company: node.company
+                }] as path_nodes
+                """ % max_depth,
+                {
+                    "source_id": source_id,
+                    "target_ids": target_ids,
+                },
+            )
+            
+            return {record["target_id"]: record["path_nodes"] for record in result}
+
+    @graph_breaker
+    def get_mutual_connections_batch(
+        self,
+        entity_id: int,
+        target_ids: List[int],
+    ) -> Dict[int, List[Dict]]:
+        """Find mutual connections (up to 10 each) with many targets in one query."""
+        if not self.driver or not target_ids:
+            return {}
+
+        with self.driver.session(database=settings.neo4j_database) as session:
+            result = session.run(
+                """
+                UNWIND $target_ids AS target_id
+                MATCH (a:Entity {entity_id: $entity_id})-[:CONNECTED_TO]-(mutual)-[:CONNECTED_TO]-(b:Entity {entity_id: target_id})
+                WHERE mutual.entity_id <> $entity_id AND mutual.entity_id <> target_id
+                WITH target_id, collect(DISTINCT {
+                    entity_id: mutual.entity_id,
+                    name: mutual.name,
+                    role: mutual.role,
+                    company: mutual.company
+                }) as mutuals
+                RETURN target_id, mutuals[..10] as mutuals
+                """,
+                {
+                    "entity_id": entity_id,
+                    "target_ids": target_ids,
+                },
+            )
+            
+            return {record["target_id"]: record["mutuals"] for record in result}
+
+    @graph_breaker
     def get_connected_investors(
         self,
         entity_id: int,
@@ -207,6 +522,6 @@ class Neo4jClient:
             session.run("MATCH (n) DETACH DELETE n")
 
 
-# Global client instance
+# Global client instance; connects lazily in each process that uses it
 neo4j_client = Neo4jClient()
 
@@ -3,8 +3,10 @@
 from .email_prompts import (
     CASUAL_EMAIL_PROMPT,
     EMAIL_SYSTEM_PROMPT,
+    EMAIL_TONE_GUIDELINES,
     ENTHUSIASTIC_EMAIL_PROMPT,
     FORMAL_EMAIL_PROMPT,
+    MULTI_TONE_EMAIL_PROMPT,
 )
 from .enrichment_prompts import ENRICHMENT_PROMPT, SYSTEM_PROMPT
 
@@ -15,5 +17,7 @@ __all__ = [
     "CASUAL_EMAIL_PROMPT",
     "ENTHUSIASTIC_EMAIL_PROMPT",
     "EMAIL_SYSTEM_PROMPT",
+    "EMAIL_TONE_GUIDELINES",
+    "MULTI_TONE_EMAIL_PROMPT",
 ]
 
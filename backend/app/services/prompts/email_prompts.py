@@ -127,3 +127,56 @@ Return ONLY a JSON object with this exact structure:
 """
 
 EMAIL_SYSTEM_PROMPT = "You are an expert at writing warm introduction emails in the venture capital ecosystem. You understand founder-investor dynamics and write compelling, personalized introductions that lead to meetings. Always return valid JSON."
+
+# Per-tone guidance for MULTI_TONE_EMAIL_PROMPT, condensed from the prompts above
+EMAIL_TONE_GUIDELINES = {
+    "formal": (
+        "professional and formal: compelling subject line mentioning the mutual connection, "
+        "professional greeting, why the introduction makes sense, brief founder background, "
+        "sector/stage alignment, a specific call-to-action (brief call or meeting), professional closing"
+    ),
+    "casual": (
+        "friendly and conversational: warm, approachable subject line, first-name greeting, "
+        "natural mention of the mutual connection, relatable founder intro, why it's a great fit, "
+        "easy call-to-action (coffee chat, quick call), warm closing"
+    ),
+    "enthusiastic": (
+        "excited and energetic without being over the top: subject line that captures the opportunity, "
+        "enthusiastic mention of the mutual connection, compelling founder story, why this is an "
+        "amazing opportunity for the investor, enthusiastic call-to-action, energetic closing"
+    ),
+}
+
+MULTI_TONE_EMAIL_PROMPT = """You are writing warm introduction emails to connect a founder with an investor, one version per requested tone.
+
+Context:
+- Founder: {founder_name} from {founder_company} ({founder_position})
+- Investor: {investor_name} from {investor_company} ({investor_position})
+- Mutual Connection: {mutual_connection_name} ({mutual_connection_role})
+- Match Score: {match_score}/100
+
+Key Match Reasons:
+{match_reasons}
+
+Investment Fit:
+- Sector: {sector_fit}
+- Stage: {stage_fit}
+- Geography: {geography_fit}
+- Investment Thesis: {investor_thesis}
+
+Founder's Focus:
+- Sector: {founder_sectors}
+- Stage: {founder_stage}
+- Location: {founder_location}
+
+Write one introduction email (150-250 words) for each of these tones:
+{tone_instructions}
+
+Each email mentions the mutual connection, explains why the match makes sense using the match reasons, and ends with a clear call-to-action.
+
+Return ONLY a JSON object with one key per tone ({tone_keys}), each with this exact structure:
+{{
+  "subject": "subject line here",
+  "body": "email body here (with proper line breaks using \\n\\n for paragraphs)"
+}}
+"""
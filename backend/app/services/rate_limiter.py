@@ -0,0 +1,91 @@
+"""Proactive request/token rate limiting for OpenAI API calls."""
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from typing import Any, Optional
+
+from app.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class RateLimiter:
+    """
+    Leaky-bucket limiter for per-minute request and token budgets.
+
+    Capacity refills continuously; callers wait until enough request and
+    token capacity is available instead of running into 429 responses.
+    Safe to share between threads and event loops.
+    """
+
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int) -> None:
+        self.max_requests_per_minute = requests_per_minute
+        self.max_tokens_per_minute = tokens_per_minute
+        self.available_request_capacity = float(requests_per_minute)
+        self.available_token_capacity = float(tokens_per_minute)
+        self.last_update_time = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        """Add the capacity accumulated since the last update (lock held)."""
+        now = time.monotonic()
+        elapsed = now - self.last_update_time
+        self.available_request_capacity = min(
+            self.available_request_capacity + elapsed * self.max_requests_per_minute / 60,
+            self.max_requests_per_minute,
+        )
+        self.available_token_capacity = min(
+            self.available_token_capacity + elapsed * self.max_tokens_per_minute / 60,
+            self.max_tokens_per_minute,
+        )
+        self.last_update_time = now
+
+    def _reserve(self, tokens: int) -> float:
+        """
+        Reserve one request and `tokens` tokens if available.
+
+        Returns 0.0 on success, otherwise the seconds to wait before retrying.
+        """
+        # A single call can never need more than a full minute of tokens
+        tokens = min(tokens, self.max_tokens_per_minute)
+
+        with self._lock:
+            self._refill()
+            if self.available_request_capacity >= 1 and self.available_token_capacity >= tokens:
+                self.available_request_capacity -= 1
+                self.available_token_capacity -= tokens
+                return 0.0
+
+            request_wait = (1 - self.available_request_capacity) * 60 / self.max_requests_per_minute
+            token_wait = (tokens - self.available_token_capacity) * 60 / self.max_tokens_per_minute
+            return max(request_wait, token_wait, 0.001)
+
+    async def acquire(self, tokens: int = 0) -> None:
+        """Wait (without blocking the event loop) until capacity is reserved."""
+        while (wait := self._reserve(tokens)) > 0:
+            logger.debug(f"Rate limit reached | Waiting {wait:.3f}s")
+            await asyncio.sleep(wait)
+
+    def acquire_blocking(self, tokens: int = 0) -> None:
+        """Block the calling thread until capacity is reserved."""
+        while (wait := self._reserve(tokens)) > 0:
+            logger.debug(f"Rate limit reached | Waiting {wait:.3f}s")
+            time.sleep(wait)
+
+    def reconcile(self, estimated_tokens: int, usage: Optional[Any]) -> None:
+        """Correct a pre-call token estimate with the response's usage block."""
+        if usage is None:
+            return
+
+        with self._lock:
+            self.available_token_capacity = min(
+                self.available_token_capacity + estimated_tokens - usage.total_tokens,
+                self.max_tokens_per_minute,
+            )
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count for budgeting (~4 characters per token)."""
+    return len(text) // 4 + 1
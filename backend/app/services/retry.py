@@ -0,0 +1,109 @@
+"""Retry with exponential backoff and jitter for transient OpenAI errors."""
+from __future__ import annotations
+
+import asyncio
+import functools
+import random
+import time
+from typing import Callable, Optional, Tuple, Type
+
+import openai
+
+from app.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Transient failures worth retrying; auth/validation errors are not
+RETRIABLE_ERRORS: Tuple[Type[Exception], ...] = (
+    openai.RateLimitError,
+    openai.APIConnectionError,
+    openai.APITimeoutError,
+    openai.InternalServerError,
+)
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    """Seconds the server asked us to wait (Retry-After headers), if any."""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    try:
+        if "retry-after-ms" in headers:
+            return float(headers["retry-after-ms"]) / 1000
+        if "retry-after" in headers:
+            return float(headers["retry-after"])
+    except ValueError:
+        # HTTP-date values are rare from OpenAI; fall back to backoff
+        return None
+    return None
+
+
+def _backoff_delay(attempt: int, base: float, cap: float, error: Optional[Exception] = None) -> float:
+    """
+    Exponential delay for a 0-based attempt, plus up to 1s of jitter.
+
+    A server-provided Retry-After (capped at cap) wins over the exponential
+    delay when it is longer.
+    """
+    delay = min(cap, base * 2 ** attempt)
+    retry_after = _retry_after(error) if error is not None else None
+    if retry_after is not None:
+        delay = max(delay, min(cap, retry_after))
+    return delay + random.uniform(0, 1)
+
+
+def _log_retry(func: Callable, attempt: int, max_attempts: int, error: Exception, start: float, delay: float) -> None:
+    logger.warning(
+        f"Retrying {func.__name__} | Attempt: {attempt + 1}/{max_attempts} | "
+        f"Error type: {type(error).__name__} | Elapsed: {time.monotonic() - start:.2f}s | "
+        f"Next delay: {delay:.2f}s"
+    )
+
+
+def retry_with_backoff(
+    max_attempts: int = 5,
+    base: float = 1.0,
+    cap: float = 30.0,
+    retry_on: Tuple[Type[Exception], ...] = RETRIABLE_ERRORS,
+) -> Callable:
+    """
+    Retry a sync or async function on transient errors.
+
+    Sleeps min(cap, base * 2**attempt) + jitter between attempts (longer if
+    the server sent Retry-After) and re-raises the last error once
+    max_attempts is reached.
+    """
+    def decorator(func: Callable) -> Callable:
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                start = time.monotonic()
+                for attempt in range(max_attempts):
+                    try:
+                        return await func(*args, **kwargs)
+                    except retry_on as e:
+                        if attempt == max_attempts - 1:
+                            raise
+                        delay = _backoff_delay(attempt, base, cap, e)
+                        _log_retry(func, attempt, max_attempts, e, start, delay)
+                        await asyncio.sleep(delay)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.monotonic()
+            for attempt in range(max_attempts):
+                try:
+                    return func(*args, **kwargs)
+                except retry_on as e:
+                    if attempt == max_attempts - 1:
+                        raise
+                    delay = _backoff_delay(attempt, base, cap, e)
+                    _log_retry(func, attempt, max_attempts, e, start, delay)
+                    time.sleep(delay)
+
+        return wrapper
+
+    return decorator
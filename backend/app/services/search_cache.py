@@ -0,0 +1,40 @@
+"""TTL cache for /search responses, invalidated whenever entity data changes."""
+from __future__ import annotations
+
+import itertools
+import threading
+from typing import Optional, Tuple
+
+from app.core.config import settings
+from app.core.logging_config import get_logger
+from app.services.enrichment_cache import ResultCache
+
+logger = get_logger(__name__)
+
+search_cache = ResultCache(maxsize=settings.search_cache_size, ttl=settings.search_cache_ttl)
+
+# Part of every key: bumping it orphans all earlier entries, which then age
+# out through the TTL/LRU instead of being cleared under the lock
+_generations = itertools.count()
+_generation = next(_generations)
+_generation_lock = threading.Lock()
+
+
+def search_cache_key(
+    query: str,
+    role: Optional[str],
+    sector: Optional[str],
+    stage: Optional[str],
+    location: Optional[str],
+    limit: int,
+) -> Tuple:
+    """Cache key for a /search request under the current data generation."""
+    return (_generation, query, role, sector, stage, location, limit)
+
+
+def invalidate_search_cache() -> None:
+    """Stop serving cached results computed before a data change."""
+    global _generation
+    with _generation_lock:
+        _generation = next(_generations)
+    logger.info(f"Search cache invalidated | Generation: {_generation}")
@@ -1,18 +1,50 @@
 """Vector similarity search using pgvector."""
 from __future__ import annotations
 
+import re
 from typing import Dict, List, Optional, Tuple
 
-from sqlalchemy import func, text
-from sqlalchemy.orm import Session
+from pgvector.sqlalchemy import HALFVEC
+from sqlalchemy import cast, func, select
+from sqlalchemy.orm import Session, defer
+from sqlalchemy.orm.attributes import InstrumentedAttribute
+from sqlalchemy.sql.elements import ColumnElement
 
+from app.core.config import settings
 from app.core.logging_config import get_logger
-from app.services.enrichment import generate_embedding
+from app.services.enrichment import EMBEDDING_DIMENSIONS, generate_embedding
 from app.services.match_scorer import rank_matches
 from app.core.models import Entity
 
 logger = get_logger(__name__)
 
+# Candidates fetched from the half-precision index per requested result
+CANDIDATE_FACTOR = 4
+
+
+def focus_filter(column: InstrumentedAttribute, value: str) -> ColumnElement:
+    """
+    Filter for rows whose sector/stage array contains value.
+
+    Stored values are lowercase (see enrichment), so this is an exact,
+    case-insensitive tag match that the column's GIN index can serve.
+    """
+    return column.contains([value.strip().lower()])
+
+
+def _mentions_query_token(query: str):
+    """
+    Predicate: does a text contain any whitespace-separated token of query?
+
+    The tokens are compiled into one alternation, so each field is checked in
+    a single regex pass instead of one substring scan per token.
+    """
+    tokens = set(query.lower().split())
+    if not tokens:
+        return lambda text: False
+    pattern = re.compile("|".join(re.escape(token) for token in tokens))
+    return lambda text: pattern.search(text.lower()) is not None
+
 
 def search_similar_entities(
     query: str,
@@ -30,41 +62,57 @@ def search_similar_entities(
     """
     logger.info(f"Vector search | Query: '{query}' | Role: {role_filter} | Limit: {limit}")
     
-    # Generate embedding for query
-    query_embedding = generate_embedding(query)
+    # Generate embedding for query; generate_embedding serves repeats from
+    # the embedding cache, and normalizing lets "Fintech  Seed" reuse "fintech seed"
+    query_embedding = generate_embedding(" ".join(query.split()).casefold())
     if not query_embedding:
         logger.warning("Failed to generate query embedding - returning empty results")
         return []
 
-    # Build base query
-    query_obj = db.query(
-        Entity,
-        Entity.embedding.cosine_distance(query_embedding).label("distance")
-    ).filter(
-        Entity.embedding.isnot(None)
-    )
+    filters = [Entity.embedding.isnot(None)]
 
-    # Apply filters
     if role_filter and role_filter.lower() != "all":
-        query_obj = query_obj.filter(Entity.role == role_filter.lower())
+        filters.append(Entity.role == role_filter.lower())
 
     if sector_filter and sector_filter.lower() != "all":
-        query_obj = query_obj.filter(
-            func.array_to_string(Entity.sector_focus, ',').ilike(f'%{sector_filter}%')
-        )
+        filters.append(focus_filter(Entity.sector_focus, sector_filter))
 
     if stage_filter and stage_filter.lower() != "all":
-        query_obj = query_obj.filter(
-            func.array_to_string(Entity.stage_focus, ',').ilike(f'%{stage_filter}%')
-        )
+        filters.append(focus_filter(Entity.stage_focus, stage_filter))
 
     if location_filter and location_filter.lower() != "all":
-        query_obj = query_obj.filter(
-            Entity.location.ilike(f'%{location_filter}%')
-        )
+        filters.append(Entity.location.ilike(f'%{location_filter}%'))
+
+    # Stage 1: nearest candidates from the half-precision HNSW index. An
+    # index scan returns at most hnsw.ef_search rows, so raise it for this
+    # transaction to cover the candidate count. The filters are applied to
+    # the index scan's output, so with filters present an iterative scan keeps
+    # going until enough matching rows are found; relaxed order is fine since
+    # stage 2 re-ranks exactly.
+    candidate_count = limit * CANDIDATE_FACTOR
+    ef_search = max(settings.hnsw_ef_search, candidate_count)
+    db.execute(select(func.set_config("hnsw.ef_search", str(ef_search), True)))
+    if len(filters) > 1 and settings.hnsw_iterative_scan != "off":
+        db.execute(select(func.set_config("hnsw.iterative_scan", settings.hnsw_iterative_scan, True)))
+    half_distance = cast(Entity.embedding, HALFVEC(EMBEDDING_DIMENSIONS)).cosine_distance(query_embedding)
+    candidate_ids = (
+        select(Entity.id)
+        .where(*filters)
+        .order_by(half_distance)
+        .limit(candidate_count)
+    )
 
-    # Order by similarity and limit
-    results = query_obj.order_by(text("distance ASC")).limit(limit).all()
+    # Stage 2: re-rank the candidates on the full-precision vectors; the
+    # vectors themselves are not needed by callers and stay in the database
+    distance = Entity.embedding.cosine_distance(query_embedding).label("distance")
+    results = (
+        db.query(Entity, distance)
+        .options(defer(Entity.embedding), defer(Entity.raw_data))
+        .filter(Entity.id.in_(candidate_ids))
+        .order_by(distance)
+        .limit(limit)
+        .all()
+    )
     
     logger.info(f"Vector search complete | Query: '{query}' | Results: {len(results)}")
     return [(entity, distance) for entity, distance in results]
@@ -83,14 +131,10 @@ def find_investors_by_criteria(
     query = db.query(Entity).filter(Entity.role == "investor")
 
     if sector:
-        query = query.filter(
-            func.array_to_string(Entity.sector_focus, ',').ilike(f'%{sector}%')
-        )
+        query = query.filter(focus_filter(Entity.sector_focus, sector))
 
     if stage:
-        query = query.filter(
-            func.array_to_string(Entity.stage_focus, ',').ilike(f'%{stage}%')
-        )
+        query = query.filter(focus_filter(Entity.stage_focus, stage))
 
     if location:
         query = query.filter(Entity.location.ilike(f'%{location}%'))
@@ -139,8 +183,7 @@ def hybrid_search(
 
     # Build initial results with reasons
     initial_results = []
-    query_lower = query.lower()
-    query_tokens = set(query_lower.split())
+    mentions_query = _mentions_query_token(query)
 
     for entity, distance in vector_results:
         similarity_score = 1.0 - distance  # Convert distance to similarity
@@ -149,16 +192,16 @@ def hybrid_search(
         # Identify match reasons
         if entity.sector_focus:
             for sector in entity.sector_focus:
-                if any(token in sector.lower() for token in query_tokens):
+                if mentions_query(sector):
                     reasons.append(f"Sector focus: {sector}")
 
         if entity.stage_focus:
             for stage in entity.stage_focus:
-                if any(token in stage.lower() for token in query_tokens):
+                if mentions_query(stage):
                     reasons.append(f"Stage: {stage}")
 
         if entity.location:
-            if any(token in entity.location.lower() for token in query_tokens):
+            if mentions_query(entity.location):
                 reasons.append(f"Location: {entity.location}")
 
         # Add investment thesis to reasons if available
@@ -172,8 +215,8 @@ def hybrid_search(
         initial_results.append((entity, similarity_score, reasons[:4]))
 
     # Use match scorer to calculate comprehensive scores and rank
-    ranked_results = rank_matches(initial_results, query)
+    ranked_results = rank_matches(initial_results, query, limit=limit)
     
-    logger.info(f"Hybrid search complete | Query: '{query}' | Final results: {len(ranked_results[:limit])}")
-    return ranked_results[:limit]
+    logger.info(f"Hybrid search complete | Query: '{query}' | Final results: {len(ranked_results)}")
+    return ranked_results
 
@@ -4,16 +4,33 @@ Uvicorn server startup script with optimized settings for large file uploads.
 This script configures Uvicorn with appropriate settings to handle large CSV file uploads
 up to 2GB in size.
 """
+import importlib.util
+
 import uvicorn
 from app.core.config import settings
 
+# uvicorn[standard] installs the C event loop and HTTP parser; uvloop is not
+# available on Windows, where uvicorn falls back to asyncio and h11
+HAS_UVLOOP = importlib.util.find_spec("uvloop") is not None
+HAS_HTTPTOOLS = importlib.util.find_spec("httptools") is not None
+
 if __name__ == "__main__":
+    if not (HAS_UVLOOP and HAS_HTTPTOOLS):
+        print(
+            "Warning: uvloop/httptools not installed; uploads will be slower. "
+            "Install them with: pip install uvloop httptools"
+        )
+
     # Run with increased limits for large file uploads
     uvicorn.run(
         "app.main:app",
         host=settings.api_host,
         port=settings.api_port,
-        reload=True,
+        # Auto-reload is a development convenience and cannot run multiple workers
+        reload=settings.api_workers == 1,
+        workers=settings.api_workers,
+        loop="uvloop" if HAS_UVLOOP else "asyncio",
+        http="httptools" if HAS_HTTPTOOLS else "h11",
         # Increase timeout and limits for large file uploads
         timeout_keep_alive=300,  # 5 minutes keep-alive
         limit_concurrency=1000,
@@ -23,4 +40,3 @@ if __name__ == "__main__":
         # We set reasonable connection limits here
         backlog=2048,
     )
-
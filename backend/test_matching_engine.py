@@ -4,20 +4,23 @@ Simple test script for the matching engine.
 Run this to verify the scoring logic works correctly.
 """
 
+from dataclasses import dataclass, field
+from typing import List, Optional
+
 from app.services.match_scorer import (
     calculate_match_factors,
     calculate_overall_match_score
 )
 
-# Mock Entity class for testing
+# Mock Entity class for testing; slotted like an ORM instance's attribute
+# access, so timings taken against it carry over
+@dataclass(slots=True)
 class MockEntity:
-    def __init__(self, sector_focus=None, stage_focus=None, location=None,
-                 check_size_min=None, check_size_max=None):
-        self.sector_focus = sector_focus or []
-        self.stage_focus = stage_focus or []
-        self.location = location
-        self.check_size_min = check_size_min
-        self.check_size_max = check_size_max
+    sector_focus: List[str] = field(default_factory=list)
+    stage_focus: List[str] = field(default_factory=list)
+    location: Optional[str] = None
+    check_size_min: Optional[int] = None
+    check_size_max: Optional[int] = None
 
 def test_sector_matching():
     """Test sector matching logic."""
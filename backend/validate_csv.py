@@ -7,17 +7,25 @@ def validate_csv(file_path: str):
     print("🔍 Validating CSV file...\n")
     
     try:
-        # Try different encodings
+        # Try different encodings. Only a few rows are parsed for the preview
+        # and the row count streams one column in chunks, so memory stays
+        # bounded even for multi-GB exports.
         df = None
+        total_rows = 0
         encoding_used = None
         
         for encoding in ['utf-8', 'utf-8-sig', 'latin-1', 'cp1252']:
             try:
-                df = pd.read_csv(file_path, encoding=encoding)
+                df = pd.read_csv(file_path, encoding=encoding, nrows=5)
+                total_rows = sum(
+                    len(chunk)
+                    for chunk in pd.read_csv(file_path, encoding=encoding, usecols=[0], chunksize=100_000)
+                )
                 encoding_used = encoding
                 print(f"✓ Successfully read with encoding: {encoding}\n")
                 break
             except:
+                df = None
                 continue
         
         if df is None:
@@ -26,7 +34,7 @@ def validate_csv(file_path: str):
         
         # Show basic info
         print(f"📊 CSV Info:")
-        print(f"   - Total rows: {len(df)}")
+        print(f"   - Total rows: {total_rows}")
         print(f"   - Total columns: {len(df.columns)}")
         print(f"   - Encoding: {encoding_used}\n")
         